@@ -0,0 +1,120 @@
+// Incremental cache for rendered pages, shared by every tenant. Next's
+// default in-memory cache has one global budget, so a few hundred tenants
+// evict each other at random. This one is an LRU bounded in bytes overall
+// and per tenant. A tenant over its own budget loses its own oldest pages.
+// Over the total budget, the least recently used pages of any tenant go, so
+// tenants that stop getting traffic age out first. One tenant can therefore
+// push out others' idle pages, but never hold more than its budget.
+const MAX_BYTES = Number(process.env.TENANT_CACHE_MAX_BYTES) || 64 * 1024 * 1024;
+const MAX_TENANT_BYTES = Number(process.env.TENANT_CACHE_MAX_TENANT_BYTES) || 4 * 1024 * 1024;
+const TENANT_KEY = /^\/t\/([^/]+)/;
+const SHARED = "(shared)";
+
+function tenantOf(key) {
+  return TENANT_KEY.exec(key)?.[1] ?? SHARED;
+}
+
+function sizeOf(value) {
+  if (!value) return 0;
+  let size = 0;
+  for (const field of ["html", "rscData", "body", "pageData", "postponed"]) {
+    const part = value[field];
+    if (part == null) continue;
+    if (typeof part === "string") size += Buffer.byteLength(part);
+    else if (part.byteLength !== undefined) size += part.byteLength;
+    else size += Buffer.byteLength(JSON.stringify(part));
+  }
+  if (value.segmentData instanceof Map) {
+    for (const segment of value.segmentData.values()) size += segment.byteLength;
+  }
+  return size || Buffer.byteLength(JSON.stringify(value));
+}
+
+function tagsOf(ctx, value) {
+  const tags = new Set(ctx?.tags ?? []);
+  const header = value?.headers?.["x-next-cache-tags"];
+  if (typeof header === "string") for (const tag of header.split(",")) tags.add(tag);
+  return [...tags];
+}
+
+const globalForCache = globalThis;
+globalForCache.tenantPageCache ??= {
+  // Map iteration order doubles as recency order: oldest first.
+  entries: new Map(),
+  tenantBytes: new Map(),
+  totalBytes: 0,
+  revalidatedTags: new Map(),
+};
+const state = globalForCache.tenantPageCache;
+
+function remove(key) {
+  const entry = state.entries.get(key);
+  if (!entry) return;
+  state.entries.delete(key);
+  state.totalBytes -= entry.size;
+  const remaining = (state.tenantBytes.get(entry.tenant) ?? 0) - entry.size;
+  if (remaining > 0) state.tenantBytes.set(entry.tenant, remaining);
+  else state.tenantBytes.delete(entry.tenant);
+}
+
+function evict(tenant) {
+  if ((state.tenantBytes.get(tenant) ?? 0) > MAX_TENANT_BYTES) {
+    for (const [key, entry] of state.entries) {
+      if (entry.tenant !== tenant) continue;
+      remove(key);
+      if ((state.tenantBytes.get(tenant) ?? 0) <= MAX_TENANT_BYTES) break;
+    }
+  }
+  for (const key of state.entries.keys()) {
+    if (state.totalBytes <= MAX_BYTES) break;
+    remove(key);
+  }
+}
+
+export default class TenantCacheHandler {
+  constructor(options) {
+    this.options = options;
+  }
+
+  async get(key, ctx) {
+    const entry = state.entries.get(key);
+    if (!entry) return null;
+    const softTags = ctx?.softTags ?? [];
+    for (const tag of [...entry.tags, ...softTags]) {
+      if ((state.revalidatedTags.get(tag) ?? 0) >= entry.lastModified) {
+        remove(key);
+        return null;
+      }
+    }
+    // Touch: move to the most-recently-used end.
+    state.entries.delete(key);
+    state.entries.set(key, entry);
+    return { value: entry.value, lastModified: entry.lastModified };
+  }
+
+  async set(key, value, ctx) {
+    remove(key);
+    if (!value) return;
+    const size = sizeOf(value);
+    const tenant = tenantOf(key);
+    // A single page larger than its tenant's budget would only evict everything else.
+    if (size > MAX_TENANT_BYTES) return;
+    state.entries.set(key, {
+      value,
+      size,
+      tenant,
+      tags: tagsOf(ctx, value),
+      lastModified: Date.now(),
+    });
+    state.totalBytes += size;
+    state.tenantBytes.set(tenant, (state.tenantBytes.get(tenant) ?? 0) + size);
+    evict(tenant);
+  }
+
+  async revalidateTag(tags) {
+    const now = Date.now();
+    for (const tag of [tags].flat()) state.revalidatedTags.set(tag, now);
+  }
+
+  resetRequestCache() {}
+}
@@ -1,7 +1,22 @@
+import path from "node:path";
+
 import type { NextConfig } from "next";
 
+import { BundleReportPlugin } from "./scripts/bundle-report.mjs";
+
+const analyze = process.env.ANALYZE === "true";
+
 const nextConfig: NextConfig = {
-  /* config options here */
+  // Rendered tenant pages go through a per-tenant LRU instead of Next's
+  // single in-memory cache; see cache-handler.mjs.
+  cacheHandler: path.join(process.cwd(), "cache-handler.mjs"),
+  cacheMaxMemorySize: 0,
+  webpack: (config, { isServer, dev }) => {
+    if (analyze && !isServer && !dev) {
+      config.plugins.push(new BundleReportPlugin());
+    }
+    return config;
+  },
 };
 
 export default nextConfig;
@@ -0,0 +1,304 @@
+// Webpack plugin that breaks the first-load JS of a route down per component
+// and per dependency. Enabled from next.config.ts when ANALYZE=true.
+import { execSync } from "node:child_process";
+import fs from "node:fs";
+import { createRequire } from "node:module";
+import path from "node:path";
+import zlib from "node:zlib";
+
+const ROOT = process.cwd();
+const REPORT_DIR = path.join(ROOT, ".next", "analyze");
+const HISTORY_FILE = path.join(ROOT, "reports", "bundle-history.jsonl");
+const require = createRequire(import.meta.url);
+
+// Entrypoints that make up the first load of `/`.
+const FIRST_LOAD_ENTRIES = ["webpack", "main-app", "app/layout", "app/page"];
+
+// Components rendered in the header and hero. Everything else is below the
+// fold and is a candidate for deferral when it is large enough to matter.
+const ABOVE_THE_FOLD = [
+  "src/components/sections/header.tsx",
+  "src/components/sections/scroll-button.tsx",
+  "src/app/layout.tsx",
+  "src/components/ui/button.tsx",
+  "src/components/ui/badge.tsx",
+  "src/lib/utils.ts",
+];
+// Import names, as written in the components.
+const ABOVE_THE_FOLD_ICONS = [
+  "Mail",
+  "Github",
+  "Linkedin",
+  "FileText",
+  "Menu",
+  "X",
+  "ArrowRightCircle",
+];
+const DEFER_THRESHOLD_GZIP = 1024;
+
+function packageName(resource) {
+  const idx = resource.lastIndexOf(`node_modules${path.sep}`);
+  if (idx === -1) return null;
+  const parts = resource.slice(idx + 13).split(path.sep);
+  return parts[0].startsWith("@") ? `${parts[0]}/${parts[1]}` : parts[0];
+}
+
+function sourceComponent(resource) {
+  if (!resource || resource.includes(`node_modules${path.sep}`)) return null;
+  const rel = path.relative(ROOT, resource);
+  return rel.startsWith("src") ? rel.split(path.sep).join("/") : null;
+}
+
+function lucideIcon(resource) {
+  const match = /lucide-react[\\/]dist[\\/]esm[\\/]icons[\\/]([\w-]+)\.js$/.exec(resource);
+  return match ? match[1] : null;
+}
+
+// lucide-react exports each icon under several names, and the module file is
+// named after the canonical one (ArrowRightCircle is icons/circle-arrow-right.js).
+// Resolve import names through the package index instead of kebab-casing them.
+function lucideIconFiles(names) {
+  let index;
+  try {
+    const main = require.resolve("lucide-react");
+    index = fs.readFileSync(path.join(path.dirname(main), "..", "esm", "lucide-react.js"), "utf8");
+  } catch {
+    return new Set();
+  }
+  const wanted = new Set(names);
+  const files = new Set();
+  for (const [, exported, file] of index.matchAll(/export\s*\{([^}]*)\}\s*from\s*['"]\.\/icons\/([\w-]+)\.js['"]/g)) {
+    for (const [, name] of exported.matchAll(/default as (\w+)/g)) {
+      if (wanted.has(name)) files.add(file);
+    }
+  }
+  return files;
+}
+
+function gzipSize(module) {
+  const source = module.originalSource?.();
+  if (!source) return 0;
+  return zlib.gzipSync(source.buffer(), { level: 9 }).length;
+}
+
+// Concatenated modules hide their members; report each member separately.
+function leafModules(module) {
+  return module.modules ? [...module.modules] : [module];
+}
+
+// Attributes a module to the first project source file that pulled it in.
+function owningComponent(moduleGraph, module) {
+  let current = module;
+  const seen = new Set();
+  while (current && !seen.has(current)) {
+    seen.add(current);
+    const owner = sourceComponent(current.resource);
+    if (owner) return owner;
+    current = moduleGraph.getIssuer(current);
+  }
+  return "(runtime)";
+}
+
+function hasClientDirective(resource) {
+  try {
+    const head = fs.readFileSync(resource, "utf8").slice(0, 200);
+    return /^\s*(\/\/.*\n\s*)*["']use client["']/.test(head);
+  } catch {
+    return true;
+  }
+}
+
+function add(map, key, raw, gzip) {
+  const entry = map.get(key) ?? { raw: 0, gzip: 0, modules: 0 };
+  entry.raw += raw;
+  entry.gzip += gzip;
+  entry.modules += 1;
+  map.set(key, entry);
+}
+
+function sorted(map) {
+  return Object.fromEntries([...map].sort((a, b) => b[1].gzip - a[1].gzip));
+}
+
+function gitCommit() {
+  try {
+    return execSync("git rev-parse --short HEAD", { stdio: ["ignore", "pipe", "ignore"] })
+      .toString()
+      .trim();
+  } catch {
+    return null;
+  }
+}
+
+function readLastHistoryEntry() {
+  try {
+    const lines = fs.readFileSync(HISTORY_FILE, "utf8").trim().split("\n");
+    return JSON.parse(lines[lines.length - 1]);
+  } catch {
+    return null;
+  }
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} kB`;
+}
+
+export class BundleReportPlugin {
+  constructor({ route = "/", entries = FIRST_LOAD_ENTRIES } = {}) {
+    this.route = route;
+    this.entries = entries;
+  }
+
+  apply(compiler) {
+    compiler.hooks.afterEmit.tap("BundleReportPlugin", (compilation) => {
+      const report = this.collect(compilation);
+      fs.mkdirSync(REPORT_DIR, { recursive: true });
+      fs.writeFileSync(
+        path.join(REPORT_DIR, "bundle-report.json"),
+        JSON.stringify(report, null, 2),
+      );
+      this.appendHistory(report);
+    });
+  }
+
+  collect(compilation) {
+    const { chunkGraph, moduleGraph } = compilation;
+    const chunks = new Set();
+    for (const name of this.entries) {
+      const entrypoint = compilation.entrypoints.get(name);
+      if (!entrypoint) continue;
+      for (const chunk of entrypoint.chunks) chunks.add(chunk);
+    }
+
+    const byChunk = {};
+    const byPackage = new Map();
+    const byComponent = new Map();
+    const byIcon = new Map();
+    const modules = new Map();
+    let totalRaw = 0;
+
+    for (const chunk of chunks) {
+      let chunkRaw = 0;
+      for (const file of chunk.files) {
+        if (!file.endsWith(".js")) continue;
+        const asset = compilation.getAsset(file);
+        if (!asset) continue;
+        const buffer = asset.source.buffer();
+        byChunk[file] = {
+          minified: buffer.length,
+          gzip: zlib.gzipSync(buffer, { level: 9 }).length,
+        };
+      }
+      for (const outer of chunkGraph.getChunkModulesIterable(chunk)) {
+        for (const module of leafModules(outer)) {
+          if (!module.resource || modules.has(module.resource)) continue;
+          const raw = module.size();
+          const gzip = gzipSize(module);
+          chunkRaw += raw;
+          modules.set(module.resource, {
+            raw,
+            gzip,
+            package: packageName(module.resource),
+            component: owningComponent(moduleGraph, module),
+            icon: lucideIcon(module.resource),
+          });
+        }
+      }
+      totalRaw += chunkRaw;
+    }
+
+    for (const [resource, info] of modules) {
+      add(byPackage, info.package ?? "(project)", info.raw, info.gzip);
+      add(byComponent, info.component, info.raw, info.gzip);
+      if (info.icon) add(byIcon, info.icon, info.raw, info.gzip);
+      info.resource = path.relative(ROOT, resource).split(path.sep).join("/");
+    }
+
+    const totals = { raw: totalRaw, minified: 0, gzip: 0 };
+    for (const chunk of Object.values(byChunk)) {
+      totals.minified += chunk.minified;
+      totals.gzip += chunk.gzip;
+    }
+
+    return {
+      route: this.route,
+      generatedAt: new Date().toISOString(),
+      commit: gitCommit(),
+      totals,
+      byChunk,
+      byPackage: sorted(byPackage),
+      byComponent: sorted(byComponent),
+      byIcon: sorted(byIcon),
+      flags: this.flag(byComponent, byIcon),
+      modules: [...modules.values()].sort((a, b) => b.gzip - a.gzip),
+    };
+  }
+
+  flag(byComponent, byIcon) {
+    const flags = [];
+    const aboveTheFoldIcons = lucideIconFiles(ABOVE_THE_FOLD_ICONS);
+    for (const [component, cost] of byComponent) {
+      if (!component.startsWith("src/")) continue;
+      const resource = path.join(ROOT, component);
+      if (component.startsWith("src/components/") && !hasClientDirective(resource)) {
+        flags.push({
+          target: component,
+          kind: "server",
+          gzip: cost.gzip,
+          reason: "no \"use client\" directive; only in the client bundle because a client component imports it",
+        });
+      }
+      if (!ABOVE_THE_FOLD.includes(component) && cost.gzip >= DEFER_THRESHOLD_GZIP) {
+        flags.push({
+          target: component,
+          kind: "defer",
+          gzip: cost.gzip,
+          reason: "not rendered in the header or hero; can be loaded with next/dynamic",
+        });
+      }
+    }
+    for (const [icon, cost] of byIcon) {
+      if (!aboveTheFoldIcons.has(icon)) {
+        flags.push({
+          target: `lucide-react/${icon}`,
+          kind: "defer",
+          gzip: cost.gzip,
+          reason: "icon only used below the fold",
+        });
+      }
+    }
+    return flags.sort((a, b) => b.gzip - a.gzip);
+  }
+
+  appendHistory(report) {
+    const previous = readLastHistoryEntry();
+    const entry = {
+      generatedAt: report.generatedAt,
+      commit: report.commit,
+      route: report.route,
+      totals: report.totals,
+      byPackage: Object.fromEntries(
+        Object.entries(report.byPackage).map(([name, cost]) => [name, cost.gzip]),
+      ),
+      byComponent: Object.fromEntries(
+        Object.entries(report.byComponent).map(([name, cost]) => [name, cost.gzip]),
+      ),
+    };
+    fs.mkdirSync(path.dirname(HISTORY_FILE), { recursive: true });
+    fs.appendFileSync(HISTORY_FILE, `${JSON.stringify(entry)}\n`);
+
+    const delta = previous ? report.totals.gzip - previous.totals.gzip : 0;
+    console.log(
+      `\nFirst-load JS for ${report.route}: ${kb(report.totals.minified)} minified, ` +
+        `${kb(report.totals.gzip)} gzip` +
+        (previous ? ` (${delta >= 0 ? "+" : ""}${kb(delta)} since ${previous.commit ?? "last run"})` : ""),
+    );
+    for (const [name, cost] of Object.entries(report.byComponent).slice(0, 10)) {
+      console.log(`  ${name.padEnd(40)} ${kb(cost.gzip)}`);
+    }
+    for (const flag of report.flags) {
+      console.log(`  [${flag.kind}] ${flag.target} (${kb(flag.gzip)}): ${flag.reason}`);
+    }
+    console.log(`Full report: ${path.relative(ROOT, path.join(REPORT_DIR, "bundle-report.json"))}\n`);
+  }
+}
@@ -0,0 +1,137 @@
+// Post-build step: computes the CSS needed by the header and hero of each
+// prerendered page, inlines it, and turns the full stylesheet into a
+// non-blocking load. Writes a size report to .next/analyze/critical-css.json.
+import fs from "node:fs";
+import path from "node:path";
+import zlib from "node:zlib";
+
+import Beasties from "beasties";
+
+const ROOT = process.cwd();
+const APP_DIR = path.join(ROOT, ".next", "server", "app");
+const REPORT = path.join(ROOT, ".next", "analyze", "critical-css.json");
+// React hoists stylesheets as <link rel="stylesheet" data-precedence>. Their
+// files are under static/css/ with webpack and static/chunks/ with Turbopack.
+const LINK = /<link\b[^>]*>/g;
+const STYLESHEET_HREF = /\bhref="(\/_next\/static\/[^"?]+\.css)(?:\?[^"]*)?"/;
+const MARKER = "data-critical-css";
+
+// Above-the-fold regions: the sticky header and the hero section.
+const CRITICAL_REGIONS = [
+  { tag: "header", open: /<header[\s>]/ },
+  { tag: "section", open: /<section[^>]*\bid="hero"/ },
+];
+
+function* walk(dir) {
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) yield* walk(full);
+    else if (entry.name.endsWith(".html")) yield full;
+  }
+}
+
+// Returns the element starting at `start`, including its matching close tag.
+function outerHtml(html, start, tag) {
+  const pattern = new RegExp(`<${tag}[\\s>]|</${tag}>`, "g");
+  pattern.lastIndex = start;
+  let depth = 0;
+  let match;
+  while ((match = pattern.exec(html))) {
+    depth += match[0].startsWith("</") ? -1 : 1;
+    if (depth === 0) return html.slice(start, match.index + match[0].length);
+  }
+  return "";
+}
+
+function criticalFragment(html) {
+  // data-render="lite" is set in the browser before first paint; setting it
+  // here keeps the flat-effect overrides for the header and hero in the
+  // inlined CSS. Rules that don't depend on it still match.
+  const htmlTag = (/<html[^>]*>/.exec(html)?.[0] ?? "<html>").replace("<html", '<html data-render="lite"');
+  const bodyTag = /<body[^>]*>/.exec(html)?.[0] ?? "<body>";
+  const regions = CRITICAL_REGIONS.map(({ tag, open }) => {
+    const start = html.search(open);
+    return start === -1 ? "" : outerHtml(html, start, tag);
+  });
+  return { htmlTag, bodyTag, markup: regions.join("") };
+}
+
+// Rules that don't match elements but that the matched rules depend on.
+function globalRules(css) {
+  return (css.match(/@(font-face|property)\s*[^{]*\{[^}]*\}/g) ?? []).join("");
+}
+
+function stylesheetLinks(html) {
+  const links = [];
+  for (const [tag] of html.matchAll(LINK)) {
+    const href = STYLESHEET_HREF.exec(tag)?.[1];
+    if (href && /\brel="stylesheet"/.test(tag) && /\bdata-precedence=/.test(tag)) links.push({ tag, href });
+  }
+  return links;
+}
+
+function gzip(text) {
+  return zlib.gzipSync(text, { level: 9 }).length;
+}
+
+const beasties = new Beasties({
+  path: path.join(ROOT, ".next"),
+  reduceInlineStyles: true,
+  pruneSource: false,
+  fonts: false,
+  keyframes: "critical",
+  logLevel: "warn",
+});
+
+const report = [];
+if (!fs.existsSync(APP_DIR)) {
+  console.error("critical-css: run `next build` first");
+  process.exit(1);
+}
+
+for (const file of walk(APP_DIR)) {
+  let html = fs.readFileSync(file, "utf8");
+  if (html.includes(MARKER)) continue;
+  const links = stylesheetLinks(html);
+  if (links.length === 0) continue;
+
+  const css = links
+    .map(({ href }) => fs.readFileSync(path.join(ROOT, ".next", href.replace(/^\/_next\//, "")), "utf8"))
+    .join("\n");
+  const { htmlTag, bodyTag, markup } = criticalFragment(html);
+  if (!markup) continue;
+
+  const processed = await beasties.process(
+    `${htmlTag}<head><style>${css}</style></head>${bodyTag}${markup}</body></html>`,
+  );
+  const reduced = (/<style>([\s\S]*?)<\/style>/.exec(processed)?.[1] ?? "").replace(
+    /@(font-face|property)\s*[^{]*\{[^}]*\}/g,
+    "",
+  );
+  const critical = globalRules(css) + reduced;
+
+  html = html.replace(
+    links[0].tag,
+    `<style ${MARKER}>${critical}</style>${links[0].tag}`,
+  );
+  for (const { tag } of links) {
+    const deferred = tag.replace("<link ", `<link media="print" onload="this.media='all'" `);
+    html = html.replace(tag, `${deferred}<noscript>${tag}</noscript>`);
+  }
+  fs.writeFileSync(file, html);
+
+  report.push({
+    page: path.relative(APP_DIR, file),
+    critical: { bytes: Buffer.byteLength(critical), gzip: gzip(critical) },
+    deferred: { bytes: Buffer.byteLength(css), gzip: gzip(css) },
+  });
+}
+
+fs.mkdirSync(path.dirname(REPORT), { recursive: true });
+fs.writeFileSync(REPORT, JSON.stringify(report, null, 2));
+for (const { page, critical, deferred } of report) {
+  console.log(
+    `critical-css: ${page} inlined ${(critical.gzip / 1024).toFixed(1)} kB gzip, ` +
+      `deferred ${(deferred.gzip / 1024).toFixed(1)} kB gzip`,
+  );
+}
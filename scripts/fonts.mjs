@@ -0,0 +1,125 @@
+// Vendors Geist and Geist Mono from the `geist` package into src/app/fonts,
+// subset to the characters and weights the site actually renders. Runs
+// before every build and does nothing when its inputs haven't changed, so
+// builds never need to reach fonts.googleapis.com.
+import crypto from "node:crypto";
+import fs from "node:fs";
+import { createRequire } from "node:module";
+import path from "node:path";
+
+import subsetFont from "subset-font";
+
+const ROOT = process.cwd();
+const OUT_DIR = path.join(ROOT, "src", "app", "fonts");
+const MANIFEST = path.join(OUT_DIR, "manifest.json");
+const SCAN_DIRS = ["src", "content"];
+const SCAN_EXTENSIONS = new Set([".ts", ".tsx", ".json", ".md"]);
+const require = createRequire(import.meta.url);
+
+const WEIGHT_CLASSES = {
+  thin: 100,
+  extralight: 200,
+  light: 300,
+  normal: 400,
+  medium: 500,
+  semibold: 600,
+  bold: 700,
+  extrabold: 800,
+  black: 900,
+};
+
+const FONTS = [
+  {
+    name: "geist-sans",
+    source: "geist/dist/fonts/geist-sans/Geist-Variable.woff2",
+    // Body text is always rendered in the sans face.
+    used: () => true,
+  },
+  {
+    name: "geist-mono",
+    source: "geist/dist/fonts/geist-mono/GeistMono-Variable.woff2",
+    used: (text) => /\bfont-mono\b/.test(text),
+    // Mono is only used for small tabular text; pin it to one weight.
+    weights: [400, 400],
+  },
+];
+
+function* walk(dir) {
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) {
+      if (full !== OUT_DIR) yield* walk(full);
+    } else if (SCAN_EXTENSIONS.has(path.extname(entry.name))) {
+      yield full;
+    }
+  }
+}
+
+function collect() {
+  let text = "";
+  for (const dir of SCAN_DIRS) {
+    for (const file of walk(path.join(ROOT, dir))) text += fs.readFileSync(file, "utf8");
+  }
+  // Printable ASCII is always kept so form input renders in the web font.
+  const chars = new Set();
+  for (let code = 0x20; code <= 0x7e; code++) chars.add(String.fromCharCode(code));
+  for (const char of text) {
+    const code = char.codePointAt(0);
+    // Latin-1 supplement, Latin Extended-A and general punctuation only.
+    if ((code >= 0xa0 && code <= 0x17f) || (code >= 0x2000 && code <= 0x206f)) chars.add(char);
+  }
+
+  const weights = new Set([400]);
+  for (const [, name] of text.matchAll(/\bfont-(thin|extralight|light|normal|medium|semibold|bold|extrabold|black)\b/g)) {
+    weights.add(WEIGHT_CLASSES[name]);
+  }
+  return { text, glyphs: [...chars].sort().join(""), weights: [Math.min(...weights), Math.max(...weights)] };
+}
+
+function readManifest() {
+  try {
+    return JSON.parse(fs.readFileSync(MANIFEST, "utf8"));
+  } catch {
+    return {};
+  }
+}
+
+const { text, glyphs, weights } = collect();
+const manifest = readManifest();
+const next = {};
+fs.mkdirSync(OUT_DIR, { recursive: true });
+
+for (const font of FONTS) {
+  const out = path.join(OUT_DIR, `${font.name}.woff2`);
+  if (!font.used(text)) {
+    fs.rmSync(out, { force: true });
+    continue;
+  }
+  const sourcePath = require.resolve(font.source);
+  const [min, max] = font.weights ?? weights;
+  const key = crypto
+    .createHash("sha256")
+    .update(fs.readFileSync(sourcePath))
+    .update(glyphs)
+    .update(`${min}-${max}`)
+    .digest("hex");
+  next[font.name] = { key, glyphs: glyphs.length, weights: [min, max] };
+  if (manifest[font.name]?.key === key && fs.existsSync(out)) continue;
+
+  const subset = await subsetFont(fs.readFileSync(sourcePath), glyphs, {
+    targetFormat: "woff2",
+    variationAxes: { wght: min === max ? min : { min, max } },
+  });
+  fs.writeFileSync(out, subset);
+  console.log(`fonts: ${font.name} ${min}-${max}, ${glyphs.length} glyphs, ${(subset.length / 1024).toFixed(1)} kB`);
+}
+
+fs.writeFileSync(MANIFEST, `${JSON.stringify(next, null, 2)}\n`);
+
+// next/font/local needs literal weights in layout.tsx; keep them in sync.
+const layout = fs.readFileSync(path.join(ROOT, "src", "app", "layout.tsx"), "utf8");
+const declared = /src: "\.\/fonts\/geist-sans\.woff2",\s*weight: "(\d+) (\d+)"/.exec(layout);
+if (declared && (Number(declared[1]) !== weights[0] || Number(declared[2]) !== weights[1])) {
+  console.error(`fonts: layout.tsx declares geist-sans weight "${declared[1]} ${declared[2]}" but the site uses ${weights.join("-")}`);
+  process.exitCode = 1;
+}
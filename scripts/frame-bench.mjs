@@ -0,0 +1,131 @@
+// Scroll benchmark for the page in full and lite render modes. Drives a
+// throttled, phone-sized Chromium through the whole page, records every
+// requestAnimationFrame delta, and appends the percentiles to
+// reports/frame-bench.jsonl so runs can be compared across commits.
+//
+//   npm run build && npm run serve          (in another terminal)
+//   npm run bench:frames [-- <url>]
+//
+// Needs Playwright with Chromium installed; it isn't a dependency of the site:
+//   npm i -D playwright && npx playwright install chromium
+import { execSync } from "node:child_process";
+import fs from "node:fs";
+import path from "node:path";
+
+const ROOT = process.cwd();
+const HISTORY_FILE = path.join(ROOT, "reports", "frame-bench.jsonl");
+const URL_UNDER_TEST = process.argv[2] ?? process.env.BENCH_URL ?? "http://localhost:3000/";
+const CPU_THROTTLE = Number(process.env.BENCH_CPU_THROTTLE ?? 4);
+const RUNS = Number(process.env.BENCH_RUNS ?? 3);
+const MODES = ["full", "lite"];
+const FRAME_BUDGET_MS = 1000 / 60;
+
+let chromium;
+try {
+  ({ chromium } = await import("playwright"));
+} catch {
+  console.error("frame-bench: playwright is not installed (npm i -D playwright && npx playwright install chromium)");
+  process.exit(1);
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(Math.max(Math.ceil((p / 100) * sorted.length) - 1, 0), sorted.length - 1)];
+}
+
+function gitCommit() {
+  try {
+    return execSync("git rev-parse --short HEAD", { stdio: ["ignore", "pipe", "ignore"] })
+      .toString()
+      .trim();
+  } catch {
+    return null;
+  }
+}
+
+// Scrolls to the bottom in wheel-sized steps, one per frame, the way a
+// fling on a phone would, and returns the frame deltas seen meanwhile.
+async function scrollRun(page) {
+  return page.evaluate(async () => {
+    window.scrollTo(0, 0);
+    await new Promise((r) => setTimeout(r, 300));
+    const deltas = [];
+    let last = performance.now();
+    let recording = true;
+    const tick = (now) => {
+      deltas.push(now - last);
+      last = now;
+      if (recording) requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+    const step = 120;
+    while (window.scrollY + window.innerHeight < document.documentElement.scrollHeight - 1) {
+      window.scrollBy(0, step);
+      await new Promise((r) => requestAnimationFrame(r));
+    }
+    await new Promise((r) => setTimeout(r, 200));
+    recording = false;
+    return deltas.slice(1);
+  });
+}
+
+async function measure(browser, mode) {
+  const context = await browser.newContext({
+    viewport: { width: 412, height: 915 },
+    deviceScaleFactor: 2.6,
+    isMobile: true,
+    hasTouch: true,
+  });
+  const page = await context.newPage();
+  const cdp = await context.newCDPSession(page);
+  await cdp.send("Emulation.setCPUThrottlingRate", { rate: CPU_THROTTLE });
+
+  const url = new URL(URL_UNDER_TEST);
+  url.searchParams.set("render", mode);
+  await page.goto(url.toString(), { waitUntil: "networkidle" });
+
+  const deltas = [];
+  for (let run = 0; run < RUNS; run++) deltas.push(...(await scrollRun(page)));
+  await context.close();
+
+  const sorted = deltas.sort((a, b) => a - b);
+  const round = (value) => Math.round(value * 10) / 10;
+  return {
+    frames: sorted.length,
+    p50: round(percentile(sorted, 50)),
+    p90: round(percentile(sorted, 90)),
+    p99: round(percentile(sorted, 99)),
+    // Share of frames that missed one, and two, 60 Hz deadlines.
+    jank: round((100 * sorted.filter((d) => d > FRAME_BUDGET_MS * 1.5).length) / sorted.length),
+    severe: round((100 * sorted.filter((d) => d > FRAME_BUDGET_MS * 2.5).length) / sorted.length),
+  };
+}
+
+const browser = await chromium.launch();
+const results = {};
+try {
+  for (const mode of MODES) results[mode] = await measure(browser, mode);
+} finally {
+  await browser.close();
+}
+
+const entry = {
+  generatedAt: new Date().toISOString(),
+  commit: gitCommit(),
+  url: URL_UNDER_TEST,
+  cpuThrottle: CPU_THROTTLE,
+  runs: RUNS,
+  results,
+};
+fs.mkdirSync(path.dirname(HISTORY_FILE), { recursive: true });
+fs.appendFileSync(HISTORY_FILE, `${JSON.stringify(entry)}\n`);
+
+console.log(`\nFrame times for ${URL_UNDER_TEST} (${CPU_THROTTLE}x CPU throttle, ${RUNS} scrolls per mode)`);
+console.log(`  ${"mode".padEnd(6)} ${"frames".padStart(7)} ${"p50".padStart(8)} ${"p90".padStart(8)} ${"p99".padStart(8)} ${">1.5x".padStart(7)} ${">2.5x".padStart(7)}`);
+for (const [mode, r] of Object.entries(results)) {
+  console.log(
+    `  ${mode.padEnd(6)} ${String(r.frames).padStart(7)} ${`${r.p50} ms`.padStart(8)} ${`${r.p90} ms`.padStart(8)} ` +
+      `${`${r.p99} ms`.padStart(8)} ${`${r.jank}%`.padStart(7)} ${`${r.severe}%`.padStart(7)}`,
+  );
+}
+console.log(`History: ${path.relative(ROOT, HISTORY_FILE)}\n`);
@@ -0,0 +1,117 @@
+// Post-build step: writes Brotli and zstd variants of every compressible
+// file in public/ and .next/static/ at maximum useful compression, plus a
+// manifest that server.mjs uses to serve them without compressing per request.
+import crypto from "node:crypto";
+import fs from "node:fs";
+import path from "node:path";
+import zlib from "node:zlib";
+
+const ROOT = process.cwd();
+const OUT_DIR = path.join(ROOT, ".next", "precompressed");
+const MANIFEST = path.join(OUT_DIR, "manifest.json");
+const SOURCES = [
+  { dir: path.join(ROOT, "public"), prefix: "/" },
+  { dir: path.join(ROOT, ".next", "static"), prefix: "/_next/static/" },
+];
+const COMPRESSIBLE = new Set([
+  ".css", ".html", ".ico", ".js", ".json", ".map", ".mjs", ".pdf", ".svg", ".txt", ".webmanifest", ".xml",
+]);
+// A variant must save at least this fraction of the original to be kept.
+const MIN_SAVING = 0.05;
+
+const ENCODERS = {
+  br: (buffer) =>
+    zlib.brotliCompressSync(buffer, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+        [zlib.constants.BROTLI_PARAM_LGWIN]: zlib.constants.BROTLI_MAX_WINDOW_BITS,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: buffer.length,
+      },
+    }),
+};
+// zstd landed in node:zlib in Node 22.15. Level 19 is the highest level
+// whose window stays within the 8 MB browsers accept for Content-Encoding.
+if (typeof zlib.zstdCompressSync === "function") {
+  ENCODERS.zstd = (buffer) =>
+    zlib.zstdCompressSync(buffer, {
+      params: {
+        [zlib.constants.ZSTD_c_compressionLevel]: 19,
+        [zlib.constants.ZSTD_c_windowLog]: 23,
+        [zlib.constants.ZSTD_c_checksumFlag]: 1,
+      },
+    });
+} else {
+  console.warn("precompress: this Node.js has no zstd support; writing Brotli variants only");
+}
+const EXTENSIONS = { br: ".br", zstd: ".zst" };
+
+function* walk(dir) {
+  if (!fs.existsSync(dir)) return;
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) yield* walk(full);
+    else yield full;
+  }
+}
+
+function etag(buffer) {
+  return crypto.createHash("sha256").update(buffer).digest("base64url").slice(0, 22);
+}
+
+function readManifest() {
+  try {
+    return JSON.parse(fs.readFileSync(MANIFEST, "utf8"));
+  } catch {
+    return {};
+  }
+}
+
+const previous = readManifest();
+const manifest = {};
+let written = 0;
+let saved = 0;
+
+for (const { dir, prefix } of SOURCES) {
+  for (const file of walk(dir)) {
+    const rel = path.relative(dir, file).split(path.sep).join("/");
+    const url = prefix + rel;
+    const stat = fs.statSync(file);
+    const cached = previous[url];
+    if (cached && cached.size === stat.size && cached.mtimeMs === stat.mtimeMs) {
+      const variantsExist = Object.values(cached.variants).every((v) => fs.existsSync(path.join(OUT_DIR, v.file)));
+      if (variantsExist) {
+        manifest[url] = cached;
+        continue;
+      }
+    }
+
+    const buffer = fs.readFileSync(file);
+    const entry = {
+      file: path.relative(ROOT, file).split(path.sep).join("/"),
+      size: stat.size,
+      mtimeMs: stat.mtimeMs,
+      etag: etag(buffer),
+      variants: {},
+    };
+    if (COMPRESSIBLE.has(path.extname(file).toLowerCase())) {
+      for (const [encoding, encode] of Object.entries(ENCODERS)) {
+        const compressed = encode(buffer);
+        if (compressed.length > buffer.length * (1 - MIN_SAVING)) continue;
+        const out = `${url.slice(1)}${EXTENSIONS[encoding]}`;
+        fs.mkdirSync(path.dirname(path.join(OUT_DIR, out)), { recursive: true });
+        fs.writeFileSync(path.join(OUT_DIR, out), compressed);
+        entry.variants[encoding] = { file: out, size: compressed.length };
+        written += 1;
+        saved += buffer.length - compressed.length;
+      }
+    }
+    manifest[url] = entry;
+  }
+}
+
+fs.mkdirSync(OUT_DIR, { recursive: true });
+fs.writeFileSync(MANIFEST, JSON.stringify(manifest));
+console.log(
+  `precompress: ${Object.keys(manifest).length} files, ${written} new variants, ` +
+    `${(saved / 1024 / 1024).toFixed(2)} MB saved`,
+);
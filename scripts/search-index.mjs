@@ -0,0 +1,136 @@
+// Builds the BM25 index behind /api/match, one file per tenant in
+// .next/cache/search/ (`next build` empties the rest of .next/). Documents
+// are the tenant's resumes (title, type and the text extracted from the PDF)
+// and projects (title, category and description). Tenants whose content and
+// referenced PDFs are unchanged keep their existing index.
+import crypto from "node:crypto";
+import fs from "node:fs";
+import path from "node:path";
+
+import { assetFile, TENANTS_DIR } from "../src/lib/asset-file.mjs";
+import { extractPdfText } from "../src/lib/pdf-text.mjs";
+import { BM25, tokenize } from "../src/lib/search-text.mjs";
+
+const ROOT = process.cwd();
+const OUT_DIR = path.join(ROOT, ".next", "cache", "search");
+const TENANT_PATTERN = /^[a-z0-9][a-z0-9-]{0,62}$/;
+const INDEX_VERSION = 1;
+// Titles are short but say the most about a document, so their terms count
+// several times (a cheap stand-in for BM25F field weights).
+const TITLE_WEIGHT = 3;
+
+// Resumes in public/ (the default tenant) or in a tenant's bundle.
+function resumeFile(url) {
+  const file = url ? assetFile(url) : null;
+  return file && fs.existsSync(file) ? file : null;
+}
+
+function sourceHash(contentFile, content) {
+  const hash = crypto.createHash("sha256");
+  hash.update(String(INDEX_VERSION));
+  hash.update(fs.readFileSync(contentFile));
+  for (const resume of content.resumes) {
+    const file = resumeFile(resume.url);
+    if (file) hash.update(fs.readFileSync(file));
+  }
+  return hash.digest("hex");
+}
+
+function documents(content) {
+  const docs = [];
+  for (const resume of content.resumes) {
+    const file = resumeFile(resume.url);
+    const text = file ? extractPdfText(fs.readFileSync(file)) : "";
+    docs.push({
+      kind: "resume",
+      id: resume.id,
+      title: resume.title,
+      url: resume.url,
+      terms: [
+        ...Array(TITLE_WEIGHT).fill(tokenize(`${resume.title} ${resume.type}`)).flat(),
+        ...tokenize(text),
+      ],
+    });
+  }
+  const labels = Object.fromEntries(content.projectCategories.map((c) => [c.key, c.label]));
+  for (const [category, projects] of Object.entries(content.projects)) {
+    for (const project of projects) {
+      docs.push({
+        kind: "project",
+        id: project.id,
+        title: project.title,
+        category,
+        url: project.link,
+        terms: [
+          ...Array(TITLE_WEIGHT).fill(tokenize(project.title)).flat(),
+          ...tokenize(`${labels[category] ?? category} ${project.description}`),
+        ],
+      });
+    }
+  }
+  return docs;
+}
+
+// Postings hold raw term frequencies and each document keeps its length, so
+// scoring needs only the query terms' postings: no per-query pass over
+// every document.
+// Terms are arbitrary words ("constructor", "__proto__"), so the maps have no
+// prototype for them to collide with.
+function buildIndex(tenant, hash, docs) {
+  const postings = Object.create(null);
+  const lengths = [];
+  docs.forEach((doc, i) => {
+    lengths.push(doc.terms.length);
+    const tf = new Map();
+    for (const term of doc.terms) tf.set(term, (tf.get(term) ?? 0) + 1);
+    for (const [term, count] of tf) (postings[term] ??= []).push([i, count]);
+  });
+  const n = docs.length;
+  const idf = Object.create(null);
+  for (const [term, list] of Object.entries(postings)) {
+    idf[term] = Math.log(1 + (n - list.length + 0.5) / (list.length + 0.5));
+  }
+  return {
+    version: INDEX_VERSION,
+    tenant,
+    hash,
+    builtAt: new Date().toISOString(),
+    ...BM25,
+    avgLength: lengths.reduce((a, b) => a + b, 0) / Math.max(n, 1),
+    docs: docs.map(({ terms, ...doc }, i) => ({ ...doc, length: lengths[i] })),
+    idf,
+    postings,
+  };
+}
+
+function readHash(file) {
+  try {
+    return JSON.parse(fs.readFileSync(file, "utf8")).hash;
+  } catch {
+    return null;
+  }
+}
+
+fs.mkdirSync(OUT_DIR, { recursive: true });
+const tenants = fs
+  .readdirSync(TENANTS_DIR, { withFileTypes: true })
+  .filter((e) => e.isDirectory() && TENANT_PATTERN.test(e.name))
+  .map((e) => e.name);
+
+let rebuilt = 0;
+for (const tenant of tenants) {
+  const contentFile = path.join(TENANTS_DIR, tenant, "content.json");
+  const content = JSON.parse(fs.readFileSync(contentFile, "utf8"));
+  const hash = sourceHash(contentFile, content);
+  const out = path.join(OUT_DIR, `${tenant}.json`);
+  if (readHash(out) === hash) continue;
+
+  const index = buildIndex(tenant, hash, documents(content));
+  fs.writeFileSync(out, JSON.stringify(index));
+  rebuilt += 1;
+  console.log(`search-index: ${tenant}: ${index.docs.length} documents, ${Object.keys(index.idf).length} terms`);
+}
+for (const file of fs.readdirSync(OUT_DIR)) {
+  if (!tenants.includes(path.basename(file, ".json"))) fs.rmSync(path.join(OUT_DIR, file));
+}
+console.log(`search-index: ${rebuilt} of ${tenants.length} tenants rebuilt`);
@@ -0,0 +1,110 @@
+// Checks tenant content bundles before a build. Each tenant lives in
+// content/tenants/<tenant>/ as a content.json plus an optional assets/
+// directory, which the /tenants/[tenant]/[...asset] route serves straight
+// from disk. Only tenants whose directory hash changed since the last run
+// are validated, so editing one candidate's bundle doesn't touch the other
+// few hundred.
+//
+//   node scripts/tenants.mjs                         check changed tenants
+//   node scripts/tenants.mjs --revalidate <baseUrl>  ...and purge their cached pages
+import crypto from "node:crypto";
+import fs from "node:fs";
+import path from "node:path";
+
+const ROOT = process.cwd();
+const TENANTS_DIR = path.resolve(process.env.PORTFOLIO_CONTENT_DIR ?? "content/tenants");
+const STATE_FILE = path.join(ROOT, ".next", "cache", "tenants.json");
+const TENANT_PATTERN = /^[a-z0-9][a-z0-9-]{0,62}$/;
+const REQUIRED = ["profile", "skills", "internships", "resumes", "projectCategories", "projects", "certificates", "availability"];
+
+function* walk(dir) {
+  if (!fs.existsSync(dir)) return;
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true }).sort((a, b) => a.name.localeCompare(b.name))) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) yield* walk(full);
+    else yield full;
+  }
+}
+
+function hashTenant(dir) {
+  const hash = crypto.createHash("sha256");
+  for (const file of walk(dir)) {
+    hash.update(path.relative(dir, file));
+    hash.update(fs.readFileSync(file));
+  }
+  return hash.digest("hex");
+}
+
+function validate(tenant, dir) {
+  const content = JSON.parse(fs.readFileSync(path.join(dir, "content.json"), "utf8"));
+  const missing = REQUIRED.filter((key) => !(key in content));
+  if (missing.length) throw new Error(`${tenant}: content.json is missing ${missing.join(", ")}`);
+  for (const category of content.projectCategories) {
+    if (!Array.isArray(content.projects[category.key])) {
+      throw new Error(`${tenant}: no projects list for category "${category.key}"`);
+    }
+  }
+}
+
+function readState() {
+  try {
+    return JSON.parse(fs.readFileSync(STATE_FILE, "utf8"));
+  } catch {
+    return {};
+  }
+}
+
+async function revalidate(baseUrl, tenants) {
+  const response = await fetch(new URL("/api/revalidate", baseUrl), {
+    method: "POST",
+    headers: {
+      "content-type": "application/json",
+      authorization: `Bearer ${process.env.REVALIDATE_TOKEN ?? ""}`,
+    },
+    body: JSON.stringify({ tenants }),
+  });
+  if (!response.ok) throw new Error(`revalidate failed: ${response.status} ${await response.text()}`);
+}
+
+async function main() {
+  const args = process.argv.slice(2);
+  const revalidateAt = args.indexOf("--revalidate");
+  const baseUrl = revalidateAt === -1 ? null : args[revalidateAt + 1];
+
+  const previous = readState();
+  const next = {};
+  const changed = [];
+  const tenants = fs
+    .readdirSync(TENANTS_DIR, { withFileTypes: true })
+    .filter((e) => e.isDirectory() && TENANT_PATTERN.test(e.name))
+    .map((e) => e.name);
+
+  for (const tenant of tenants) {
+    const dir = path.join(TENANTS_DIR, tenant);
+    const hash = hashTenant(dir);
+    next[tenant] = hash;
+    if (previous[tenant] === hash) continue;
+    validate(tenant, dir);
+    changed.push(tenant);
+  }
+
+  const removed = Object.keys(previous).filter((tenant) => !(tenant in next));
+
+  fs.mkdirSync(path.dirname(STATE_FILE), { recursive: true });
+  fs.writeFileSync(STATE_FILE, JSON.stringify(next, null, 2));
+  console.log(
+    `tenants: ${tenants.length} total, ${changed.length} changed` +
+      (changed.length ? ` (${changed.join(", ")})` : "") +
+      (removed.length ? `, ${removed.length} removed` : ""),
+  );
+
+  if (baseUrl && (changed.length || removed.length)) {
+    await revalidate(baseUrl, [...changed, ...removed]);
+    console.log(`tenants: revalidated ${changed.length + removed.length} on ${baseUrl}`);
+  }
+}
+
+main().catch((error) => {
+  console.error(error.message);
+  process.exit(1);
+});
@@ -0,0 +1,158 @@
+// Production server that answers static files from the precompressed
+// variants written by scripts/precompress.mjs and hands everything else to
+// Next.js. Start with `npm run serve` after `npm run build`.
+import fs from "node:fs";
+import http from "node:http";
+import path from "node:path";
+import next from "next";
+
+const ROOT = process.cwd();
+const PRECOMPRESSED = path.join(ROOT, ".next", "precompressed");
+const port = Number(process.env.PORT ?? 3000);
+
+const CONTENT_TYPES = {
+  ".css": "text/css; charset=utf-8",
+  ".html": "text/html; charset=utf-8",
+  ".ico": "image/x-icon",
+  ".jpg": "image/jpeg",
+  ".js": "application/javascript; charset=utf-8",
+  ".json": "application/json",
+  ".map": "application/json",
+  ".pdf": "application/pdf",
+  ".png": "image/png",
+  ".svg": "image/svg+xml",
+  ".txt": "text/plain; charset=utf-8",
+  ".webp": "image/webp",
+  ".woff2": "font/woff2",
+};
+// Preferred when the client accepts several with equal q-values.
+const ENCODING_PREFERENCE = ["zstd", "br"];
+
+function loadManifest() {
+  try {
+    return JSON.parse(fs.readFileSync(path.join(PRECOMPRESSED, "manifest.json"), "utf8"));
+  } catch {
+    console.warn("server: no precompressed manifest; run `npm run build` first");
+    return {};
+  }
+}
+
+function acceptedEncodings(header = "") {
+  const accepted = new Map();
+  for (const part of header.split(",")) {
+    const [name, ...params] = part.trim().toLowerCase().split(";");
+    if (!name) continue;
+    const q = params.map((p) => p.trim()).find((p) => p.startsWith("q="));
+    accepted.set(name, q ? Number(q.slice(2)) : 1);
+  }
+  return accepted;
+}
+
+function chooseVariant(entry, acceptEncoding) {
+  const accepted = acceptedEncodings(acceptEncoding);
+  let best = null;
+  for (const encoding of ENCODING_PREFERENCE) {
+    const variant = entry.variants[encoding];
+    const q = accepted.get(encoding) ?? accepted.get("*") ?? 0;
+    if (!variant || q <= 0) continue;
+    if (!best || q > best.q || (q === best.q && variant.size < best.size)) {
+      best = { encoding, q, size: variant.size, file: path.join(PRECOMPRESSED, variant.file) };
+    }
+  }
+  return best;
+}
+
+function etagMatches(header, etag) {
+  if (!header) return false;
+  if (header.trim() === "*") return true;
+  return header.split(",").some((tag) => tag.trim().replace(/^W\//, "") === etag);
+}
+
+// Parses a single `bytes=` range. Multi-range requests get the full body.
+function parseRange(header, size) {
+  const match = /^bytes=(\d*)-(\d*)$/.exec(header.trim());
+  if (!match) return null;
+  const [, first, last] = match;
+  if (first === "" && last === "") return null;
+  const start = first === "" ? Math.max(0, size - Number(last)) : Number(first);
+  const end = first === "" || last === "" ? size - 1 : Math.min(Number(last), size - 1);
+  return start > end || start >= size ? "unsatisfiable" : { start, end };
+}
+
+function serveStatic(req, res, manifest) {
+  if (req.method !== "GET" && req.method !== "HEAD") return false;
+  let pathname;
+  try {
+    pathname = decodeURIComponent(new URL(req.url, "http://localhost").pathname);
+  } catch {
+    return false;
+  }
+  const entry = manifest[pathname];
+  if (!entry) return false;
+
+  // Byte ranges are served from the identity representation: PDF viewers
+  // request offsets into the decoded file.
+  const range = req.headers.range;
+  const variant = range ? null : chooseVariant(entry, req.headers["accept-encoding"]);
+  const file = variant ? variant.file : path.join(ROOT, entry.file);
+  const size = variant ? variant.size : entry.size;
+  const etag = `"${entry.etag}${variant ? `-${variant.encoding}` : ""}"`;
+
+  res.setHeader("Content-Type", CONTENT_TYPES[path.extname(pathname).toLowerCase()] ?? "application/octet-stream");
+  res.setHeader("Vary", "Accept-Encoding");
+  res.setHeader("ETag", etag);
+  res.setHeader("Last-Modified", new Date(entry.mtimeMs).toUTCString());
+  res.setHeader("Accept-Ranges", "bytes");
+  res.setHeader(
+    "Cache-Control",
+    pathname.startsWith("/_next/static/") ? "public, max-age=31536000, immutable" : "public, max-age=0, must-revalidate",
+  );
+  if (variant) res.setHeader("Content-Encoding", variant.encoding);
+
+  if (etagMatches(req.headers["if-none-match"], etag)) {
+    res.statusCode = 304;
+    res.end();
+    return true;
+  }
+
+  let start = 0;
+  let end = size - 1;
+  const ifRange = req.headers["if-range"];
+  if (range && (!ifRange || ifRange === etag)) {
+    const parsed = parseRange(range, size);
+    if (parsed === "unsatisfiable") {
+      res.statusCode = 416;
+      res.setHeader("Content-Range", `bytes */${size}`);
+      res.end();
+      return true;
+    }
+    if (parsed) {
+      ({ start, end } = parsed);
+      res.statusCode = 206;
+      res.setHeader("Content-Range", `bytes ${start}-${end}/${size}`);
+    }
+  }
+  res.setHeader("Content-Length", String(end - start + 1));
+
+  if (req.method === "HEAD" || size === 0) {
+    res.end();
+    return true;
+  }
+  const stream = fs.createReadStream(file, { start, end });
+  stream.on("error", (error) => res.destroy(error));
+  stream.pipe(res);
+  return true;
+}
+
+const app = next({ dev: false, dir: ROOT });
+const handle = app.getRequestHandler();
+await app.prepare();
+const manifest = loadManifest();
+
+http
+  .createServer((req, res) => {
+    if (!serveStatic(req, res, manifest)) handle(req, res);
+  })
+  .listen(port, () => {
+    console.log(`> Ready on http://localhost:${port} (${Object.keys(manifest).length} precompressed assets)`);
+  });
@@ -0,0 +1,54 @@
+import { ArchiveError, exportPortfolio } from "@/lib/archive/portfolio-archive";
+import { TENANT_PATTERN } from "@/lib/content";
+import { DEFAULT_TENANT } from "@/lib/content-store";
+
+export const dynamic = "force-dynamic";
+
+function authorized(request: Request) {
+  const token = process.env.ARCHIVE_TOKEN;
+  return Boolean(token) && request.headers.get("authorization") === `Bearer ${token}`;
+}
+
+async function archiveResponse(tenant: unknown, have: ReadonlySet<string>) {
+  if (typeof tenant !== "string" || !TENANT_PATTERN.test(tenant)) {
+    return new Response("Invalid tenant", { status: 400 });
+  }
+  const stream = await exportPortfolio(tenant, have);
+  if (!stream) return new Response("Unknown tenant", { status: 404 });
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "application/x-tar",
+      "Content-Disposition": `attachment; filename="${tenant}-portfolio.tar"`,
+      "Cache-Control": "no-store",
+    },
+  });
+}
+
+// GET ?tenant=<tenant> streams a full archive.
+export async function GET(request: Request) {
+  if (!authorized(request)) return new Response("Unauthorized", { status: 401 });
+  const tenant = new URL(request.url).searchParams.get("tenant") ?? DEFAULT_TENANT;
+  return archiveResponse(tenant, new Set());
+}
+
+// POST { tenant?, have?: string[] } streams an incremental archive: assets
+// whose SHA-256 is in `have` are listed in the manifest but not sent.
+export async function POST(request: Request) {
+  if (!authorized(request)) return new Response("Unauthorized", { status: 401 });
+  let body: { tenant?: unknown; have?: unknown };
+  try {
+    body = await request.json();
+  } catch {
+    return new Response("Invalid JSON", { status: 400 });
+  }
+  const { tenant = DEFAULT_TENANT, have = [] } = body;
+  if (!Array.isArray(have) || !have.every((hash) => typeof hash === "string")) {
+    return new Response("\"have\" must be a list of SHA-256 hashes", { status: 400 });
+  }
+  try {
+    return await archiveResponse(tenant, new Set(have));
+  } catch (error) {
+    if (error instanceof ArchiveError) return new Response(error.message, { status: error.status });
+    throw error;
+  }
+}
@@ -0,0 +1,29 @@
+import { revalidatePath } from "next/cache";
+
+import { ArchiveError, importPortfolio } from "@/lib/archive/portfolio-archive";
+import { TENANT_PATTERN } from "@/lib/content";
+import { DEFAULT_TENANT } from "@/lib/content-store";
+
+export const dynamic = "force-dynamic";
+
+// POST ?tenant=<tenant> with an archive from /api/export as the body. The
+// body is unpacked as it streams in; nothing is buffered whole.
+export async function POST(request: Request) {
+  const token = process.env.ARCHIVE_TOKEN;
+  if (!token || request.headers.get("authorization") !== `Bearer ${token}`) {
+    return new Response("Unauthorized", { status: 401 });
+  }
+  const tenant = new URL(request.url).searchParams.get("tenant") ?? DEFAULT_TENANT;
+  if (!TENANT_PATTERN.test(tenant)) return new Response("Invalid tenant", { status: 400 });
+  if (!request.body) return new Response("Expected a tar archive body", { status: 400 });
+
+  try {
+    const summary = await importPortfolio(tenant, request.body);
+    revalidatePath(`/t/${tenant}`);
+    if (tenant === DEFAULT_TENANT) revalidatePath("/");
+    return Response.json(summary);
+  } catch (error) {
+    if (error instanceof ArchiveError) return new Response(error.message, { status: error.status });
+    throw error;
+  }
+}
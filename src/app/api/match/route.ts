@@ -0,0 +1,40 @@
+import { TENANT_PATTERN } from "@/lib/content";
+import { DEFAULT_TENANT } from "@/lib/content-store";
+import { readBoundedText } from "@/lib/request-body";
+import { MAX_QUERY_LENGTH, matchJobDescription } from "@/lib/search-index";
+
+export const dynamic = "force-dynamic";
+
+// Room for MAX_QUERY_LENGTH characters of multi-byte text, JSON-escaped.
+const MAX_BODY_BYTES = MAX_QUERY_LENGTH * 6 + 1024;
+
+// POST { text, tenant?, limit? } with a pasted job description. Ranks the
+// tenant's resumes and projects against it with the prebuilt BM25 index.
+export async function POST(request: Request) {
+  const raw = await readBoundedText(request, MAX_BODY_BYTES);
+  if (raw === null) return new Response("Payload too large", { status: 413 });
+  let body: { text?: unknown; tenant?: unknown; limit?: unknown };
+  try {
+    body = JSON.parse(raw) ?? {};
+  } catch {
+    return new Response("Invalid JSON", { status: 400 });
+  }
+
+  const { text, tenant = DEFAULT_TENANT, limit = 5 } = body;
+  if (typeof text !== "string" || !text.trim()) {
+    return new Response("Expected a non-empty \"text\"", { status: 400 });
+  }
+  if (text.length > MAX_QUERY_LENGTH) {
+    return new Response(`"text" is limited to ${MAX_QUERY_LENGTH} characters`, { status: 413 });
+  }
+  if (typeof tenant !== "string" || !TENANT_PATTERN.test(tenant)) {
+    return new Response("Invalid tenant", { status: 400 });
+  }
+  if (typeof limit !== "number" || !Number.isInteger(limit) || limit < 1 || limit > 50) {
+    return new Response("\"limit\" must be an integer between 1 and 50", { status: 400 });
+  }
+
+  const result = await matchJobDescription(tenant, text, limit);
+  if (!result) return new Response("No search index for tenant", { status: 404 });
+  return Response.json(result);
+}
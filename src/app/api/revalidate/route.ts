@@ -0,0 +1,31 @@
+import { revalidatePath } from "next/cache";
+
+import { TENANT_PATTERN } from "@/lib/content";
+import { DEFAULT_TENANT } from "@/lib/content-store";
+
+export const dynamic = "force-dynamic";
+
+// Called by `npm run tenants -- --revalidate <url>` after a content change,
+// with the tenants whose bundles changed. Only their pages are purged.
+export async function POST(request: Request) {
+  const token = process.env.REVALIDATE_TOKEN;
+  if (!token || request.headers.get("authorization") !== `Bearer ${token}`) {
+    return new Response("Unauthorized", { status: 401 });
+  }
+
+  let tenants: unknown;
+  try {
+    ({ tenants } = await request.json());
+  } catch {
+    return new Response("Invalid JSON", { status: 400 });
+  }
+  if (!Array.isArray(tenants) || !tenants.every((t) => typeof t === "string" && TENANT_PATTERN.test(t))) {
+    return new Response("Expected { tenants: string[] }", { status: 400 });
+  }
+
+  for (const tenant of tenants) {
+    revalidatePath(`/t/${tenant}`);
+    if (tenant === DEFAULT_TENANT) revalidatePath("/");
+  }
+  return Response.json({ revalidated: tenants });
+}
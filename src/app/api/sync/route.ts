@@ -0,0 +1,134 @@
+import { TENANT_PATTERN } from "@/lib/content";
+import { DEFAULT_TENANT, getTenantContent } from "@/lib/content-store";
+import { parseCursor, SYNC_COLLECTIONS, type ContentPatch } from "@/lib/content-sync";
+import { readBoundedText } from "@/lib/request-body";
+import { contentBroadcaster } from "@/lib/sync/broadcaster";
+
+export const dynamic = "force-dynamic";
+
+const MAX_PATCHES = 100;
+const MAX_BODY_BYTES = 256 * 1024;
+
+type Collection = ContentPatch["collection"];
+type Field = (value: unknown) => boolean;
+
+function isRecord(value: unknown): value is Record<string, unknown> {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+const isText =
+  (max: number): Field =>
+  (value) =>
+    typeof value === "string" && value.length <= max;
+
+// Published links end up in window.open on every open page (and in the log
+// replayed to new ones), so only http(s) URLs and same-origin paths pass.
+function isLink(value: unknown) {
+  if (typeof value !== "string" || value.length > 2048) return false;
+  if (value.startsWith("/")) return !value.startsWith("//") && !value.startsWith("/\\");
+  try {
+    const { protocol } = new URL(value);
+    return protocol === "https:" || protocol === "http:";
+  } catch {
+    return false;
+  }
+}
+
+const isHash: Field = (value) => typeof value === "string" && /^[0-9a-f]{64}$/.test(value);
+const isJobId: Field = (value) => typeof value === "string" && /^[0-9a-f-]{36}$/.test(value);
+
+// The fields a record of each collection may carry: [check, required].
+const RECORD_FIELDS: Record<Collection, Record<string, [Field, boolean]>> = {
+  // A resume being drafted may not have its link yet.
+  resumes: { title: [isText(200), true], type: [isText(100), true], url: [(v) => v === "" || isLink(v), true] },
+  projects: {
+    title: [isText(200), true],
+    description: [isText(2000), true],
+    link: [isLink, false],
+    hash: [isHash, false],
+    jobId: [isJobId, false],
+  },
+  certificates: { name: [isText(200), true], url: [isLink, true], hash: [isHash, false], jobId: [isJobId, false] },
+};
+
+// Rebuilds a patch from checked fields only; anything else the caller sent
+// is dropped rather than broadcast. Null when the patch is invalid.
+function sanitizePatch(value: unknown, categories: ReadonlySet<string>): ContentPatch | null {
+  if (!isRecord(value)) return null;
+  const { collection, op, id, category } = value;
+  if (!SYNC_COLLECTIONS.includes(collection as Collection)) return null;
+  if (op !== "add" && op !== "update" && op !== "delete") return null;
+  if (typeof id !== "number" || !Number.isSafeInteger(id)) return null;
+  if (collection === "projects" && !(typeof category === "string" && categories.has(category))) return null;
+  const base = { collection, op, id, ...(collection === "projects" ? { category } : {}) };
+  if (op === "delete") return base as ContentPatch;
+
+  if (!isRecord(value.value) || value.value.id !== id) return null;
+  const record: Record<string, unknown> = { id };
+  for (const [field, [check, required]] of Object.entries(RECORD_FIELDS[collection as Collection])) {
+    const fieldValue = value.value[field];
+    if (fieldValue === undefined || fieldValue === null) {
+      if (required) return null;
+    } else if (!check(fieldValue)) {
+      return null;
+    } else {
+      record[field] = fieldValue;
+    }
+  }
+  return { ...base, value: record } as ContentPatch;
+}
+
+function tenantFrom(value: unknown) {
+  const tenant = value ?? DEFAULT_TENANT;
+  return typeof tenant === "string" && TENANT_PATTERN.test(tenant) ? tenant : null;
+}
+
+// GET ?tenant=<tenant>[&since=<epoch>:<version>] opens an event stream of
+// patch batches. EventSource resends the last event id on reconnect, which
+// takes precedence over `since`.
+export async function GET(request: Request) {
+  const url = new URL(request.url);
+  const tenant = tenantFrom(url.searchParams.get("tenant"));
+  if (!tenant) return new Response("Invalid tenant", { status: 400 });
+  if (!(await getTenantContent(tenant))) return new Response("Unknown tenant", { status: 404 });
+
+  const since = parseCursor(request.headers.get("last-event-id") ?? url.searchParams.get("since"));
+  return new Response(contentBroadcaster.subscribe(tenant, since, request.signal), {
+    headers: {
+      "Content-Type": "text/event-stream",
+      "Cache-Control": "no-cache, no-transform",
+      Connection: "keep-alive",
+      "X-Accel-Buffering": "no",
+    },
+  });
+}
+
+// POST { tenant?, patches: ContentPatch[] } from an admin session. Disabled
+// until SYNC_PUBLISH_TOKEN is set.
+export async function POST(request: Request) {
+  const token = process.env.SYNC_PUBLISH_TOKEN;
+  if (!token || request.headers.get("authorization") !== `Bearer ${token}`) {
+    return new Response("Unauthorized", { status: 401 });
+  }
+
+  const text = await readBoundedText(request, MAX_BODY_BYTES);
+  if (text === null) return new Response("Payload too large", { status: 413 });
+  let body: unknown;
+  try {
+    body = JSON.parse(text);
+  } catch {
+    return new Response("Invalid JSON", { status: 400 });
+  }
+  if (!isRecord(body)) return new Response("Expected an object", { status: 400 });
+  const tenant = tenantFrom(body.tenant);
+  const content = tenant ? await getTenantContent(tenant) : null;
+  if (!tenant || !content) return new Response("Invalid tenant", { status: 400 });
+  const categories = new Set(content.projectCategories.map((c) => c.key));
+  const patches = Array.isArray(body.patches) ? body.patches.map((p) => sanitizePatch(p, categories)) : [];
+  if (patches.length === 0 || patches.length > MAX_PATCHES || patches.includes(null)) {
+    return new Response(`Expected 1-${MAX_PATCHES} valid patches`, { status: 400 });
+  }
+
+  contentBroadcaster.publish(tenant, patches as ContentPatch[]);
+  return new Response(null, { status: 202 });
+}
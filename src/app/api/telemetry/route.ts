@@ -0,0 +1,28 @@
+import { readBoundedText } from "@/lib/request-body";
+import { telemetryStore } from "@/lib/telemetry-store";
+
+export const dynamic = "force-dynamic";
+
+// A full batch of rows is well under this.
+const MAX_BODY_BYTES = 64 * 1024;
+
+export async function POST(request: Request) {
+  const text = await readBoundedText(request, MAX_BODY_BYTES);
+  if (text === null) return new Response("Payload too large", { status: 413 });
+  let payload: unknown;
+  try {
+    // sendBeacon bodies may arrive as text/plain, so parse manually.
+    payload = JSON.parse(text);
+  } catch {
+    return new Response("Invalid JSON", { status: 400 });
+  }
+  // Only shares out the per-minute row budget. The header can be forged;
+  // the daily byte cap is what bounds the disk.
+  const client = request.headers.get("x-forwarded-for")?.split(",")[0].trim() ?? "";
+  await telemetryStore.ingest(payload, client);
+  return new Response(null, { status: 204 });
+}
+
+export function GET() {
+  return Response.json({ metrics: telemetryStore.summary() });
+}
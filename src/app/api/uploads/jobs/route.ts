@@ -0,0 +1,13 @@
+import { uploadPipeline } from "@/lib/jobs/pipeline";
+
+export const dynamic = "force-dynamic";
+
+const MAX_IDS = 100;
+
+export async function GET(request: Request) {
+  const ids = (new URL(request.url).searchParams.get("ids") ?? "")
+    .split(",")
+    .filter(Boolean)
+    .slice(0, MAX_IDS);
+  return Response.json({ jobs: await uploadPipeline.get(ids) });
+}
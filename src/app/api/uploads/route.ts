@@ -0,0 +1,89 @@
+import { QueueFullError, uploadPipeline, UploadTooLargeError, type StagedUpload } from "@/lib/jobs/pipeline";
+import { multipartBoundary, MultipartError, readMultipart } from "@/lib/multipart";
+import { JOB_KINDS, type JobKind } from "@/lib/uploads";
+
+export const dynamic = "force-dynamic";
+
+const MAX_FILES = 20;
+const MAX_FILE_BYTES = Number(process.env.UPLOAD_MAX_FILE_BYTES ?? 25 * 1024 * 1024);
+const MAX_REQUEST_BYTES = Number(process.env.UPLOAD_MAX_REQUEST_BYTES ?? 100 * 1024 * 1024);
+const MAX_FIELD_BYTES = 1024;
+// Files plus the handful of fields a well-formed request carries.
+const MAX_PARTS = MAX_FILES + 8;
+
+class BadUploadError extends Error {}
+
+async function readField(chunks: AsyncIterable<Uint8Array>) {
+  const parts: Uint8Array[] = [];
+  let size = 0;
+  for await (const chunk of chunks) {
+    size += chunk.byteLength;
+    if (size > MAX_FIELD_BYTES) throw new BadUploadError("Form field too large");
+    parts.push(chunk.slice());
+  }
+  return Buffer.concat(parts).toString("utf8");
+}
+
+// multipart/form-data with "kind", then optionally "category", then up to
+// MAX_FILES "file" parts. Each file is streamed to disk as it arrives; the
+// request body is never buffered.
+export async function POST(request: Request) {
+  // Uploads are published to every visitor, so they take the same token.
+  const token = process.env.SYNC_PUBLISH_TOKEN;
+  if (!token || request.headers.get("authorization") !== `Bearer ${token}`) {
+    return new Response("Unauthorized", { status: 401 });
+  }
+  const boundary = multipartBoundary(request.headers.get("content-type"));
+  if (!boundary || !request.body) return new Response("Expected multipart/form-data", { status: 400 });
+  if (Number(request.headers.get("content-length") ?? 0) > MAX_REQUEST_BYTES) {
+    return new Response(`Uploads are limited to ${MAX_REQUEST_BYTES} bytes per request`, { status: 413 });
+  }
+
+  let kind: JobKind | null = null;
+  let category: string | undefined;
+  const staged: StagedUpload[] = [];
+  let total = 0;
+  let parts = 0;
+  try {
+    for await (const part of readMultipart(request.body, boundary)) {
+      if (++parts > MAX_PARTS) throw new BadUploadError("Too many form parts");
+      if (part.filename === null) {
+        const value = await readField(part.chunks());
+        if (part.name === "kind") kind = JOB_KINDS.includes(value as JobKind) ? (value as JobKind) : null;
+        else if (part.name === "category") category = value;
+        continue;
+      }
+      if (part.name !== "file") continue;
+      if (!kind) throw new BadUploadError(`kind must be one of ${JOB_KINDS.join(", ")}, sent before any file`);
+      if (staged.length === MAX_FILES) throw new BadUploadError(`Send between 1 and ${MAX_FILES} files`);
+      const upload = await uploadPipeline.stage(
+        part.filename,
+        part.chunks(),
+        Math.min(MAX_FILE_BYTES, MAX_REQUEST_BYTES - total),
+      );
+      staged.push(upload);
+      total += upload.size;
+    }
+    if (!kind || staged.length === 0) throw new BadUploadError(`Send a kind and between 1 and ${MAX_FILES} files`);
+    const jobs = await uploadPipeline.submit(kind, staged, category);
+    return Response.json({ jobs }, { status: 202 });
+  } catch (error) {
+    await uploadPipeline.discard(staged);
+    if (error instanceof QueueFullError) {
+      return new Response(error.message, {
+        status: 503,
+        headers: { "Retry-After": String(error.retryAfter) },
+      });
+    }
+    if (error instanceof UploadTooLargeError) {
+      return new Response(
+        `Files are limited to ${MAX_FILE_BYTES} bytes each and ${MAX_REQUEST_BYTES} bytes per request`,
+        { status: 413 },
+      );
+    }
+    if (error instanceof BadUploadError || error instanceof MultipartError) {
+      return new Response(error.message, { status: 400 });
+    }
+    throw error;
+  }
+}
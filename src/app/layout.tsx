@@ -1,15 +1,31 @@
 import type { Metadata } from "next";
-import { Geist, Geist_Mono } from "next/font/google";
+import localFont from "next/font/local";
 import "./globals.css";
 
-const geistSans = Geist({
+import { RenderMode } from "@/components/render-mode";
+import { Telemetry } from "@/components/telemetry";
+import { RENDER_MODE_SCRIPT } from "@/lib/render-mode";
+
+// Generated by scripts/fonts.mjs (runs before every build).
+const geistSans = localFont({
+  src: "./fonts/geist-sans.woff2",
+  weight: "400 600",
   variable: "--font-geist-sans",
-  subsets: ["latin"],
+  display: "swap",
+  // Only the hero font is preloaded; Arial is metric-adjusted to match it
+  // so the swap doesn't shift layout.
+  preload: true,
+  adjustFontFallback: "Arial",
 });
 
-const geistMono = Geist_Mono({
+const geistMono = localFont({
+  src: "./fonts/geist-mono.woff2",
+  weight: "400",
   variable: "--font-geist-mono",
-  subsets: ["latin"],
+  display: "swap",
+  preload: false,
+  adjustFontFallback: false,
+  fallback: ["ui-monospace", "SFMono-Regular", "Menlo", "monospace"],
 });
 
 export const metadata: Metadata = {
@@ -23,10 +39,15 @@ export default function RootLayout({
   children: React.ReactNode;
 }>) {
   return (
-    <html lang="en">
+    <html lang="en" suppressHydrationWarning>
+      <head>
+        <script dangerouslySetInnerHTML={{ __html: RENDER_MODE_SCRIPT }} />
+      </head>
       <body
         className={`${geistSans.variable} ${geistMono.variable} antialiased`}
       >
+        <Telemetry />
+        <RenderMode />
         {children}
       </body>
     </html>
@@ -0,0 +1,38 @@
+import type { Metadata } from "next";
+import { notFound } from "next/navigation";
+
+import { Portfolio } from "@/components/portfolio";
+import { getTenantContent } from "@/lib/content-store";
+
+type Params = { tenant: string };
+
+// No tenant is rendered at build time. Each one is rendered on its first
+// request and then served from the cache until /api/revalidate purges it, so
+// adding a tenant never makes the build slower. The flip side is that tenant
+// pages miss every build-time HTML step: scripts/critical-css.mjs only sees
+// prerendered pages, so they load the full stylesheet up front.
+export const dynamicParams = true;
+export const revalidate = false;
+
+export async function generateStaticParams(): Promise<Params[]> {
+  return [];
+}
+
+export async function generateMetadata({
+  params,
+}: {
+  params: Promise<Params>;
+}): Promise<Metadata> {
+  const content = await getTenantContent((await params).tenant);
+  if (!content) return {};
+  return {
+    title: content.profile.name,
+    description: content.profile.headline,
+  };
+}
+
+export default async function TenantPage({ params }: { params: Promise<Params> }) {
+  const content = await getTenantContent((await params).tenant);
+  if (!content) notFound();
+  return <Portfolio tenant={content.tenant} profile={content.profile} />;
+}
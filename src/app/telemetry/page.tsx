@@ -0,0 +1,86 @@
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { TELEMETRY_WINDOW_MS, telemetryStore } from "@/lib/telemetry-store";
+
+export const dynamic = "force-dynamic";
+
+const sectionClasses = "max-w-6xl mx-auto px-4 sm:px-6 lg:px-8 py-16";
+
+function format(name: string, value: number) {
+  if (name === "CLS") return value.toFixed(3);
+  if (name === "frame-time") return `${value.toFixed(1)} ms`;
+  if (name === "upload-throughput") return `${(value / 1024 / 1024).toFixed(2)} MB/s`;
+  return `${Math.round(value)} ms`;
+}
+
+export default function TelemetryPage() {
+  const metrics = telemetryStore.summary();
+  const rows = telemetryStore.recentRows();
+
+  return (
+    <div className="min-h-screen bg-slate-950 text-slate-100">
+      <section className={`${sectionClasses} space-y-6`}>
+        <div>
+          <h1 className="text-2xl font-semibold text-slate-50">Real-user telemetry</h1>
+          <p className="text-sm text-slate-400 mt-1">
+            Percentiles over the last {TELEMETRY_WINDOW_MS / 60_000} minutes of sampled sessions.
+          </p>
+        </div>
+
+        <Card className="bg-slate-900/80 border-slate-800">
+          <CardHeader>
+            <CardTitle className="text-base text-slate-50">Percentiles</CardTitle>
+          </CardHeader>
+          <CardContent>
+            {metrics.length === 0 ? (
+              <p className="text-sm text-slate-400">No samples in the current window.</p>
+            ) : (
+              <table className="w-full text-sm text-slate-200">
+                <thead className="text-xs text-slate-400 text-left">
+                  <tr>
+                    <th className="py-1">Metric</th>
+                    <th>Samples</th>
+                    <th>p50</th>
+                    <th>p75</th>
+                    <th>p95</th>
+                    <th>p99</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {metrics.map((m) => (
+                    <tr key={m.name} className="border-t border-slate-800">
+                      <td className="py-1">{m.name}</td>
+                      <td>{m.count}</td>
+                      <td>{format(m.name, m.p50)}</td>
+                      <td>{format(m.name, m.p75)}</td>
+                      <td>{format(m.name, m.p95)}</td>
+                      <td>{format(m.name, m.p99)}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            )}
+          </CardContent>
+        </Card>
+
+        <Card className="bg-slate-900/80 border-slate-800">
+          <CardHeader>
+            <CardTitle className="text-base text-slate-50">Recent rows</CardTitle>
+            <CardDescription className="text-xs text-slate-400">
+              Raw rows are also appended to the telemetry directory under PORTFOLIO_DATA_DIR.
+            </CardDescription>
+          </CardHeader>
+          <CardContent>
+            <ul className="space-y-1 text-xs text-slate-300 font-mono">
+              {rows.map((row, i) => (
+                <li key={i} className="truncate">
+                  {new Date(row.ts).toISOString()} {row.page} {row.name}{" "}
+                  {format(row.name, row.value)} {row.detail ?? ""}
+                </li>
+              ))}
+            </ul>
+          </CardContent>
+        </Card>
+      </section>
+    </div>
+  );
+}
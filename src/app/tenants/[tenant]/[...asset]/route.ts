@@ -0,0 +1,53 @@
+import { createReadStream } from "node:fs";
+import fs from "node:fs/promises";
+import path from "node:path";
+import { Readable } from "node:stream";
+
+import { tenantAssetFile } from "@/lib/content-store";
+
+export const dynamic = "force-dynamic";
+
+// Inline-safe types. Anything else in a bundle is sent as a download so a
+// tenant's HTML or SVG never runs on this origin.
+const CONTENT_TYPES: Record<string, string> = {
+  ".pdf": "application/pdf",
+  ".png": "image/png",
+  ".jpg": "image/jpeg",
+  ".jpeg": "image/jpeg",
+  ".gif": "image/gif",
+  ".webp": "image/webp",
+};
+
+type Params = { tenant: string; asset: string[] };
+
+// Serves /tenants/<tenant>/... straight from the tenant's bundle
+// (content/tenants/<tenant>/assets/). Reading at request time means assets
+// added by `npm run tenants -- --revalidate` or an archive import are served
+// by a running deployment without a rebuild.
+export async function GET(request: Request, { params }: { params: Promise<Params> }) {
+  const { tenant, asset } = await params;
+  const file = tenantAssetFile(tenant, asset.join("/"));
+  if (!file) return new Response("Not found", { status: 404 });
+  let stat;
+  try {
+    stat = await fs.stat(file);
+  } catch {
+    return new Response("Not found", { status: 404 });
+  }
+  if (!stat.isFile()) return new Response("Not found", { status: 404 });
+
+  const etag = `"${stat.size.toString(16)}-${Math.floor(stat.mtimeMs).toString(16)}"`;
+  const contentType = CONTENT_TYPES[path.extname(file).toLowerCase()];
+  const headers = new Headers({
+    "Content-Type": contentType ?? "application/octet-stream",
+    "Content-Length": String(stat.size),
+    "Cache-Control": "public, max-age=0, must-revalidate",
+    "Last-Modified": stat.mtime.toUTCString(),
+    "X-Content-Type-Options": "nosniff",
+    ETag: etag,
+  });
+  if (!contentType) headers.set("Content-Disposition", "attachment");
+  if (request.headers.get("if-none-match") === etag) return new Response(null, { status: 304, headers });
+  const body = Readable.toWeb(createReadStream(file)) as ReadableStream<Uint8Array>;
+  return new Response(body, { headers });
+}
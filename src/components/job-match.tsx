@@ -0,0 +1,138 @@
+"use client";
+
+import * as React from "react";
+import { ExternalLink, Search } from "lucide-react";
+
+import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogHeader,
+  DialogTitle,
+  DialogTrigger,
+} from "@/components/ui/dialog";
+import { Textarea } from "@/components/ui/textarea";
+import type { MatchResponse, MatchResult } from "@/lib/search-index";
+import { openPdf } from "@/lib/telemetry";
+
+// Lets a recruiter paste a job description and open the resume and projects
+// that fit it best, instead of every resume at once.
+export function JobMatch({ tenant }: { tenant: string }) {
+  const [text, setText] = React.useState("");
+  const [result, setResult] = React.useState<MatchResponse | null>(null);
+  const [error, setError] = React.useState<string | null>(null);
+  const [pending, setPending] = React.useState(false);
+
+  const submit = async (e: React.FormEvent) => {
+    e.preventDefault();
+    setPending(true);
+    setError(null);
+    try {
+      const response = await fetch("/api/match", {
+        method: "POST",
+        headers: { "content-type": "application/json" },
+        body: JSON.stringify({ text, tenant, limit: 3 }),
+      });
+      if (!response.ok) throw new Error(await response.text());
+      setResult(await response.json());
+    } catch (err) {
+      setResult(null);
+      setError(err instanceof Error ? err.message : "Matching failed");
+    } finally {
+      setPending(false);
+    }
+  };
+
+  return (
+    <Dialog>
+      <DialogTrigger asChild>
+        <Button
+          size="sm"
+          variant="outline"
+          className="rounded-lg border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+        >
+          <Search className="h-4 w-4 mr-2" />
+          Match a job
+        </Button>
+      </DialogTrigger>
+      <DialogContent className="bg-slate-950 border-slate-800 text-slate-100 sm:max-w-2xl">
+        <DialogHeader>
+          <DialogTitle>Match a job description</DialogTitle>
+          <DialogDescription className="text-slate-400">
+            Paste a job description to see the most relevant resume and projects.
+          </DialogDescription>
+        </DialogHeader>
+
+        <form onSubmit={submit} className="space-y-3">
+          <Textarea
+            required
+            rows={6}
+            placeholder="Paste the job description here..."
+            value={text}
+            onChange={(e) => setText(e.target.value)}
+            className="bg-slate-900 border-slate-700 text-sm resize-none"
+          />
+          <Button
+            type="submit"
+            disabled={pending || !text.trim()}
+            className="rounded-lg bg-sky-600 hover:bg-sky-500"
+          >
+            {pending ? "Matching..." : "Find matches"}
+          </Button>
+        </form>
+
+        {error && <p className="text-xs text-red-400">{error}</p>}
+
+        {result && (
+          <div className="grid gap-4 sm:grid-cols-2">
+            <MatchList title="Resumes" items={result.resumes} />
+            <MatchList title="Projects" items={result.projects} />
+          </div>
+        )}
+      </DialogContent>
+    </Dialog>
+  );
+}
+
+function MatchList({ title, items }: { title: string; items: MatchResult[] }) {
+  return (
+    <div className="space-y-2">
+      <h3 className="text-sm font-semibold text-slate-200">{title}</h3>
+      {items.length === 0 && <p className="text-xs text-slate-500">No matching terms.</p>}
+      {items.map((item) => (
+        <div
+          key={`${item.kind}-${item.category ?? ""}-${item.id}`}
+          className="rounded-md border border-slate-800 bg-slate-900/70 p-3 space-y-2"
+        >
+          <div className="flex items-center justify-between gap-2">
+            <span className="text-sm text-white truncate">{item.title}</span>
+            {item.url && (
+              <button
+                type="button"
+                className="text-sky-400 hover:text-sky-300"
+                onClick={() =>
+                  item.kind === "resume" ? openPdf(item.url!) : window.open(item.url, "_blank")
+                }
+              >
+                <ExternalLink className="h-3 w-3" />
+              </button>
+            )}
+          </div>
+          <div className="flex flex-wrap gap-1">
+            {item.matchedTerms.map((term) => (
+              <Badge
+                key={term}
+                variant="outline"
+                className="border-slate-700 text-slate-300 text-[10px]"
+              >
+                {term}
+              </Badge>
+            ))}
+          </div>
+        </div>
+      ))}
+    </div>
+  );
+}
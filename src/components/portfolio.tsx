@@ -0,0 +1,76 @@
+import { Suspense } from "react";
+
+import { CertificatesSection } from "@/components/sections/certificates";
+import { ContactSection } from "@/components/sections/contact";
+import { SiteFooter } from "@/components/sections/footer";
+import { SiteHeader } from "@/components/sections/header";
+import { Hero } from "@/components/sections/hero";
+import { InternshipsSection } from "@/components/sections/internships";
+import { ProjectsSection } from "@/components/sections/projects";
+import { ResumesSection } from "@/components/sections/resumes";
+import { SectionSkeleton } from "@/components/sections/skeleton";
+import { SkillsSection } from "@/components/sections/skills";
+import type { PortfolioContent } from "@/lib/content";
+import { getSection } from "@/lib/content-store";
+
+// The header and hero only need the profile and are sent in the first flush.
+// Every other section loads its own data behind its own Suspense boundary,
+// so a slow source delays that section alone and never the first byte. See
+// getSection for when sections actually stream today.
+export function Portfolio({ tenant, profile }: { tenant: string; profile: PortfolioContent["profile"] }) {
+  return (
+    <div className="min-h-screen bg-slate-950 text-slate-100">
+      <SiteHeader profile={profile} />
+      <Hero profile={profile} />
+
+      <Suspense fallback={<SectionSkeleton id="skills" cards={1} columns={1} cardHeight="h-56" />}>
+        <Skills tenant={tenant} />
+      </Suspense>
+      <Suspense fallback={<SectionSkeleton id="internships" cards={2} />}>
+        <Internships tenant={tenant} />
+      </Suspense>
+      <Suspense fallback={<SectionSkeleton id="resumes" cards={3} columns={3} cardHeight="h-32" />}>
+        <Resumes tenant={tenant} />
+      </Suspense>
+      <Suspense fallback={<SectionSkeleton id="projects" cards={4} />}>
+        <Projects tenant={tenant} />
+      </Suspense>
+      <Suspense fallback={<SectionSkeleton id="certificates" cards={2} cardHeight="h-28" />}>
+        <Certificates tenant={tenant} />
+      </Suspense>
+      <Suspense fallback={<SectionSkeleton id="contact" cards={2} cardHeight="h-96" />}>
+        <Contact tenant={tenant} profile={profile} />
+      </Suspense>
+
+      <SiteFooter profile={profile} />
+    </div>
+  );
+}
+
+async function Skills({ tenant }: { tenant: string }) {
+  return <SkillsSection skills={await getSection(tenant, "skills")} />;
+}
+
+async function Internships({ tenant }: { tenant: string }) {
+  return <InternshipsSection internships={await getSection(tenant, "internships")} />;
+}
+
+async function Resumes({ tenant }: { tenant: string }) {
+  return <ResumesSection tenant={tenant} initialResumes={await getSection(tenant, "resumes")} />;
+}
+
+async function Projects({ tenant }: { tenant: string }) {
+  const [categories, projects] = await Promise.all([
+    getSection(tenant, "projectCategories"),
+    getSection(tenant, "projects"),
+  ]);
+  return <ProjectsSection tenant={tenant} categories={categories} initialProjects={projects} />;
+}
+
+async function Certificates({ tenant }: { tenant: string }) {
+  return <CertificatesSection tenant={tenant} initialCertificates={await getSection(tenant, "certificates")} />;
+}
+
+async function Contact({ tenant, profile }: { tenant: string; profile: PortfolioContent["profile"] }) {
+  return <ContactSection profile={profile} availability={await getSection(tenant, "availability")} />;
+}
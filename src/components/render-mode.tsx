@@ -0,0 +1,40 @@
+"use client";
+
+import * as React from "react";
+
+import {
+  currentRenderMode,
+  JANK_THRESHOLD_MS,
+  percentile,
+  sampleFrames,
+  setRenderMode,
+} from "@/lib/render-mode";
+import { record } from "@/lib/telemetry";
+
+const SAMPLE_FRAMES = 90;
+
+// Measures frame times during the first scroll of the page. The p90 is
+// reported as the "frame-time" metric, tagged with the render mode. A session
+// in full mode that scrolls with visible jank drops to lite mode for the rest
+// of the session. Forced modes (?render=) are measured but never switched.
+export function RenderMode() {
+  React.useEffect(() => {
+    let cancelled = false;
+    const onScroll = async () => {
+      window.removeEventListener("scroll", onScroll);
+      const mode = currentRenderMode();
+      const p90 = percentile(await sampleFrames(SAMPLE_FRAMES), 90);
+      if (cancelled) return;
+      record("frame-time", p90, mode);
+      const forced = document.documentElement.dataset.renderForced !== undefined;
+      if (mode === "full" && !forced && p90 > JANK_THRESHOLD_MS) setRenderMode("lite");
+    };
+    window.addEventListener("scroll", onScroll, { passive: true });
+    return () => {
+      cancelled = true;
+      window.removeEventListener("scroll", onScroll);
+    };
+  }, []);
+
+  return null;
+}
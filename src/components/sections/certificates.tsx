@@ -0,0 +1,115 @@
+"use client";
+
+import * as React from "react";
+import { Award } from "lucide-react";
+
+import { UploadButton } from "@/components/sections/upload-button";
+import { jobStatusLabel, uploadToServer } from "@/components/sections/uploads";
+import { Button } from "@/components/ui/button";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { useContentSync } from "@/hooks/use-content-sync";
+import { useIsAdmin } from "@/hooks/use-is-admin";
+import { useJobStatuses } from "@/hooks/use-job-statuses";
+import { sectionClasses, type Certificate } from "@/lib/content";
+import { applyPatch } from "@/lib/content-sync";
+import { openPdf } from "@/lib/telemetry";
+import { describeSkipped, preprocessUploads } from "@/lib/upload-preprocess";
+
+export function CertificatesSection({
+  tenant,
+  initialCertificates,
+}: {
+  tenant: string;
+  initialCertificates: Certificate[];
+}) {
+  const [certificates, setCertificates] = React.useState<Certificate[]>(initialCertificates);
+  const isAdmin = useIsAdmin();
+
+  useContentSync(tenant, (patch) => {
+    if (patch.collection === "certificates") setCertificates((prev) => applyPatch(prev, patch));
+  });
+
+  const jobs = useJobStatuses(certificates.flatMap((c) => (c.jobId ? [c.jobId] : [])));
+
+  const handleCertificateUpload = async (files: File[]) => {
+    const knownHashes = certificates.flatMap((c) => (c.hash ? [c.hash] : []));
+    let result;
+    try {
+      result = await preprocessUploads(files, "certificate", knownHashes);
+    } catch (error) {
+      window.alert(`Upload failed: ${(error as Error).message}`);
+      return;
+    }
+    const skipped = describeSkipped(result);
+    if (skipped) window.alert(skipped);
+
+    const jobIds = await uploadToServer("certificate", result.accepted.map((u) => u.file));
+    const newCerts: Certificate[] = result.accepted.map(({ file, hash }, idx) => ({
+      id: Date.now() + idx,
+      name: file.name,
+      url: URL.createObjectURL(file),
+      hash,
+      jobId: jobIds[idx],
+    }));
+    setCertificates((prev) => [...prev, ...newCerts]);
+  };
+
+  return (
+    <section id="certificates" className={`${sectionClasses} cv-auto [--cv-size:480px]`}>
+      <div className="flex items-center justify-between mb-6">
+        <div>
+         <h2 className="text-2xl font-semibold text-slate-50">Certificates</h2>
+         <p className="text-sm text-slate-400 mt-1">
+           Upload and manage your certifications with a professional layout.
+         </p>
+        </div>
+        {isAdmin && <UploadButton kind="certificate" label="Add Certificates" onFiles={handleCertificateUpload} />}
+      </div>
+
+      <div className="grid gap-4 md:grid-cols-2">
+        {certificates.length === 0 && (
+        <Card className="bg-slate-900/70 border-slate-800">
+          <CardHeader>
+            <CardTitle className="flex items-center gap-2 text-base">
+              <Award className="h-4 w-4 text-sky-400" />
+              No certificates uploaded yet
+            </CardTitle>
+            <CardDescription className="text-sm text-slate-400">
+              Upload your certificates to view them here. Each file will get a &quot;View
+              Certificate&quot; button.
+            </CardDescription>
+          </CardHeader>
+        </Card>
+      )}
+
+       {certificates.map((cert) => (
+         <Card key={cert.id} className="bg-slate-900/70 border-slate-800">
+           <CardHeader>
+             <CardTitle className="flex items-center justify-between text-base">
+               <div className="flex items-center gap-2">
+                 <Award className="h-4 w-4 text-sky-400" />
+                 <span className="truncate text-white">{cert.name}</span>
+               </div>
+             </CardTitle>
+           </CardHeader>
+           <CardContent className="flex justify-between items-center pt-0 pb-4">
+             <p className="text-xs text-slate-400">
+               {cert.jobId
+                 ? jobStatusLabel(jobs[cert.jobId])
+                 : "Click below to open in a new tab. (Local preview link)"}
+             </p>
+             <Button
+               size="sm"
+               variant="outline"
+               className="rounded-md border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+               onClick={() => openPdf(cert.url)}
+              >
+                View Certificate
+              </Button>
+            </CardContent>
+          </Card>
+        ))}
+      </div>
+    </section>
+  );
+}
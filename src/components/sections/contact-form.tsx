@@ -0,0 +1,86 @@
+"use client";
+
+import * as React from "react";
+import { Send } from "lucide-react";
+
+import { Button } from "@/components/ui/button";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { Input } from "@/components/ui/input";
+import { Textarea } from "@/components/ui/textarea";
+
+export function ContactForm() {
+  const [contactForm, setContactForm] = React.useState({
+    name: "",
+    email: "",
+    message: "",
+  });
+
+  const handleContactSubmit = (e: React.FormEvent) => {
+   e.preventDefault();
+   // Simple mock: show browser alert instead of toast
+   window.alert("Message sent. Your message has been recorded (mock).");
+   setContactForm({ name: "", email: "", message: "" });
+  };
+
+  return (
+    <Card className="bg-slate-900/80 border-slate-800">
+      <CardHeader>
+        <CardTitle className="text-base flex items-center gap-2 text-white">
+          <Send className="h-4 w-4 text-sky-400" />
+          Contact Form
+        </CardTitle>
+        <CardDescription className="text-xs text-slate-300">
+          Form submission is currently mocked and will show a toast notification.
+        </CardDescription>
+      </CardHeader>
+      <CardContent>
+        <form className="space-y-4" onSubmit={handleContactSubmit}>
+          <div className="space-y-1">
+            <label className="text-xs text-slate-300">Name</label>
+            <Input
+              required
+              placeholder="Your name"
+              value={contactForm.name}
+              onChange={(e) =>
+                setContactForm((f) => ({ ...f, name: e.target.value }))
+              }
+              className="bg-slate-950 border-slate-700 text-sm"
+            />
+          </div>
+          <div className="space-y-1">
+            <label className="text-xs text-slate-300">Email</label>
+            <Input
+              required
+              type="email"
+              placeholder="you@example.com"
+              value={contactForm.email}
+              onChange={(e) =>
+                setContactForm((f) => ({ ...f, email: e.target.value }))
+              }
+              className="bg-slate-950 border-slate-700 text-sm"
+            />
+          </div>
+          <div className="space-y-1">
+            <label className="text-xs text-slate-300">Message</label>
+            <Textarea
+              required
+              placeholder="Tell me about your project or opportunity..."
+              rows={4}
+              value={contactForm.message}
+              onChange={(e) =>
+                setContactForm((f) => ({ ...f, message: e.target.value }))
+              }
+              className="bg-slate-950 border-slate-700 text-sm resize-none"
+            />
+          </div>
+          <Button
+            type="submit"
+            className="rounded-lg bg-sky-600 hover:bg-sky-500 w-full sm:w-auto"
+          >
+            Send Message
+          </Button>
+        </form>
+      </CardContent>
+    </Card>
+  );
+}
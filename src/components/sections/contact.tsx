@@ -0,0 +1,93 @@
+import { Github, Linkedin, Mail } from "lucide-react";
+
+import { ContactForm } from "@/components/sections/contact-form";
+import { Card, CardContent } from "@/components/ui/card";
+import { sectionClasses, type PortfolioContent } from "@/lib/content";
+
+export function ContactSection({
+  profile,
+  availability,
+}: {
+  profile: PortfolioContent["profile"];
+  availability: PortfolioContent["availability"];
+}) {
+  return (
+    <section id="contact" className={`${sectionClasses} cv-auto [--cv-size:760px]`}>
+      <div className="grid gap-10 lg:grid-cols-[minmax(0,1.1fr)_minmax(0,1fr)] items-start">
+        <div>
+          <h2 className="text-2xl font-semibold text-slate-50 mb-2">Contact</h2>
+          <p className="text-sm text-slate-400 mb-6">
+            Let&apos;s connect for roles, collaborations or project discussions.
+          </p>
+
+          <div className="grid gap-4 sm:grid-cols-3 mb-6">
+            <Card className="bg-slate-900/70 border-slate-800">
+              <CardContent className="py-4 flex flex-col gap-2">
+                <div className="inline-flex items-center justify-center h-8 w-8 rounded-lg bg-sky-500/15 border border-sky-500/40">
+                  <Mail className="h-4 w-4 text-sky-400" />
+                </div>
+                <p className="text-xs font-medium text-slate-300">Email</p>
+                <a
+                  href={`mailto:${profile.email}`}
+                  className="text-xs text-sky-400 truncate hover:underline"
+                >
+                  {profile.email}
+                </a>
+              </CardContent>
+            </Card>
+
+            <Card className="bg-slate-900/70 border-slate-800">
+              <CardContent className="py-4 flex flex-col gap-2">
+                <div className="inline-flex items-center justify-center h-8 w-8 rounded-lg bg-sky-500/15 border border-sky-500/40">
+                  <Linkedin className="h-4 w-4 text-sky-400" />
+                </div>
+                <p className="text-xs font-medium text-slate-300">LinkedIn</p>
+                <a
+                  href={profile.linkedin}
+                  target="_blank"
+                  rel="noreferrer"
+                  className="text-xs text-sky-400 truncate hover:underline"
+                >
+                  {profile.linkedin}
+                </a>
+              </CardContent>
+            </Card>
+
+            <Card className="bg-slate-900/70 border-slate-800">
+              <CardContent className="py-4 flex flex-col gap-2">
+                <div className="inline-flex items-center justify-center h-8 w-8 rounded-lg bg-sky-500/15 border border-sky-500/40">
+                  <Github className="h-4 w-4 text-sky-400" />
+                </div>
+                <p className="text-xs font-medium text-slate-300">GitHub</p>
+                <a
+                  href={profile.github}
+                  target="_blank"
+                  rel="noreferrer"
+                  className="text-xs text-sky-400 truncate hover:underline"
+                >
+                  {profile.github}
+                </a>
+              </CardContent>
+            </Card>
+          </div>
+
+          <ContactForm />
+        </div>
+
+        <div className="hidden lg:block">
+          <Card className="bg-slate-900/80 border-slate-800 h-full">
+            <CardContent className="h-full flex flex-col justify-center gap-4">
+              <p className="text-sm text-slate-300">{availability.intro}</p>
+              <ul className="text-xs text-slate-300 space-y-2">
+                {availability.areas.map((area) => (
+                  <li key={area}>• {area}</li>
+                ))}
+              </ul>
+              <p className="text-xs text-slate-400">{availability.note}</p>
+            </CardContent>
+          </Card>
+        </div>
+      </div>
+    </section>
+  );
+}
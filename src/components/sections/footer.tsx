@@ -0,0 +1,33 @@
+import { ScrollLink } from "@/components/sections/scroll-button";
+import type { PortfolioContent } from "@/lib/content";
+
+export function SiteFooter({ profile }: { profile: PortfolioContent["profile"] }) {
+  return (
+    <footer className="border-t border-slate-800 bg-slate-950/95">
+      <div className="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8 py-6 flex flex-col sm:flex-row items-center justify-between gap-4 text-xs text-slate-500">
+        <p>© {new Date().getFullYear()} {profile.name}. All rights reserved.</p>
+        <div className="flex flex-wrap items-center gap-4">
+          <ScrollLink target="hero" className="hover:text-sky-400 transition-colors">
+            Back to top
+          </ScrollLink>
+          <a
+            href={profile.github}
+            target="_blank"
+            rel="noreferrer"
+            className="hover:text-sky-400"
+          >
+            GitHub
+          </a>
+          <a
+            href={profile.linkedin}
+            target="_blank"
+            rel="noreferrer"
+            className="hover:text-sky-400"
+          >
+            LinkedIn
+          </a>
+        </div>
+      </div>
+    </footer>
+  );
+}
@@ -0,0 +1,95 @@
+"use client";
+
+import * as React from "react";
+import { FileText, Menu, X } from "lucide-react";
+
+import { scrollToSection } from "@/components/sections/scroll-button";
+import { Button } from "@/components/ui/button";
+import type { PortfolioContent } from "@/lib/content";
+import { openPdf } from "@/lib/telemetry";
+
+const NAV = [
+  { id: "skills", label: "Skills" },
+  { id: "resumes", label: "Resumes" },
+  { id: "projects", label: "Projects" },
+  { id: "certificates", label: "Certificates" },
+  { id: "contact", label: "Contact" },
+];
+
+export function SiteHeader({ profile }: { profile: PortfolioContent["profile"] }) {
+  const [mobileOpen, setMobileOpen] = React.useState(false);
+
+  const navigate = (id: string) => {
+    scrollToSection(id);
+    setMobileOpen(false);
+  };
+
+  return (
+    <header className="sticky top-0 z-50 border-b border-slate-800 bg-slate-950/80 backdrop-blur lite:bg-slate-950 lite:backdrop-blur-none">
+      <div className="max-w-6xl mx-auto flex items-center justify-between px-4 sm:px-6 lg:px-8 h-16">
+        <div
+          className="flex items-center gap-2 cursor-pointer"
+          onClick={() => navigate("hero")}
+        >
+          <div className="h-8 w-8 rounded-xl bg-gradient-to-br from-sky-500 to-indigo-500" />
+          <span className="font-semibold tracking-tight text-slate-50">
+            {profile.name}
+          </span>
+        </div>
+
+        <nav className="hidden md:flex items-center gap-6 text-sm">
+          {NAV.map(({ id, label }) => (
+            <button key={id} onClick={() => navigate(id)} className="hover:text-sky-400">
+              {label}
+            </button>
+          ))}
+        </nav>
+
+        <div className="flex items-center gap-3">
+          <Button
+            variant="outline"
+            size="sm"
+            className="hidden sm:inline-flex border-sky-500/50 text-sky-400 hover:bg-sky-500/10"
+            onClick={() => openPdf(profile.resumeUrl)}
+          >
+            <FileText className="h-4 w-4 mr-1.5" />
+            View Resume
+          </Button>
+
+          <button
+            className="md:hidden inline-flex items-center justify-center rounded-lg border border-slate-700 p-1.5 hover:bg-slate-800"
+            onClick={() => setMobileOpen((o) => !o)}
+          >
+            {mobileOpen ? <X className="h-5 w-5" /> : <Menu className="h-5 w-5" />}
+          </button>
+        </div>
+      </div>
+
+      {/* Mobile nav */}
+      {mobileOpen && (
+        <div className="md:hidden border-t border-slate-800 bg-slate-950/95 backdrop-blur lite:bg-slate-950 lite:backdrop-blur-none">
+          <div className="px-4 py-3 flex flex-col gap-2 text-sm">
+            {NAV.map(({ id, label }) => (
+              <button
+                key={id}
+                className="text-left py-1 hover:text-sky-400"
+                onClick={() => navigate(id)}
+              >
+                {label}
+              </button>
+            ))}
+            <Button
+              variant="outline"
+              size="sm"
+              className="mt-2 border-sky-500/50 text-sky-400 hover:bg-sky-500/10"
+              onClick={() => openPdf(profile.resumeUrl)}
+            >
+              <FileText className="h-4 w-4 mr-1.5" />
+              View Resume
+            </Button>
+          </div>
+        </div>
+      )}
+    </header>
+  );
+}
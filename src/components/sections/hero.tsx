@@ -0,0 +1,95 @@
+import { ArrowRightCircle, Github, Linkedin, Mail } from "lucide-react";
+
+import { ScrollButton } from "@/components/sections/scroll-button";
+import { Badge } from "@/components/ui/badge";
+import { sectionClasses, type PortfolioContent } from "@/lib/content";
+
+export function Hero({ profile }: { profile: PortfolioContent["profile"] }) {
+  return (
+    <section
+      id="hero"
+      className="relative overflow-hidden bg-gradient-to-b from-slate-950 via-slate-900 to-slate-950 lite:bg-none lite:bg-slate-900"
+    >
+      <div className={`${sectionClasses} flex flex-col lg:flex-row items-center gap-10 lg:gap-16`}>
+        <div className="flex-1 space-y-6">
+          <Badge className="bg-sky-500/10 border-sky-500/40 text-sky-300 px-3 py-1 rounded-full">
+            {profile.focus}
+          </Badge>
+
+          <div className="space-y-2">
+            <h1 className="text-3xl sm:text-4xl lg:text-5xl font-semibold tracking-tight text-slate-50">
+              {profile.name}
+            </h1>
+            <p className="text-lg sm:text-xl text-slate-300">
+              {profile.headline}
+            </p>
+          </div>
+
+          <p className="max-w-xl text-slate-300 leading-relaxed text-sm sm:text-base">
+            {profile.summary}
+          </p>
+
+          <div className="flex flex-wrap items-center gap-3">
+            <ScrollButton
+              target="projects"
+              size="lg"
+              className="rounded-xl border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+            >
+              View Projects
+              <ArrowRightCircle className="h-4 w-4 ml-2" />
+            </ScrollButton>
+            <ScrollButton
+              target="contact"
+              size="lg"
+              variant="outline"
+              className="rounded-xl border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+            >
+              Get In Touch
+            </ScrollButton>
+          </div>
+
+          <div className="flex flex-wrap items-center gap-4 pt-2 text-sm text-slate-300">
+            <a
+              href={`mailto:${profile.email}`}
+              className="inline-flex items-center gap-2 hover:text-sky-400"
+            >
+              <Mail className="h-4 w-4" />
+              {profile.email}
+            </a>
+            <a
+              href={profile.github}
+              target="_blank"
+              rel="noreferrer"
+              className="inline-flex items-center gap-2 hover:text-sky-400"
+            >
+              <Github className="h-4 w-4" />
+              GitHub
+            </a>
+            <a
+              href={profile.linkedin}
+              target="_blank"
+              rel="noreferrer"
+              className="inline-flex items-center gap-2 hover:text-sky-400"
+            >
+              <Linkedin className="h-4 w-4" />
+              LinkedIn
+            </a>
+          </div>
+        </div>
+
+        <div className="flex-1 flex justify-center lg:justify-end">
+          <div className="relative">
+            <div className="absolute -inset-1 rounded-3xl bg-gradient-to-br from-sky-500/40 via-indigo-500/40 to-purple-500/40 blur-xl opacity-70 lite:bg-none lite:bg-sky-500/30 lite:blur-none" />
+            <div className="relative h-48 w-48 sm:h-56 sm:w-56 rounded-3xl bg-slate-900/80 border border-sky-500/40 flex items-center justify-center shadow-xl lite:shadow-none overflow-hidden">
+              <img
+                src={profile.photo}
+                alt={profile.name}
+                className="h-full w-full object-cover"
+              />
+            </div>
+          </div>
+        </div>
+      </div>
+    </section>
+  );
+}
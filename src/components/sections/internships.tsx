@@ -0,0 +1,44 @@
+import { PdfButton } from "@/components/sections/pdf-button";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { sectionClasses, type Internship } from "@/lib/content";
+
+export function InternshipsSection({ internships }: { internships: Internship[] }) {
+  return (
+    <section id="internships" className={`${sectionClasses} cv-auto [--cv-size:520px]`}>
+      <div className="mb-6">
+        <h2 className="text-2xl font-semibold text-slate-50">Internships & Training</h2>
+        <p className="text-sm text-slate-400 mt-1">
+          Professional experience and technical upskilling.
+        </p>
+      </div>
+
+      <div className="grid gap-4 md:grid-cols-2">
+        {internships.map((internship) => (
+          <Card key={internship.title} className="bg-slate-900/70 border-slate-800">
+            <CardHeader>
+              <CardTitle className="text-white">{internship.title}</CardTitle>
+              <CardDescription className="text-slate-400">
+                {internship.organization}
+              </CardDescription>
+            </CardHeader>
+
+            <CardContent>
+              <p className="text-sm text-slate-300">{internship.description}</p>
+
+              {internship.certificateUrl && (
+                <PdfButton
+                  url={internship.certificateUrl}
+                  size="sm"
+                  variant="outline"
+                  className="mt-4 border-slate-600 text-black-100 hover:bg-slate-800"
+                >
+                  View Certificate
+                </PdfButton>
+              )}
+            </CardContent>
+          </Card>
+        ))}
+      </div>
+    </section>
+  );
+}
@@ -0,0 +1,10 @@
+"use client";
+
+import * as React from "react";
+
+import { Button } from "@/components/ui/button";
+import { openPdf } from "@/lib/telemetry";
+
+export function PdfButton({ url, ...props }: React.ComponentProps<typeof Button> & { url: string }) {
+  return <Button {...props} onClick={() => openPdf(url)} />;
+}
@@ -0,0 +1,207 @@
+"use client";
+
+import * as React from "react";
+import { ExternalLink } from "lucide-react";
+
+import { UploadButton } from "@/components/sections/upload-button";
+import { jobStatusLabel, uploadToServer } from "@/components/sections/uploads";
+import { Button } from "@/components/ui/button";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
+import { useContentSync } from "@/hooks/use-content-sync";
+import { useIsAdmin } from "@/hooks/use-is-admin";
+import { useJobStatuses } from "@/hooks/use-job-statuses";
+import { sectionClasses, type Project, type ProjectCategory } from "@/lib/content";
+import { applyPatch, publishPatches } from "@/lib/content-sync";
+import { describeSkipped, preprocessUploads } from "@/lib/upload-preprocess";
+import type { JobView } from "@/lib/uploads";
+
+export function ProjectsSection({
+  tenant,
+  categories,
+  initialProjects,
+}: {
+  tenant: string;
+  categories: ProjectCategory[];
+  initialProjects: Record<string, Project[]>;
+}) {
+  const [projectsByCategory, setProjectsByCategory] =
+    React.useState<Record<string, Project[]>>(initialProjects);
+  const isAdmin = useIsAdmin();
+
+  const jobs = useJobStatuses(
+    Object.values(projectsByCategory)
+      .flat()
+      .flatMap((p) => (p.jobId ? [p.jobId] : [])),
+  );
+
+  useContentSync(tenant, (patch) => {
+    if (patch.collection !== "projects") return;
+    setProjectsByCategory((prev) => ({
+      ...prev,
+      [patch.category]: applyPatch(prev[patch.category] || [], patch),
+    }));
+  });
+
+  const handleProjectUpload = async (categoryKey: string, files: File[]) => {
+    const knownHashes = Object.values(projectsByCategory)
+      .flat()
+      .flatMap((p) => (p.hash ? [p.hash] : []));
+    let result;
+    try {
+      result = await preprocessUploads(files, "project", knownHashes);
+    } catch (error) {
+      window.alert(`Upload failed: ${(error as Error).message}`);
+      return;
+    }
+    const skipped = describeSkipped(result);
+    if (skipped) window.alert(skipped);
+
+    const jobIds = await uploadToServer(
+      "project",
+      result.accepted.map((u) => u.file),
+      categoryKey,
+    );
+    const newProjects: Project[] = result.accepted.map(({ file, hash }, index) => ({
+      id: Date.now() + index,
+      title: file.name,
+      description: "Uploaded project file from your system.",
+      link: URL.createObjectURL(file),
+      hash,
+      jobId: jobIds[index],
+    }));
+
+    setProjectsByCategory((prev) => ({
+      ...prev,
+      [categoryKey]: [...(prev[categoryKey] || []), ...newProjects],
+    }));
+
+    // Other visitors get the record without the blob: preview, which only
+    // resolves in this browser.
+    publishPatches(
+      tenant,
+      newProjects.map((project) => ({
+        collection: "projects",
+        op: "add",
+        id: project.id,
+        category: categoryKey,
+        value: { ...project, link: undefined },
+      })),
+    ).catch(() => {});
+  };
+
+  return (
+    <section id="projects" className={`${sectionClasses} cv-auto [--cv-size:880px]`}>
+      <div className="flex items-center justify-between mb-6">
+        <div>
+          <h2 className="text-2xl font-semibold text-slate-50">Featured Projects</h2>
+          <p className="text-sm text-slate-400 mt-1">
+            Explore work across Data Science, AI & LLMs, Machine Learning and Data Analytics.
+          </p>
+        </div>
+      </div>
+
+      <Tabs defaultValue={categories[0]?.key} className="space-y-4">
+        <TabsList className="bg-slate-900/80 border border-slate-800">
+          {categories.map((category) => (
+            <TabsTrigger
+              key={category.key}
+              value={category.key}
+              className="text-slate-100 data-[state=active]:bg-sky-600 data-[state=active]:text-white"
+            >
+              {category.label}
+            </TabsTrigger>
+          ))}
+        </TabsList>
+
+        {categories.map((category) => (
+          <ProjectsTab
+            key={category.key}
+            title={category.title}
+            description={category.description}
+            categoryKey={category.key}
+            projects={projectsByCategory[category.key] || []}
+            onUpload={isAdmin ? handleProjectUpload : undefined}
+            jobs={jobs}
+          />
+        ))}
+      </Tabs>
+    </section>
+  );
+}
+
+function ProjectsTab({
+  title,
+  description,
+  categoryKey,
+  projects,
+  onUpload,
+  jobs,
+}: {
+  title: string;
+  description: string;
+  categoryKey: string;
+  projects: Project[];
+  onUpload?: (categoryKey: string, files: File[]) => void;
+  jobs: Record<string, JobView>;
+}) {
+  return (
+    <TabsContent value={categoryKey} className="space-y-4">
+      <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-3">
+        <div>
+          <h3 className="text-lg font-medium text-slate-50">{title}</h3>
+          <p className="text-xs text-slate-400 mt-1">{description}</p>
+        </div>
+        {onUpload && (
+          <UploadButton kind="project" label="Upload Files" onFiles={(files) => onUpload(categoryKey, files)} />
+        )}
+      </div>
+
+      <div className="grid gap-4 md:grid-cols-2">
+        {projects.length === 0 && (
+          <Card className="bg-slate-900/70 border-slate-800">
+            <CardHeader>
+              <CardTitle className="text-sm text-slate-200">No projects yet</CardTitle>
+              <CardDescription className="text-xs text-slate-400">
+                Upload project files or link your GitHub repositories to populate this section.
+              </CardDescription>
+            </CardHeader>
+          </Card>
+        )}
+
+        {projects.map((project) => (
+          <Card key={project.id} className="bg-slate-900/80 border-slate-800 flex flex-col">
+            <CardHeader>
+              <CardTitle className="text-base text-slate-50 truncate">
+                {project.title}
+              </CardTitle>
+            </CardHeader>
+            <CardContent className="flex-1 flex flex-col justify-between gap-3">
+              <p className="text-xs text-slate-300">{project.description}</p>
+              <div className="flex justify-between items-center">
+                <span className="text-[10px] uppercase tracking-wide text-slate-500">
+                  {project.jobId
+                    ? jobStatusLabel(jobs[project.jobId])
+                    : project.link?.startsWith("blob:")
+                      ? "Local Upload"
+                      : "Linked Project"}
+                </span>
+                {project.link && (
+                  <Button
+                    size="sm"
+                    variant="outline"
+                    className="rounded-md border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+                    onClick={() => window.open(project.link, "_blank")}
+                  >
+                    <ExternalLink className="h-3 w-3 mr-1.5" />
+                    Open
+                  </Button>
+                )}
+              </div>
+            </CardContent>
+          </Card>
+        ))}
+      </div>
+    </TabsContent>
+  );
+}
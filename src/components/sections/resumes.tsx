@@ -0,0 +1,216 @@
+"use client";
+
+import * as React from "react";
+import { ExternalLink, Pencil, Plus, Trash2 } from "lucide-react";
+
+import { JobMatch } from "@/components/job-match";
+import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { Dialog, DialogContent, DialogHeader, DialogTitle } from "@/components/ui/dialog";
+import { Input } from "@/components/ui/input";
+import { useContentSync } from "@/hooks/use-content-sync";
+import { useIsAdmin } from "@/hooks/use-is-admin";
+import { sectionClasses, type Resume } from "@/lib/content";
+import { applyPatch, publishPatches, type ContentPatch } from "@/lib/content-sync";
+import { openPdf } from "@/lib/telemetry";
+
+export function ResumesSection({
+  tenant,
+  initialResumes,
+}: {
+  tenant: string;
+  initialResumes: Resume[];
+}) {
+  const [resumes, setResumes] = React.useState<Resume[]>(initialResumes);
+  const [editingResume, setEditingResume] = React.useState<Resume | null>(null);
+
+  const isAdmin = useIsAdmin();
+
+  useContentSync(tenant, (patch) => {
+    if (patch.collection === "resumes") setResumes((prev) => applyPatch(prev, patch));
+  });
+
+  const publish = (patch: ContentPatch) => {
+    setResumes((prev) => applyPatch(prev, patch));
+    publishPatches(tenant, [patch]).catch(() =>
+      window.alert("Saved locally, but the change could not be published to other visitors."),
+    );
+  };
+
+  const handleResumeSave = (resume: Resume) => {
+    const exists = resumes.some((r) => r.id === resume.id);
+    publish({ collection: "resumes", op: exists ? "update" : "add", id: resume.id, value: resume });
+    setEditingResume(null);
+  };
+
+  const handleResumeDelete = (id: number) => {
+    publish({ collection: "resumes", op: "delete", id });
+  };
+
+  return (
+    <section id="resumes" className={`${sectionClasses} cv-auto [--cv-size:340px]`}>
+      <div className="flex items-center justify-between mb-6">
+        <div>
+          <h2 className="text-2xl font-semibold text-slate-50">Featured Resumes</h2>
+          <p className="text-sm text-slate-400 mt-1">
+            Manage your core resumes and add more versions for different roles.
+          </p>
+        </div>
+        <div className="flex items-center gap-2">
+          {isAdmin && (
+            <Button
+              size="sm"
+              variant="outline"
+              className="rounded-lg border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+              onClick={() => setEditingResume({ id: 0, title: "", type: "", url: "" })}
+            >
+              <Plus className="h-4 w-4 mr-2" />
+              Add Resume
+            </Button>
+          )}
+          <JobMatch tenant={tenant} />
+        </div>
+      </div>
+
+      <div className="grid gap-4 md:grid-cols-3">
+        {resumes.map((resume) => (
+          <Card
+            key={resume.id}
+            className="bg-slate-900/70 border-slate-800 flex flex-col justify-between"
+          >
+            <CardHeader>
+              <CardTitle className="flex items-center justify-between gap-3 text-base">
+                <span className="truncate text-white">{resume.title}</span>
+                <Badge
+                  variant="outline"
+                  className="border-sky-500/60 text-sky-300 uppercase text-[10px]"
+                >
+                  {resume.type}
+                </Badge>
+              </CardTitle>
+              <CardDescription className="text-xs text-slate-400">
+                Click &quot;Open&quot; to view this resume in a new tab.
+              </CardDescription>
+            </CardHeader>
+            <CardContent className="flex items-center justify-start gap-2 pt-0 pb-4">
+              <Button
+                size="sm"
+                variant="outline"
+                className="rounded-md border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+                onClick={() => {
+                  if (resume.url) openPdf(resume.url);
+                }}
+              >
+              <ExternalLink className="h-3 w-3 mr-1.5" />
+              Open
+              </Button>
+              {isAdmin && (
+                <>
+                  <Button
+                    size="sm"
+                    variant="ghost"
+                    className="text-slate-400 hover:text-slate-100"
+                    onClick={() => setEditingResume(resume)}
+                  >
+                    <Pencil className="h-3 w-3" />
+                  </Button>
+                  <Button
+                    size="sm"
+                    variant="ghost"
+                    className="text-slate-400 hover:text-red-400"
+                    onClick={() => handleResumeDelete(resume.id)}
+                  >
+                    <Trash2 className="h-3 w-3" />
+                  </Button>
+                </>
+              )}
+            </CardContent>
+          </Card>
+        ))}
+      </div>
+
+      <Dialog open={editingResume !== null} onOpenChange={(open) => !open && setEditingResume(null)}>
+        <DialogContent className="bg-slate-950 border-slate-800 text-slate-100">
+          <DialogHeader>
+            <DialogTitle>{editingResume?.id ? "Edit Resume" : "Add Resume"}</DialogTitle>
+          </DialogHeader>
+          {editingResume && (
+            <ResumeForm
+              resume={editingResume}
+              onSave={handleResumeSave}
+              onCancel={() => setEditingResume(null)}
+            />
+          )}
+        </DialogContent>
+      </Dialog>
+    </section>
+  );
+}
+
+function ResumeForm({
+  resume,
+  onSave,
+  onCancel,
+}: {
+  resume: Resume;
+  onSave: (r: Resume) => void;
+  onCancel: () => void;
+}) {
+  const [form, setForm] = React.useState<Resume>(resume);
+
+  return (
+    <form
+      className="space-y-4 mt-2"
+      onSubmit={(e) => {
+        e.preventDefault();
+        const id = form.id || Date.now();
+        onSave({ ...form, id });
+      }}
+    >
+      <div className="space-y-1">
+        <label className="text-xs text-slate-300">Title</label>
+        <Input
+          required
+          value={form.title}
+          onChange={(e) => setForm((f) => ({ ...f, title: e.target.value }))}
+          placeholder="Data Science Resume"
+          className="bg-slate-950 border-slate-700 text-sm"
+        />
+      </div>
+      <div className="space-y-1">
+        <label className="text-xs text-slate-300">Type (DS, DA, etc.)</label>
+        <Input
+          required
+          value={form.type}
+          onChange={(e) => setForm((f) => ({ ...f, type: e.target.value }))}
+          placeholder="DS"
+          className="bg-slate-950 border-slate-700 text-sm"
+        />
+      </div>
+      <div className="space-y-1">
+        <label className="text-xs text-slate-300">Resume URL</label>
+        <Input
+          required
+          value={form.url}
+          onChange={(e) => setForm((f) => ({ ...f, url: e.target.value }))}
+          placeholder="/resumes/data-science-resume.pdf"
+          className="bg-slate-950 border-slate-700 text-sm"
+        />
+      </div>
+      <div className="flex justify-end gap-2 pt-2">
+        <Button
+          type="button"
+          variant="ghost"
+          className="text-slate-400 hover:text-slate-100"
+          onClick={onCancel}
+        >
+          Cancel
+        </Button>
+        <Button type="submit" className="bg-sky-600 hover:bg-sky-500">
+          Save
+        </Button>
+      </div>
+    </form>
+  );
+}
@@ -0,0 +1,19 @@
+"use client";
+
+import * as React from "react";
+
+import { Button } from "@/components/ui/button";
+
+export function scrollToSection(id: string) {
+  document.getElementById(id)?.scrollIntoView({ behavior: "smooth", block: "start" });
+}
+
+// Let server-rendered sections scroll to another section without becoming
+// client components themselves.
+export function ScrollButton({ target, ...props }: React.ComponentProps<typeof Button> & { target: string }) {
+  return <Button {...props} onClick={() => scrollToSection(target)} />;
+}
+
+export function ScrollLink({ target, ...props }: React.ComponentProps<"button"> & { target: string }) {
+  return <button type="button" {...props} onClick={() => scrollToSection(target)} />;
+}
@@ -0,0 +1,34 @@
+import { sectionClasses } from "@/lib/content";
+
+// Placeholder streamed in place of a section while its data loads. It keeps
+// the section's id so header navigation works before the content arrives,
+// and roughly the section's height so the page doesn't jump when it does.
+export function SectionSkeleton({
+  id,
+  cards,
+  columns = 2,
+  cardHeight = "h-40",
+}: {
+  id: string;
+  cards: number;
+  columns?: 1 | 2 | 3;
+  cardHeight?: string;
+}) {
+  const grid = { 1: "", 2: "md:grid-cols-2", 3: "md:grid-cols-3" }[columns];
+  return (
+    <section id={id} className={sectionClasses} aria-busy="true">
+      <div className="mb-6 space-y-2 animate-pulse lite:animate-none">
+        <div className="h-7 w-56 rounded-md bg-slate-800" />
+        <div className="h-4 w-80 max-w-full rounded-md bg-slate-900" />
+      </div>
+      <div className={`grid gap-4 ${grid}`}>
+        {Array.from({ length: cards }, (_, i) => (
+          <div
+            key={i}
+            className={`${cardHeight} rounded-xl border border-slate-800 bg-slate-900/50 animate-pulse lite:animate-none`}
+          />
+        ))}
+      </div>
+    </section>
+  );
+}
@@ -0,0 +1,79 @@
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
+import { sectionClasses, type PortfolioContent } from "@/lib/content";
+
+export function SkillsSection({ skills }: { skills: PortfolioContent["skills"] }) {
+  return (
+    <section id="skills" className={`${sectionClasses} cv-auto [--cv-size:440px]`}>
+      <div className="mb-6">
+        <h2 className="text-2xl font-semibold text-slate-50">Skills & Tools</h2>
+        <p className="text-sm text-slate-400 mt-1">
+          Core technical skills and the tools I use to build data & AI solutions.
+        </p>
+      </div>
+
+      <Tabs defaultValue="technical" className="space-y-4">
+        <TabsList className="bg-slate-900/80 border border-slate-800">
+          <TabsTrigger
+            value="technical"
+            className="text-slate-100 data-[state=active]:bg-sky-600 data-[state=active]:text-white"
+          >
+            Technical Skills
+          </TabsTrigger>
+          <TabsTrigger
+            value="tools"
+            className="text-slate-100 data-[state=active]:bg-sky-600 data-[state=active]:text-white"
+          >
+            Tools &amp; Software
+          </TabsTrigger>
+        </TabsList>
+
+        {/* Technical Skills tab */}
+        <TabsContent value="technical">
+          <Card className="bg-slate-900/80 border-slate-800">
+            <CardHeader>
+              <CardTitle className="text-base text-slate-50">
+                Technical Skills
+              </CardTitle>
+              <CardDescription className="text-xs text-slate-400">
+                Languages, libraries and core data / ML capabilities.
+              </CardDescription>
+            </CardHeader>
+            <CardContent>
+              <div className="grid grid-cols-2 sm:grid-cols-3 gap-2 text-sm text-slate-200">
+                {skills.technical.map((skill) => (
+                  <span key={skill} className="bg-slate-950 rounded-md px-2 py-1">
+                    {skill}
+                  </span>
+                ))}
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+
+        {/* Tools & Software tab */}
+        <TabsContent value="tools">
+          <Card className="bg-slate-900/80 border-slate-800">
+            <CardHeader>
+              <CardTitle className="text-base text-slate-50">
+                Tools &amp; Software
+              </CardTitle>
+              <CardDescription className="text-xs text-slate-400">
+                Platforms and tooling I use in projects and internships.
+              </CardDescription>
+            </CardHeader>
+            <CardContent>
+              <div className="grid grid-cols-2 sm:grid-cols-3 gap-2 text-sm text-slate-200">
+                {skills.tools.map((skill) => (
+                  <span key={skill} className="bg-slate-950 rounded-md px-2 py-1">
+                    {skill}
+                  </span>
+                ))}
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+      </Tabs>
+    </section>
+  );
+}
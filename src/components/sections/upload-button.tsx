@@ -0,0 +1,46 @@
+"use client";
+
+import * as React from "react";
+import { Upload } from "lucide-react";
+
+import { Button } from "@/components/ui/button";
+import { UPLOAD_LIMITS, type UploadKind } from "@/lib/upload-preprocess";
+
+// A `multiple` file picker behind a button. The input is cleared after each
+// pick so choosing the same files again still fires a change.
+export function UploadButton({
+  kind,
+  label,
+  onFiles,
+}: {
+  kind: UploadKind;
+  label: string;
+  onFiles: (files: File[]) => void;
+}) {
+  const input = React.useRef<HTMLInputElement>(null);
+  return (
+    <>
+      <input
+        ref={input}
+        type="file"
+        multiple
+        accept={UPLOAD_LIMITS[kind].mimeTypes.join(",")}
+        className="hidden"
+        onChange={(event) => {
+          const files = Array.from(event.target.files ?? []);
+          event.target.value = "";
+          if (files.length > 0) onFiles(files);
+        }}
+      />
+      <Button
+        size="sm"
+        variant="outline"
+        className="rounded-lg border-slate-600 bg-slate-900 text-slate-100 hover:bg-slate-800"
+        onClick={() => input.current?.click()}
+      >
+        <Upload className="h-4 w-4 mr-2" />
+        {label}
+      </Button>
+    </>
+  );
+}
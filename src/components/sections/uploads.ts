@@ -0,0 +1,31 @@
+import { submitUploads, UploadRejectedError, type JobKind, type JobView } from "@/lib/uploads";
+
+// Sends preprocessed files to the processing pipeline. Failures keep the
+// local blob previews so nothing the visitor dropped disappears.
+export async function uploadToServer(kind: JobKind, files: File[], category?: string) {
+  if (files.length === 0) return [];
+  try {
+    const submitted = await submitUploads(kind, files, category);
+    return submitted.map((job) => job.id);
+  } catch (error) {
+    window.alert(
+      error instanceof UploadRejectedError && error.retryAfter !== null
+        ? `Uploads are busy right now; try again in ${error.retryAfter}s. Files are shown as local previews only.`
+        : "Upload failed. Files are shown as local previews only.",
+    );
+    return [];
+  }
+}
+
+export function jobStatusLabel(job: JobView | undefined) {
+  switch (job?.status) {
+    case "done":
+      return "Processed";
+    case "failed":
+      return `Processing failed: ${job.error ?? "unknown error"}`;
+    case "running":
+      return "Processing…";
+    default:
+      return "Queued for processing";
+  }
+}
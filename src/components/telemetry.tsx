@@ -0,0 +1,37 @@
+"use client";
+
+import * as React from "react";
+import { useReportWebVitals } from "next/web-vitals";
+
+import { flush, record } from "@/lib/telemetry";
+
+export function Telemetry() {
+  useReportWebVitals((metric) => {
+    record(metric.name as Parameters<typeof record>[0], metric.value, metric.rating);
+  });
+
+  React.useEffect(() => {
+    let observer: PerformanceObserver | null = null;
+    try {
+      observer = new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) record("long-task", entry.duration);
+      });
+      observer.observe({ type: "longtask", buffered: true });
+    } catch {
+      // Long Tasks API is Chromium-only.
+    }
+
+    const onHidden = () => {
+      if (document.visibilityState === "hidden") flush();
+    };
+    document.addEventListener("visibilitychange", onHidden);
+    window.addEventListener("pagehide", flush);
+    return () => {
+      observer?.disconnect();
+      document.removeEventListener("visibilitychange", onHidden);
+      window.removeEventListener("pagehide", flush);
+    };
+  }, []);
+
+  return null;
+}
@@ -0,0 +1,55 @@
+"use client";
+
+import * as React from "react";
+
+import type { ContentPatch, VersionedPatch } from "@/lib/content-sync";
+
+type Listener = (patch: ContentPatch) => void;
+type Connection = { source: EventSource; listeners: Set<Listener> };
+
+// Every section on the page shares one EventSource per tenant.
+const connections = new Map<string, Connection>();
+
+function connect(tenant: string) {
+  let connection = connections.get(tenant);
+  if (connection) return connection;
+  const source = new EventSource(`/api/sync?tenant=${encodeURIComponent(tenant)}`);
+  const listeners = new Set<Listener>();
+  let patched = false;
+  source.addEventListener("patch", (event) => {
+    patched = true;
+    for (const patch of JSON.parse((event as MessageEvent<string>).data) as VersionedPatch[]) {
+      for (const listener of listeners) listener(patch);
+    }
+  });
+  // The server no longer has every patch this page is missing. A page that
+  // has applied patches may now be out of step, so it reloads; a page that
+  // hasn't is already what a reload would render.
+  source.addEventListener("reset", () => {
+    if (patched) window.location.reload();
+  });
+  connection = { source, listeners };
+  connections.set(tenant, connection);
+  return connection;
+}
+
+// Calls onPatch for every live content change published for the tenant.
+export function useContentSync(tenant: string, onPatch: Listener) {
+  const latest = React.useRef(onPatch);
+  React.useEffect(() => {
+    latest.current = onPatch;
+  });
+
+  React.useEffect(() => {
+    const connection = connect(tenant);
+    const listener: Listener = (patch) => latest.current(patch);
+    connection.listeners.add(listener);
+    return () => {
+      connection.listeners.delete(listener);
+      if (connection.listeners.size === 0) {
+        connection.source.close();
+        connections.delete(tenant);
+      }
+    };
+  }, [tenant]);
+}
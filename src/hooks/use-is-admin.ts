@@ -0,0 +1,15 @@
+"use client";
+
+import * as React from "react";
+
+import { adminToken } from "@/lib/content-sync";
+
+// Editing and upload controls are only shown to sessions holding the admin
+// token. It is read after mount so the server render and hydration agree.
+export function useIsAdmin() {
+  const [isAdmin, setIsAdmin] = React.useState(false);
+  React.useEffect(() => {
+    setIsAdmin(adminToken() !== null);
+  }, []);
+  return isAdmin;
+}
@@ -0,0 +1,33 @@
+"use client";
+
+import * as React from "react";
+
+import { fetchJobs, isTerminal, type JobView } from "@/lib/uploads";
+
+// Polls the job status endpoint until every listed job has finished.
+export function useJobStatuses(ids: string[], intervalMs = 1500) {
+  const [jobs, setJobs] = React.useState<Record<string, JobView>>({});
+  const pendingKey = ids.filter((id) => !isTerminal(jobs[id]?.status)).join(",");
+
+  React.useEffect(() => {
+    if (!pendingKey) return;
+    let cancelled = false;
+    const poll = async () => {
+      try {
+        const updates = await fetchJobs(pendingKey.split(","));
+        if (cancelled) return;
+        setJobs((prev) => ({ ...prev, ...Object.fromEntries(updates.map((job) => [job.id, job])) }));
+      } catch {
+        // Try again on the next tick.
+      }
+    };
+    void poll();
+    const timer = setInterval(poll, intervalMs);
+    return () => {
+      cancelled = true;
+      clearInterval(timer);
+    };
+  }, [pendingKey, intervalMs]);
+
+  return jobs;
+}
@@ -0,0 +1,402 @@
+import crypto from "node:crypto";
+import { createReadStream } from "node:fs";
+import fs from "node:fs/promises";
+import path from "node:path";
+
+import {
+  readTar,
+  tarEnd,
+  tarEntryHeader,
+  tarPadded,
+  tarPadding,
+  TarFormatError,
+  type TarEntry,
+} from "@/lib/archive/tar";
+import { hashFile } from "@/lib/asset-hash";
+import type { PortfolioContent } from "@/lib/content";
+import { assetFile, getTenantContent, tenantAssetFile, tenantDir } from "@/lib/content-store";
+import { dataPath } from "@/lib/data-dir";
+
+// A portfolio archive is a tar stream of, in order:
+//   manifest.json   every referenced asset with its size and SHA-256
+//   content.json    the tenant's content bundle
+//   assets/...      the asset files, minus any the receiver already has
+// The manifest comes first so an import can check each file as it arrives.
+
+const FORMAT = 1;
+const MAX_JSON_BYTES = 1024 * 1024;
+const MAX_IMPORT_BYTES = Number(process.env.IMPORT_MAX_BYTES ?? 200 * 1024 * 1024);
+const REQUIRED_KEYS = [
+  "profile",
+  "skills",
+  "internships",
+  "resumes",
+  "projectCategories",
+  "projects",
+  "certificates",
+  "availability",
+] as const;
+
+// Leading bytes each accepted asset type must start with.
+const SIGNATURES: Record<string, number[][]> = {
+  ".pdf": [[0x25, 0x50, 0x44, 0x46, 0x2d]],
+  ".png": [[0x89, 0x50, 0x4e, 0x47]],
+  ".jpg": [[0xff, 0xd8, 0xff]],
+  ".jpeg": [[0xff, 0xd8, 0xff]],
+  ".gif": [[0x47, 0x49, 0x46, 0x38]],
+  ".webp": [[0x52, 0x49, 0x46, 0x46]],
+};
+
+export type ArchiveAsset = {
+  path: string;
+  url: string;
+  size: number;
+  sha256: string;
+  // False when the exporter left the file out because the receiver has it.
+  included: boolean;
+};
+
+export type ArchiveManifest = {
+  format: number;
+  tenant: string;
+  exportedAt: string;
+  assets: ArchiveAsset[];
+};
+
+export type ImportSummary = {
+  tenant: string;
+  received: number;
+  reused: number;
+  bytes: number;
+};
+
+export class ArchiveError extends Error {
+  constructor(
+    readonly status: number,
+    message: string,
+  ) {
+    super(message);
+  }
+}
+
+function withoutTenant(content: PortfolioContent): Omit<PortfolioContent, "tenant"> {
+  const bundle: Partial<PortfolioContent> = { ...content };
+  delete bundle.tenant;
+  return bundle as Omit<PortfolioContent, "tenant">;
+}
+
+// Every local asset URL a content bundle points at, rewritten through `map`.
+function mapAssetUrls(content: PortfolioContent, map: (url: string) => string): PortfolioContent {
+  const local = (url: string | undefined) => (url && url.startsWith("/") && !url.startsWith("//") ? map(url) : url);
+  return {
+    ...content,
+    profile: {
+      ...content.profile,
+      photo: local(content.profile.photo)!,
+      resumeUrl: local(content.profile.resumeUrl)!,
+    },
+    resumes: content.resumes.map((r) => ({ ...r, url: local(r.url)! })),
+    certificates: content.certificates.map((c) => ({ ...c, url: local(c.url)! })),
+    internships: content.internships.map((i) => ({ ...i, certificateUrl: local(i.certificateUrl) })),
+    projects: Object.fromEntries(
+      Object.entries(content.projects).map(([key, list]) => [
+        key,
+        list.map((p) => ({ ...p, link: local(p.link) })),
+      ]),
+    ),
+  };
+}
+
+function urlPath(url: string) {
+  try {
+    return decodeURIComponent(url.split(/[?#]/)[0]);
+  } catch {
+    return null;
+  }
+}
+
+// Archive path for an asset URL. Tenant-published URLs lose their
+// /tenants/<tenant>/ prefix so the archive can be imported under any name.
+function archivePath(tenant: string, pathname: string) {
+  const relative = pathname.replace(/^\/+/, "");
+  const unprefixed = relative.startsWith(`tenants/${tenant}/`)
+    ? relative.slice(`tenants/${tenant}/`.length)
+    : relative;
+  return `assets/${unprefixed}`;
+}
+
+function isSafeAssetPath(assetPath: string) {
+  return (
+    assetPath.startsWith("assets/") &&
+    path.posix.normalize(assetPath) === assetPath &&
+    !assetPath.split("/").includes("..") &&
+    !assetPath.includes("\0") &&
+    path.extname(assetPath).toLowerCase() in SIGNATURES
+  );
+}
+
+// Every local asset the bundle links to, wherever it lives: public/ for the
+// default tenant's original files, the tenant's bundle for /tenants/... URLs.
+async function collectAssets(tenant: string, content: PortfolioContent) {
+  const urls = new Set<string>();
+  mapAssetUrls(content, (url) => {
+    urls.add(url);
+    return url;
+  });
+  const assets: (ArchiveAsset & { file: string })[] = [];
+  const seen = new Set<string>();
+  for (const url of urls) {
+    const pathname = urlPath(url);
+    const file = assetFile(url);
+    if (!pathname || !file) continue;
+    const assetPath = archivePath(tenant, pathname);
+    if (seen.has(assetPath) || !isSafeAssetPath(assetPath)) continue;
+    let hashed;
+    try {
+      hashed = await hashFile(file);
+    } catch {
+      continue;
+    }
+    if (hashed.size === 0) continue;
+    seen.add(assetPath);
+    assets.push({ path: assetPath, url, size: hashed.size, sha256: hashed.sha256, included: true, file });
+  }
+  return assets;
+}
+
+function* jsonEntry(name: string, value: unknown) {
+  const data = new TextEncoder().encode(JSON.stringify(value, null, 2));
+  yield* tarEntryHeader(name, data.length);
+  yield* tarPadded(data);
+}
+
+async function* fileEntry(asset: ArchiveAsset & { file: string }) {
+  yield* tarEntryHeader(asset.path, asset.size);
+  let sent = 0;
+  for await (const chunk of createReadStream(asset.file, { end: asset.size - 1 })) {
+    sent += chunk.length;
+    yield new Uint8Array(chunk.buffer, chunk.byteOffset, chunk.byteLength);
+  }
+  // A file that shrank mid-export would corrupt every entry after it.
+  if (sent !== asset.size) throw new Error(`${asset.path} changed during export`);
+  yield tarPadding(asset.size);
+}
+
+// Pull-driven, so at most one file chunk is in flight however slowly the
+// client reads.
+function toStream(source: AsyncGenerator<Uint8Array>) {
+  return new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      for (;;) {
+        const { value, done } = await source.next();
+        if (done) return controller.close();
+        // Every pull must enqueue something or the pending read never settles.
+        if (value.length > 0) return controller.enqueue(value);
+      }
+    },
+    async cancel() {
+      await source.return(undefined);
+    },
+  });
+}
+
+// Streams the tenant's archive. Assets whose SHA-256 is in `have` are listed
+// in the manifest but not sent. Returns null for unknown tenants.
+export async function exportPortfolio(tenant: string, have: ReadonlySet<string> = new Set()) {
+  const content = await getTenantContent(tenant);
+  if (!content) return null;
+  const assets = await collectAssets(tenant, content);
+  for (const asset of assets) asset.included = !have.has(asset.sha256);
+
+  const manifest: ArchiveManifest = {
+    format: FORMAT,
+    tenant,
+    exportedAt: new Date().toISOString(),
+    assets: assets.map((asset) => ({
+      path: asset.path,
+      url: asset.url,
+      size: asset.size,
+      sha256: asset.sha256,
+      included: asset.included,
+    })),
+  };
+
+  return toStream(
+    (async function* () {
+      yield* jsonEntry("manifest.json", manifest);
+      yield* jsonEntry("content.json", withoutTenant(content));
+      for (const asset of assets) if (asset.included) yield* fileEntry(asset);
+      yield tarEnd();
+    })(),
+  );
+}
+
+async function readJson(entry: TarEntry) {
+  if (entry.size > MAX_JSON_BYTES) throw new ArchiveError(413, `${entry.path} is too large`);
+  const parts: Uint8Array[] = [];
+  for await (const chunk of entry.chunks()) parts.push(chunk.slice());
+  try {
+    return JSON.parse(Buffer.concat(parts).toString("utf8"));
+  } catch {
+    throw new ArchiveError(400, `${entry.path} is not valid JSON`);
+  }
+}
+
+function parseManifest(value: unknown): ArchiveManifest {
+  const manifest = value as ArchiveManifest;
+  if (manifest?.format !== FORMAT || !Array.isArray(manifest.assets)) {
+    throw new ArchiveError(400, "Unsupported archive manifest");
+  }
+  for (const asset of manifest.assets) {
+    if (
+      typeof asset?.path !== "string" ||
+      !isSafeAssetPath(asset.path) ||
+      typeof asset.url !== "string" ||
+      !Number.isSafeInteger(asset.size) ||
+      asset.size < 0 ||
+      !/^[0-9a-f]{64}$/.test(asset.sha256)
+    ) {
+      throw new ArchiveError(400, `Invalid manifest entry ${JSON.stringify(asset?.path)}`);
+    }
+  }
+  return manifest;
+}
+
+function parseContent(value: unknown): Omit<PortfolioContent, "tenant"> {
+  const missing = REQUIRED_KEYS.filter((key) => !(value && typeof value === "object" && key in value));
+  if (missing.length) throw new ArchiveError(400, `content.json is missing ${missing.join(", ")}`);
+  return value as Omit<PortfolioContent, "tenant">;
+}
+
+// Writes one asset to `target`, hashing and checking its signature on the
+// way through. Nothing but the current chunk is held in memory.
+async function writeVerified(entry: TarEntry, asset: ArchiveAsset, target: string) {
+  const extension = path.extname(asset.path).toLowerCase();
+  const signatures = SIGNATURES[extension];
+  const headLength = Math.max(...signatures.map((sig) => sig.length));
+  const checkSignature = (head: Uint8Array) => {
+    if (!signatures.some((sig) => sig.every((byte, i) => head[i] === byte))) {
+      throw new ArchiveError(422, `${asset.path} does not look like a ${extension} file`);
+    }
+  };
+
+  const hash = crypto.createHash("sha256");
+  let head: Uint8Array | null = new Uint8Array(0);
+  await fs.mkdir(path.dirname(target), { recursive: true });
+  const handle = await fs.open(target, "w");
+  try {
+    for await (const chunk of entry.chunks()) {
+      if (head) {
+        head = Buffer.concat([head, chunk.subarray(0, headLength - head.length)]);
+        if (head.length === headLength) {
+          checkSignature(head);
+          head = null;
+        }
+      }
+      hash.update(chunk);
+      await handle.write(chunk);
+    }
+  } finally {
+    await handle.close();
+  }
+  if (head) checkSignature(head);
+  if (hash.digest("hex") !== asset.sha256) throw new ArchiveError(422, `${asset.path} failed its checksum`);
+}
+
+// The staging directory can sit on another volume than content/.
+async function moveFile(from: string, to: string) {
+  try {
+    await fs.rename(from, to);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code !== "EXDEV") throw error;
+    await fs.copyFile(from, to);
+    await fs.rm(from, { force: true });
+  }
+}
+
+// Unpacks an archive into the tenant's bundle (content/tenants/<tenant>/),
+// assets included. Everything is staged and checked first; the tenant is
+// only touched once the whole archive has passed.
+export async function importPortfolio(tenant: string, body: ReadableStream<Uint8Array>): Promise<ImportSummary> {
+  const staging = dataPath("imports", crypto.randomUUID());
+  await fs.mkdir(staging, { recursive: true });
+  try {
+    let manifest: ArchiveManifest | null = null;
+    let bundle: Omit<PortfolioContent, "tenant"> | null = null;
+    const byPath = new Map<string, ArchiveAsset>();
+    const received = new Set<string>();
+    let bytes = 0;
+
+    for await (const entry of readTar(body)) {
+      bytes += entry.size;
+      if (bytes > MAX_IMPORT_BYTES) throw new ArchiveError(413, `Archive exceeds ${MAX_IMPORT_BYTES} bytes`);
+
+      if (!manifest) {
+        if (entry.path !== "manifest.json") throw new ArchiveError(400, "manifest.json must be the first entry");
+        manifest = parseManifest(await readJson(entry));
+        for (const asset of manifest.assets) byPath.set(asset.path, asset);
+      } else if (entry.path === "content.json") {
+        bundle = parseContent(await readJson(entry));
+      } else {
+        const asset = byPath.get(entry.path);
+        if (!asset?.included || received.has(entry.path)) {
+          throw new ArchiveError(400, `Unexpected archive entry ${entry.path}`);
+        }
+        if (entry.size !== asset.size) throw new ArchiveError(422, `${entry.path} does not match its manifest size`);
+        await writeVerified(entry, asset, path.join(staging, asset.path));
+        received.add(entry.path);
+      }
+    }
+
+    if (!manifest || !bundle) throw new ArchiveError(400, "Archive has no manifest.json or content.json");
+    const bundleDir = tenantDir(tenant);
+    const published = (assetPath: string) => `/tenants/${tenant}/${assetPath.slice("assets/".length)}`;
+    // Assets the tenant already links to, by hash. The default tenant's
+    // originals live in public/, not in its bundle, so an incremental import
+    // has to find them by content rather than by path.
+    const current = await getTenantContent(tenant);
+    const existingByHash = new Map(
+      (current ? await collectAssets(tenant, current) : []).map((asset) => [asset.sha256, asset.url]),
+    );
+    const urls = new Map<string, string>();
+    const missing: string[] = [];
+    for (const asset of manifest.assets) {
+      if (asset.included) {
+        if (received.has(asset.path)) urls.set(asset.url, published(asset.path));
+        else missing.push(asset.path);
+        continue;
+      }
+      // Left out by the exporter: must already be in this tenant, byte for byte.
+      const linked = existingByHash.get(asset.sha256);
+      if (linked) {
+        urls.set(asset.url, linked);
+        continue;
+      }
+      const file = tenantAssetFile(tenant, asset.path.slice("assets/".length));
+      const existing = file ? await hashFile(file).catch(() => null) : null;
+      if (existing?.sha256 === asset.sha256) urls.set(asset.url, published(asset.path));
+      else missing.push(asset.path);
+    }
+    if (missing.length) throw new ArchiveError(422, `Archive is missing ${missing.join(", ")}`);
+
+    // Served from the bundle by the /tenants/[tenant]/[...asset] route.
+    for (const assetPath of received) {
+      const target = path.join(bundleDir, assetPath);
+      await fs.mkdir(path.dirname(target), { recursive: true });
+      await moveFile(path.join(staging, assetPath), target);
+    }
+
+    const rewritten = mapAssetUrls({ ...bundle, tenant }, (url) => urls.get(url) ?? url);
+    const contentFile = path.join(bundleDir, "content.json");
+    await fs.mkdir(bundleDir, { recursive: true });
+    await fs.writeFile(`${contentFile}.tmp`, `${JSON.stringify(withoutTenant(rewritten), null, 2)}\n`);
+    await fs.rename(`${contentFile}.tmp`, contentFile);
+
+    return { tenant, received: received.size, reused: manifest.assets.length - received.size, bytes };
+  } catch (error) {
+    if (error instanceof TarFormatError) throw new ArchiveError(400, error.message);
+    throw error;
+  } finally {
+    await fs.rm(staging, { recursive: true, force: true });
+  }
+}
@@ -0,0 +1,177 @@
+// Just enough of the POSIX tar format (ustar, plus pax headers for long
+// paths) to stream a portfolio archive out and back in without holding it
+// in memory. Only regular files are written or accepted.
+
+const BLOCK = 512;
+const encoder = new TextEncoder();
+const decoder = new TextDecoder();
+
+export class TarFormatError extends Error {}
+
+function writeString(block: Uint8Array, offset: number, length: number, value: string) {
+  block.set(encoder.encode(value).subarray(0, length), offset);
+}
+
+function writeOctal(block: Uint8Array, offset: number, length: number, value: number) {
+  writeString(block, offset, length, `${value.toString(8).padStart(length - 1, "0")}\0`);
+}
+
+function header(name: string, size: number, mtime: number, type: "0" | "x") {
+  const block = new Uint8Array(BLOCK);
+  writeString(block, 0, 100, name);
+  writeOctal(block, 100, 8, 0o644);
+  writeOctal(block, 108, 8, 0);
+  writeOctal(block, 116, 8, 0);
+  writeOctal(block, 124, 12, size);
+  writeOctal(block, 136, 12, Math.floor(mtime / 1000));
+  writeString(block, 148, 8, "        ");
+  writeString(block, 156, 1, type);
+  writeString(block, 257, 6, "ustar\0");
+  writeString(block, 263, 2, "00");
+  let checksum = 0;
+  for (const byte of block) checksum += byte;
+  writeString(block, 148, 8, `${checksum.toString(8).padStart(6, "0")}\0 `);
+  return block;
+}
+
+// Header block(s) for one file. Paths that don't fit ustar's 100-byte name
+// field get a pax extended header first.
+export function tarEntryHeader(path: string, size: number, mtime = Date.now()): Uint8Array[] {
+  if (encoder.encode(path).length <= 100) return [header(path, size, mtime, "0")];
+  const record = (len: number) => `${len} path=${path}\n`;
+  let length = encoder.encode(record(0)).length;
+  while (encoder.encode(record(length)).length !== length) length = encoder.encode(record(length)).length;
+  const pax = encoder.encode(record(length));
+  return [
+    header("PaxHeader", pax.length, mtime, "x"),
+    ...tarPadded(pax),
+    header(path.slice(-100), size, mtime, "0"),
+  ];
+}
+
+// File data followed by the zero padding to the next block boundary.
+export function tarPadded(data: Uint8Array): Uint8Array[] {
+  return [data, tarPadding(data.length)].filter((part) => part.length > 0);
+}
+
+export function tarPadding(size: number) {
+  return new Uint8Array((BLOCK - (size % BLOCK)) % BLOCK);
+}
+
+export function tarEnd() {
+  return new Uint8Array(BLOCK * 2);
+}
+
+function readString(block: Uint8Array, offset: number, length: number) {
+  const field = block.subarray(offset, offset + length);
+  const end = field.indexOf(0);
+  return decoder.decode(end === -1 ? field : field.subarray(0, end));
+}
+
+function readOctal(block: Uint8Array, offset: number, length: number) {
+  const text = readString(block, offset, length).trim();
+  if (!/^[0-7]*$/.test(text)) throw new TarFormatError("Malformed tar header");
+  return text ? parseInt(text, 8) : 0;
+}
+
+export type TarEntry = {
+  path: string;
+  size: number;
+  // Streams the entry's data. Must be fully consumed before the next entry.
+  chunks: () => AsyncGenerator<Uint8Array>;
+};
+
+// Pulls from a byte stream, holding at most one source chunk plus one
+// header block in memory.
+class ByteReader {
+  private buffered: Uint8Array = new Uint8Array(0);
+
+  constructor(private reader: ReadableStreamDefaultReader<Uint8Array>) {}
+
+  private async fill() {
+    const { value, done } = await this.reader.read();
+    if (done) throw new TarFormatError("Unexpected end of archive");
+    this.buffered = value;
+  }
+
+  async exactly(length: number) {
+    const out = new Uint8Array(length);
+    let filled = 0;
+    while (filled < length) {
+      if (this.buffered.length === 0) await this.fill();
+      const take = Math.min(length - filled, this.buffered.length);
+      out.set(this.buffered.subarray(0, take), filled);
+      this.buffered = this.buffered.subarray(take);
+      filled += take;
+    }
+    return out;
+  }
+
+  async *stream(length: number) {
+    let remaining = length;
+    while (remaining > 0) {
+      if (this.buffered.length === 0) await this.fill();
+      const take = Math.min(remaining, this.buffered.length);
+      yield this.buffered.subarray(0, take);
+      this.buffered = this.buffered.subarray(take);
+      remaining -= take;
+    }
+  }
+
+  async skip(length: number) {
+    let remaining = length;
+    while (remaining > 0) {
+      if (this.buffered.length === 0) await this.fill();
+      const take = Math.min(remaining, this.buffered.length);
+      this.buffered = this.buffered.subarray(take);
+      remaining -= take;
+    }
+  }
+}
+
+export async function* readTar(stream: ReadableStream<Uint8Array>, maxPaxBytes = 64 * 1024): AsyncGenerator<TarEntry> {
+  const bytes = new ByteReader(stream.getReader());
+  let paxPath: string | null = null;
+  for (;;) {
+    const block = await bytes.exactly(BLOCK);
+    if (block.every((byte) => byte === 0)) return;
+
+    let checksum = 0;
+    for (let i = 0; i < BLOCK; i++) checksum += i >= 148 && i < 156 ? 32 : block[i];
+    if (checksum !== readOctal(block, 148, 8)) throw new TarFormatError("Tar header checksum mismatch");
+
+    const type = readString(block, 156, 1) || "0";
+    const size = readOctal(block, 124, 12);
+    const padding = (BLOCK - (size % BLOCK)) % BLOCK;
+
+    if (type === "x") {
+      if (size > maxPaxBytes) throw new TarFormatError("Pax header too large");
+      const records = decoder.decode(await bytes.exactly(size));
+      await bytes.skip(padding);
+      paxPath = /(?:^|\n)\d+ path=([^\n]*)\n/.exec(records)?.[1] ?? null;
+      continue;
+    }
+    if (type === "5") {
+      paxPath = null;
+      continue;
+    }
+    if (type !== "0") throw new TarFormatError(`Unsupported tar entry type "${type}"`);
+
+    const prefix = readString(block, 345, 155);
+    const name = readString(block, 0, 100);
+    const path = paxPath ?? (prefix ? `${prefix}/${name}` : name);
+    paxPath = null;
+
+    let consumed = false;
+    yield {
+      path,
+      size,
+      chunks: async function* () {
+        consumed = true;
+        yield* bytes.stream(size);
+        await bytes.skip(padding);
+      },
+    };
+    if (!consumed) await bytes.skip(size + padding);
+  }
+}
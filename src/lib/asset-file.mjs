@@ -0,0 +1,41 @@
+// Maps local asset URLs to files. Shared by the server (content-store.ts)
+// and scripts/search-index.mjs, so both read the same file for a URL.
+import path from "node:path";
+
+export const TENANTS_DIR = path.resolve(process.env.PORTFOLIO_CONTENT_DIR ?? "content/tenants");
+const PUBLIC_DIR = path.join(process.cwd(), "public");
+const TENANT_PATTERN = /^[a-z0-9][a-z0-9-]{0,62}$/;
+
+/**
+ * A file in a tenant's assets/ directory, or null if `relative` escapes it.
+ * @param {string} tenant
+ * @param {string} relative
+ * @returns {string | null}
+ */
+export function tenantAssetFile(tenant, relative) {
+  if (!TENANT_PATTERN.test(tenant)) return null;
+  const root = path.join(TENANTS_DIR, tenant, "assets");
+  const file = path.join(root, relative);
+  return file.startsWith(root + path.sep) ? file : null;
+}
+
+/**
+ * The file behind a local asset URL. /tenants/<tenant>/... comes from that
+ * tenant's bundle (content/tenants/<tenant>/assets/), anything else from
+ * public/. Null for external, malformed or escaping URLs.
+ * @param {string} url
+ * @returns {string | null}
+ */
+export function assetFile(url) {
+  if (!url.startsWith("/") || url.startsWith("//")) return null;
+  let pathname;
+  try {
+    pathname = decodeURIComponent(url.split(/[?#]/)[0]);
+  } catch {
+    return null;
+  }
+  const tenantAsset = /^\/tenants\/([^/]+)\/(.+)$/.exec(pathname);
+  if (tenantAsset) return tenantAssetFile(tenantAsset[1], tenantAsset[2]);
+  const file = path.join(PUBLIC_DIR, pathname);
+  return file.startsWith(PUBLIC_DIR + path.sep) ? file : null;
+}
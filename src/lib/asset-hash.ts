@@ -0,0 +1,21 @@
+import crypto from "node:crypto";
+import { createReadStream } from "node:fs";
+import fs from "node:fs/promises";
+
+export type FileHash = { mtimeMs: number; size: number; sha256: string };
+
+// Survives module reloads in development.
+const globalForHashes = globalThis as unknown as { assetHashes?: Map<string, FileHash> };
+const hashes = (globalForHashes.assetHashes ??= new Map());
+
+// Streaming SHA-256 of a file, remembered until its mtime or size changes.
+export async function hashFile(file: string): Promise<FileHash> {
+  const stat = await fs.stat(file);
+  const cached = hashes.get(file);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) return cached;
+  const hash = crypto.createHash("sha256");
+  for await (const chunk of createReadStream(file)) hash.update(chunk);
+  const entry = { mtimeMs: stat.mtimeMs, size: stat.size, sha256: hash.digest("hex") };
+  hashes.set(file, entry);
+  return entry;
+}
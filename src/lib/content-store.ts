@@ -0,0 +1,85 @@
+import fs from "node:fs/promises";
+import path from "node:path";
+
+import { cache } from "react";
+
+import { assetFile, TENANTS_DIR } from "@/lib/asset-file.mjs";
+import { hashFile } from "@/lib/asset-hash";
+import { TENANT_PATTERN, type PortfolioContent } from "@/lib/content";
+
+const CACHE_SIZE = Number(process.env.TENANT_CONTENT_CACHE_SIZE) || 200;
+
+export { assetFile, tenantAssetFile } from "@/lib/asset-file.mjs";
+
+export const DEFAULT_TENANT = process.env.DEFAULT_TENANT ?? "pranav";
+
+type Cached = { mtimeMs: number; content: PortfolioContent };
+// Map iteration order doubles as recency order: oldest first.
+const parsed = new Map<string, Cached>();
+
+export function tenantDir(tenant: string) {
+  return path.join(TENANTS_DIR, tenant);
+}
+
+// Parsed bundles are kept until their file changes on disk, so editing one
+// tenant's content.json is picked up without touching the others. At most
+// TENANT_CONTENT_CACHE_SIZE bundles are kept, least recently used out first.
+// Within a render, every section shares one lookup.
+export const getTenantContent = cache(async (tenant: string): Promise<PortfolioContent | null> => {
+  if (!TENANT_PATTERN.test(tenant)) return null;
+  const file = path.join(tenantDir(tenant), "content.json");
+  let stat;
+  try {
+    stat = await fs.stat(file);
+  } catch {
+    return null;
+  }
+  const cached = parsed.get(tenant);
+  parsed.delete(tenant);
+  if (cached && cached.mtimeMs === stat.mtimeMs) {
+    parsed.set(tenant, cached);
+    return cached.content;
+  }
+
+  const content = { ...JSON.parse(await fs.readFile(file, "utf8")), tenant } as PortfolioContent;
+  parsed.set(tenant, { mtimeMs: stat.mtimeMs, content });
+  while (parsed.size > CACHE_SIZE) parsed.delete(parsed.keys().next().value!);
+  return content;
+});
+
+type SectionKey = Exclude<keyof PortfolioContent, "tenant" | "profile">;
+
+async function withAssetHash<T extends { hash?: string }>(item: T, url: string | undefined): Promise<T> {
+  const file = !item.hash && url ? assetFile(url) : null;
+  if (!file) return item;
+  try {
+    return { ...item, hash: (await hashFile(file)).sha256 };
+  } catch {
+    return item;
+  }
+}
+
+// Data for one streamed section. Today every section reads the same cached
+// bundle, so only the asset hashing below does per-section work, and only a
+// tenant's first on-demand render streams at all (/ is prerendered and
+// cached pages are served whole). Sources that are slower than the bundle on
+// disk (a persisted content store, enriched project metadata) belong here:
+// only the section that awaits them waits.
+export async function getSection<K extends SectionKey>(tenant: string, key: K): Promise<PortfolioContent[K]> {
+  const content = await getTenantContent(tenant);
+  if (!content) throw new Error(`Unknown tenant "${tenant}"`);
+  // Bundled files get the same SHA-256 the upload worker computes, so
+  // uploading one of them again is caught as a duplicate in the browser.
+  if (key === "certificates") {
+    return (await Promise.all(content.certificates.map((c) => withAssetHash(c, c.url)))) as PortfolioContent[K];
+  }
+  if (key === "projects") {
+    const entries = await Promise.all(
+      Object.entries(content.projects).map(
+        async ([category, list]) => [category, await Promise.all(list.map((p) => withAssetHash(p, p.link)))] as const,
+      ),
+    );
+    return Object.fromEntries(entries) as PortfolioContent[K];
+  }
+  return content[key];
+}
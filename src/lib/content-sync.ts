@@ -0,0 +1,59 @@
+import type { Certificate, Project, Resume } from "@/lib/content";
+
+// A single-record change to a tenant's content. Only the record that changed
+// crosses the wire, never the whole collection.
+export type ContentPatch =
+  | { collection: "resumes"; op: "add" | "update"; id: number; value: Resume }
+  | { collection: "projects"; op: "add" | "update"; id: number; category: string; value: Project }
+  | { collection: "certificates"; op: "add" | "update"; id: number; value: Certificate }
+  | { collection: "resumes" | "certificates"; op: "delete"; id: number }
+  | { collection: "projects"; op: "delete"; id: number; category: string };
+
+export type VersionedPatch = ContentPatch & { version: number };
+
+export const SYNC_COLLECTIONS = ["resumes", "projects", "certificates"] as const;
+
+const ADMIN_TOKEN_KEY = "portfolio:admin-token";
+
+// Admin sessions keep the publish token in localStorage.
+export function adminToken() {
+  return window.localStorage.getItem(ADMIN_TOKEN_KEY);
+}
+
+// Version cursors look like "<epoch>:<version>". The epoch changes whenever
+// the server restarts, which tells a reconnecting client that its version
+// number belongs to a log that no longer exists.
+export function parseCursor(cursor: string | null) {
+  const match = /^([\w-]+):(\d+)$/.exec(cursor ?? "");
+  return match ? { epoch: match[1], version: Number(match[2]) } : null;
+}
+
+export function patchKey(patch: ContentPatch) {
+  return `${patch.collection}:${"category" in patch ? patch.category : ""}:${patch.id}`;
+}
+
+// Applying a patch twice is harmless, which matters because a publisher also
+// receives its own patches and a resuming client may see some again. An add
+// never replaces a record the client already has, so the publisher keeps its
+// local copy (with its blob: preview links) when its own add comes back.
+export function applyPatch<T extends { id: number }>(list: T[], patch: ContentPatch): T[] {
+  const exists = list.some((item) => item.id === patch.id);
+  if (patch.op === "delete") return exists ? list.filter((item) => item.id !== patch.id) : list;
+  const value = patch.value as unknown as T;
+  if (patch.op === "add") return exists ? list : [...list, value];
+  return exists ? list.map((item) => (item.id === patch.id ? value : item)) : [...list, value];
+}
+
+export async function publishPatches(tenant: string, patches: ContentPatch[]) {
+  if (patches.length === 0) return;
+  const token = adminToken();
+  const res = await fetch("/api/sync", {
+    method: "POST",
+    headers: {
+      "content-type": "application/json",
+      ...(token ? { authorization: `Bearer ${token}` } : {}),
+    },
+    body: JSON.stringify({ tenant, patches }),
+  });
+  if (!res.ok) throw new Error(`Publishing changes failed: ${res.status}`);
+}
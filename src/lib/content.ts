@@ -0,0 +1,72 @@
+export type Resume = {
+  id: number;
+  title: string;
+  type: string;
+  url: string;
+};
+
+export type Project = {
+  id: number;
+  title: string;
+  description: string;
+  link?: string;
+  hash?: string;
+  jobId?: string;
+};
+
+export type Certificate = {
+  id: number;
+  name: string;
+  url: string;
+  hash?: string;
+  jobId?: string;
+};
+
+export type ProjectCategory = {
+  key: string;
+  label: string;
+  title: string;
+  description: string;
+};
+
+export type Internship = {
+  title: string;
+  organization: string;
+  description: string;
+  certificateUrl?: string;
+};
+
+// Everything that differs between two candidates' portfolios. One of these
+// lives in content/tenants/<tenant>/content.json per tenant.
+export type PortfolioContent = {
+  tenant: string;
+  profile: {
+    name: string;
+    headline: string;
+    focus: string;
+    summary: string;
+    photo: string;
+    email: string;
+    github: string;
+    linkedin: string;
+    resumeUrl: string;
+  };
+  skills: {
+    technical: string[];
+    tools: string[];
+  };
+  internships: Internship[];
+  resumes: Resume[];
+  projectCategories: ProjectCategory[];
+  projects: Record<string, Project[]>;
+  certificates: Certificate[];
+  availability: {
+    intro: string;
+    areas: string[];
+    note: string;
+  };
+};
+
+export const TENANT_PATTERN = /^[a-z0-9][a-z0-9-]{0,62}$/;
+
+export const sectionClasses = "max-w-6xl mx-auto px-4 sm:px-6 lg:px-8 py-16";
@@ -0,0 +1,9 @@
+import path from "node:path";
+
+// Server-side state (telemetry rows, uploads, job table) lives outside the
+// build output so it survives redeploys of the same host.
+const DATA_DIR = path.resolve(process.env.PORTFOLIO_DATA_DIR ?? ".data");
+
+export function dataPath(...segments: string[]) {
+  return path.join(DATA_DIR, ...segments);
+}
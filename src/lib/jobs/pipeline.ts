@@ -0,0 +1,203 @@
+import crypto from "node:crypto";
+import { createWriteStream } from "node:fs";
+import fs from "node:fs/promises";
+import os from "node:os";
+import { pipeline as pipe } from "node:stream/promises";
+import { Worker } from "node:worker_threads";
+
+import { dataPath } from "@/lib/data-dir";
+import { JobTable, toView, type Job } from "@/lib/jobs/table";
+import type { JobKind, JobResult, JobView } from "@/lib/uploads";
+
+// Lower runs first: a resume update shouldn't wait behind a bulk
+// certificate import.
+const PRIORITY: Record<JobKind, number> = { resume: 0, project: 1, certificate: 2 };
+const POOL_SIZE = Number(process.env.UPLOAD_WORKERS ?? Math.max(1, os.availableParallelism() - 1));
+const MAX_QUEUED = Number(process.env.UPLOAD_MAX_QUEUED ?? 200);
+
+type WorkerReply =
+  | { jobId: string; ok: true; result: JobResult }
+  | { jobId: string; ok: false; error: string };
+
+export type StagedUpload = { id: string; fileName: string; path: string; size: number };
+
+export class QueueFullError extends Error {
+  constructor(readonly retryAfter: number) {
+    super("Upload queue is full");
+  }
+}
+
+export class UploadTooLargeError extends Error {
+  constructor(readonly limit: number) {
+    super(`Upload exceeds ${limit} bytes`);
+  }
+}
+
+class UploadPipeline {
+  private table = new JobTable(dataPath("jobs", "journal.ndjson"));
+  private queues: string[][] = Object.values(PRIORITY).map(() => []);
+  private idle: Worker[] = [];
+  private busy = new Map<Worker, string>();
+  private ready: Promise<void>;
+
+  constructor() {
+    this.ready = this.table.load().then(async (jobs) => {
+      // Anything that was queued or mid-flight when the process died runs
+      // again. The incoming file is only removed once a job's final status
+      // is in the journal, so it is still there unless removed by hand.
+      for (const job of jobs.sort((a, b) => a.createdAt - b.createdAt)) {
+        if (job.status !== "queued" && job.status !== "running") continue;
+        if (await exists(job.path)) {
+          job.status = "queued";
+          this.queues[job.priority].push(job.id);
+        } else {
+          await this.table.update(job.id, { status: "failed", error: "Uploaded file is missing; upload it again" });
+        }
+      }
+      this.dispatch();
+    });
+  }
+
+  queued() {
+    return this.queues.reduce((sum, queue) => sum + queue.length, 0);
+  }
+
+  // Rough drain estimate: each worker clears a job in about a second.
+  private checkCapacity(adding: number) {
+    if (this.queued() + adding > MAX_QUEUED) throw new QueueFullError(Math.ceil(this.queued() / POOL_SIZE) || 1);
+  }
+
+  // Streams one uploaded file into the incoming directory a chunk at a time,
+  // failing with UploadTooLargeError as soon as it passes `maxBytes`.
+  async stage(fileName: string, chunks: AsyncIterable<Uint8Array>, maxBytes: number): Promise<StagedUpload> {
+    await this.ready;
+    this.checkCapacity(1);
+    await fs.mkdir(dataPath("uploads", "incoming"), { recursive: true });
+    const id = crypto.randomUUID();
+    const path = dataPath("uploads", "incoming", id);
+    let size = 0;
+    try {
+      await pipe(
+        (async function* () {
+          for await (const chunk of chunks) {
+            size += chunk.byteLength;
+            if (size > maxBytes) throw new UploadTooLargeError(maxBytes);
+            yield chunk;
+          }
+        })(),
+        createWriteStream(path),
+      );
+    } catch (error) {
+      await fs.rm(path, { force: true });
+      throw error;
+    }
+    return { id, fileName, path, size };
+  }
+
+  async discard(staged: StagedUpload[]) {
+    await Promise.all(staged.map((upload) => fs.rm(upload.path, { force: true })));
+  }
+
+  async submit(kind: JobKind, staged: StagedUpload[], category?: string): Promise<JobView[]> {
+    await this.ready;
+    this.checkCapacity(staged.length);
+
+    const jobs: Job[] = [];
+    for (const { id, fileName, path, size } of staged) {
+      const now = Date.now();
+      const job: Job = {
+        id,
+        kind,
+        category,
+        status: "queued",
+        fileName,
+        priority: PRIORITY[kind],
+        path,
+        size,
+        createdAt: now,
+        updatedAt: now,
+      };
+      await this.table.insert(job);
+      this.queues[job.priority].push(id);
+      jobs.push(job);
+    }
+    this.dispatch();
+    return jobs.map(toView);
+  }
+
+  async get(ids: string[]): Promise<JobView[]> {
+    await this.ready;
+    return ids.flatMap((id) => {
+      const job = this.table.get(id);
+      return job ? [toView(job)] : [];
+    });
+  }
+
+  private next() {
+    for (const queue of this.queues) {
+      const id = queue.shift();
+      if (id) return id;
+    }
+    return null;
+  }
+
+  private dispatch() {
+    while (this.queued() > 0) {
+      const worker = this.idle.pop() ?? (this.busy.size < POOL_SIZE ? this.spawn() : null);
+      if (!worker) return;
+      const id = this.next();
+      const job = id ? this.table.get(id) : undefined;
+      if (!job) {
+        this.idle.push(worker);
+        continue;
+      }
+      this.busy.set(worker, job.id);
+      void this.table.update(job.id, { status: "running" });
+      worker.postMessage({ jobId: job.id, path: job.path, assetDir: dataPath("assets") });
+    }
+  }
+
+  private spawn() {
+    const worker = new Worker(new URL("./processor.worker.mjs", import.meta.url));
+    worker.on("message", (reply: WorkerReply) => {
+      this.busy.delete(worker);
+      this.idle.push(worker);
+      void this.finish(
+        reply.jobId,
+        reply.ok ? { status: "done", result: reply.result } : { status: "failed", error: reply.error },
+      );
+      this.dispatch();
+    });
+    // A crashed worker fails only the job it was running.
+    worker.on("error", (error) => {
+      const jobId = this.busy.get(worker);
+      this.busy.delete(worker);
+      this.idle = this.idle.filter((w) => w !== worker);
+      if (jobId) void this.finish(jobId, { status: "failed", error: error.message });
+      this.dispatch();
+    });
+    return worker;
+  }
+
+  // Records the outcome, then drops the incoming file. In that order, a crash
+  // in between leaves a finished job with a stray file rather than a running
+  // job whose input is gone.
+  private async finish(jobId: string, outcome: { status: "done" | "failed"; result?: JobResult; error?: string }) {
+    await this.table.update(jobId, outcome);
+    const job = this.table.get(jobId);
+    if (job) await fs.rm(job.path, { force: true });
+  }
+}
+
+async function exists(file: string) {
+  try {
+    await fs.access(file);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+// Survives module reloads in development.
+const globalForPipeline = globalThis as unknown as { uploadPipeline?: UploadPipeline };
+export const uploadPipeline = (globalForPipeline.uploadPipeline ??= new UploadPipeline());
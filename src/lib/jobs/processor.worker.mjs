@@ -0,0 +1,99 @@
+// Runs in a worker_threads worker. Each message is one uploaded file on
+// disk; the reply carries its content hash, validated type, extracted text
+// and thumbnail location, or an error.
+import crypto from "node:crypto";
+import fs from "node:fs/promises";
+import path from "node:path";
+import { parentPort } from "node:worker_threads";
+
+import { countPdfPages, extractPdfText } from "../pdf-text.mjs";
+
+const THUMBNAIL_WIDTH = 320;
+const MAX_TEXT_LENGTH = 200_000;
+const EICAR = "X5O!P%@AP[4\\PZX54(P^)7CC)7}$EICAR-STANDARD-ANTIVIRUS-TEST-FILE!$H+H*";
+// PDF features that run code or carry payloads; none of them belong in a
+// resume or certificate.
+const PDF_ACTIVE_CONTENT = /\/(JavaScript|JS|Launch|EmbeddedFile|RichMedia)\b/;
+
+function sniff(buffer) {
+  const head = buffer.subarray(0, 16);
+  if (head.toString("latin1", 0, 5) === "%PDF-") return "application/pdf";
+  if (head.subarray(0, 8).equals(Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a]))) return "image/png";
+  if (head[0] === 0xff && head[1] === 0xd8 && head[2] === 0xff) return "image/jpeg";
+  if (head.toString("latin1", 0, 4) === "GIF8") return "image/gif";
+  if (head.toString("latin1", 0, 4) === "RIFF" && head.toString("latin1", 8, 12) === "WEBP") return "image/webp";
+  if (head.readUInt32LE(0) === 0x04034b50) return "application/zip";
+  return "text/plain";
+}
+
+function validate(buffer, mimeType) {
+  if (buffer.includes(EICAR)) throw new Error("File matches a malware signature");
+  if (mimeType === "application/pdf") {
+    if (!buffer.subarray(-1024).toString("latin1").includes("%%EOF")) throw new Error("Truncated PDF");
+    if (PDF_ACTIVE_CONTENT.test(buffer.toString("latin1"))) throw new Error("PDF contains active content");
+  } else if (mimeType === "application/zip") {
+    // End of central directory record.
+    if (buffer.subarray(-65_557).lastIndexOf(Buffer.from([0x50, 0x4b, 0x05, 0x06])) === -1) {
+      throw new Error("Truncated zip archive");
+    }
+  } else if (mimeType === "text/plain") {
+    if (buffer.subarray(0, 8192).includes(0)) throw new Error("Unrecognized binary file");
+  }
+}
+
+// sharp ships as an optional dependency of next; without it thumbnails are
+// skipped rather than failing the job.
+async function thumbnail(buffer, mimeType, file) {
+  if (!mimeType.startsWith("image/")) return null;
+  let sharp;
+  try {
+    sharp = (await import("sharp")).default;
+  } catch {
+    return null;
+  }
+  await sharp(buffer).resize({ width: THUMBNAIL_WIDTH, withoutEnlargement: true }).webp().toFile(file);
+  return path.basename(file);
+}
+
+async function storeAsset(incoming, assetPath) {
+  try {
+    await fs.link(incoming, assetPath);
+  } catch (error) {
+    if (error.code === "EEXIST") return;
+    // Filesystems without hard links.
+    await fs.copyFile(incoming, assetPath);
+  }
+}
+
+async function processUpload({ path: incoming, assetDir }) {
+  const buffer = await fs.readFile(incoming);
+  const hash = crypto.createHash("sha256").update(buffer).digest("hex");
+  const mimeType = sniff(buffer);
+  validate(buffer, mimeType);
+
+  await fs.mkdir(assetDir, { recursive: true });
+  const assetPath = path.join(assetDir, hash);
+  let text = null;
+  let pages = null;
+  if (mimeType === "application/pdf") {
+    text = extractPdfText(buffer).slice(0, MAX_TEXT_LENGTH);
+    pages = countPdfPages(buffer);
+    await fs.writeFile(`${assetPath}.txt`, text);
+  }
+  const thumb = await thumbnail(buffer, mimeType, `${assetPath}.thumb.webp`);
+
+  // Content-addressed: an identical file uploaded twice is stored once. The
+  // incoming file is left for the pipeline to remove once the result is
+  // journaled, so a crash here can simply run the job again.
+  await storeAsset(incoming, assetPath);
+  return { hash, mimeType, size: buffer.length, pages, textLength: text?.length ?? 0, thumbnail: thumb };
+}
+
+parentPort.on("message", async (task) => {
+  try {
+    const result = await processUpload(task);
+    parentPort.postMessage({ jobId: task.jobId, ok: true, result });
+  } catch (error) {
+    parentPort.postMessage({ jobId: task.jobId, ok: false, error: error.message });
+  }
+});
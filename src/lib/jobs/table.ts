@@ -0,0 +1,89 @@
+import fs from "node:fs/promises";
+import path from "node:path";
+
+import type { JobResult, JobStatus, JobView } from "@/lib/uploads";
+
+export type Job = JobView & {
+  priority: number;
+  path: string;
+  size: number;
+  createdAt: number;
+};
+
+// Compaction kicks in once the journal holds this many rows and more than
+// twice as many rows as there are jobs.
+const COMPACT_MIN_ROWS = 1000;
+
+// Append-only journal of job rows. The last row for an id wins on replay,
+// and the file is compacted to one row per job on load and whenever it has
+// grown well past the job count.
+export class JobTable {
+  private jobs = new Map<string, Job>();
+  private writes: Promise<unknown> = Promise.resolve();
+  private rows = 0;
+
+  constructor(private readonly file: string) {}
+
+  async load() {
+    let text = "";
+    try {
+      text = await fs.readFile(this.file, "utf8");
+    } catch {
+      // First run.
+    }
+    for (const line of text.split("\n")) {
+      if (!line) continue;
+      try {
+        const job = JSON.parse(line) as Job;
+        this.jobs.set(job.id, job);
+      } catch {
+        // Torn final line from a crash mid-append.
+      }
+    }
+    await fs.mkdir(path.dirname(this.file), { recursive: true });
+    this.rows = this.jobs.size;
+    await this.compact();
+    return [...this.jobs.values()];
+  }
+
+  get(id: string) {
+    return this.jobs.get(id);
+  }
+
+  insert(job: Job) {
+    this.jobs.set(job.id, job);
+    return this.append(job);
+  }
+
+  update(id: string, changes: { status: JobStatus; result?: JobResult; error?: string }) {
+    const job = this.jobs.get(id);
+    if (!job) return Promise.resolve();
+    Object.assign(job, changes, { updatedAt: Date.now() });
+    return this.append(job);
+  }
+
+  private append(job: Job) {
+    const line = `${JSON.stringify(job)}\n`;
+    let write = () => fs.appendFile(this.file, line);
+    this.rows += 1;
+    if (this.rows > Math.max(COMPACT_MIN_ROWS, this.jobs.size * 2)) {
+      // The in-memory table already holds this row, so the compaction writes it.
+      this.rows = this.jobs.size;
+      write = () => this.compact();
+    }
+    this.writes = this.writes.catch(() => {}).then(write);
+    return this.writes;
+  }
+
+  // Rewrites the journal as one row per job, via a rename so a crash leaves
+  // either the old journal or the new one.
+  private async compact() {
+    const rows = [...this.jobs.values()].map((job) => JSON.stringify(job));
+    await fs.writeFile(`${this.file}.tmp`, rows.length ? `${rows.join("\n")}\n` : "");
+    await fs.rename(`${this.file}.tmp`, this.file);
+  }
+}
+
+export function toView({ id, kind, status, fileName, category, result, error, updatedAt }: Job): JobView {
+  return { id, kind, status, fileName, category, result, error, updatedAt };
+}
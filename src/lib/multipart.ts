@@ -0,0 +1,125 @@
+// Streaming multipart/form-data reader. Parts are yielded in order and a
+// part's body is read straight from the request as it is consumed, so a file
+// field never has to fit in memory. Like readTar, each part must be read (or
+// skipped) before the next one is produced.
+
+export class MultipartError extends Error {}
+
+export type MultipartPart = {
+  name: string;
+  filename: string | null;
+  contentType: string | null;
+  chunks(): AsyncGenerator<Uint8Array>;
+};
+
+const CRLF = Buffer.from("\r\n");
+const HEADER_END = Buffer.from("\r\n\r\n");
+const FINAL = Buffer.from("--");
+
+export function multipartBoundary(contentType: string | null) {
+  const match = /^multipart\/form-data\s*;.*\bboundary=(?:"([^"]+)"|([^\s;]+))/i.exec(contentType ?? "");
+  return match ? (match[1] ?? match[2]) : null;
+}
+
+class Scanner {
+  private buffered = Buffer.alloc(0);
+
+  constructor(private reader: ReadableStreamDefaultReader<Uint8Array>) {}
+
+  private async fill() {
+    const { value, done } = await this.reader.read();
+    if (done) throw new MultipartError("Unexpected end of multipart body");
+    const chunk = Buffer.from(value.buffer, value.byteOffset, value.byteLength);
+    this.buffered = this.buffered.length ? Buffer.concat([this.buffered, chunk]) : chunk;
+  }
+
+  async take(length: number) {
+    while (this.buffered.length < length) await this.fill();
+    const out = this.buffered.subarray(0, length);
+    this.buffered = this.buffered.subarray(length);
+    return out;
+  }
+
+  // Bytes up to `pattern`, which is consumed. Fails past `limit` bytes.
+  async until(pattern: Buffer, limit: number) {
+    for (;;) {
+      const at = this.buffered.indexOf(pattern);
+      if (at !== -1) {
+        const out = this.buffered.subarray(0, at);
+        this.buffered = this.buffered.subarray(at + pattern.length);
+        return out;
+      }
+      if (this.buffered.length > limit + pattern.length) throw new MultipartError("Multipart headers too large");
+      await this.fill();
+    }
+  }
+
+  // Streams bytes up to `pattern`, holding back only a tail that could be
+  // the start of it.
+  async *streamUntil(pattern: Buffer) {
+    for (;;) {
+      const at = this.buffered.indexOf(pattern);
+      if (at !== -1) {
+        if (at > 0) yield this.buffered.subarray(0, at);
+        this.buffered = this.buffered.subarray(at + pattern.length);
+        return;
+      }
+      const safe = this.buffered.length - (pattern.length - 1);
+      if (safe > 0) {
+        yield this.buffered.subarray(0, safe);
+        this.buffered = this.buffered.subarray(safe);
+      }
+      await this.fill();
+    }
+  }
+}
+
+function parseHeaders(block: string) {
+  const headers = new Map<string, string>();
+  for (const line of block.split("\r\n")) {
+    const colon = line.indexOf(":");
+    if (colon > 0) headers.set(line.slice(0, colon).trim().toLowerCase(), line.slice(colon + 1).trim());
+  }
+  const disposition = headers.get("content-disposition") ?? "";
+  const param = (key: string) =>
+    new RegExp(`;\\s*${key}="((?:\\\\.|[^"\\\\])*)"`, "i").exec(disposition)?.[1].replace(/\\(.)/g, "$1") ?? null;
+  const name = param("name");
+  if (!/^form-data\b/i.test(disposition) || name === null) {
+    throw new MultipartError("Multipart part without a form-data name");
+  }
+  return { name, filename: param("filename"), contentType: headers.get("content-type") ?? null };
+}
+
+export async function* readMultipart(
+  stream: ReadableStream<Uint8Array>,
+  boundary: string,
+  maxHeaderBytes = 16 * 1024,
+): AsyncGenerator<MultipartPart> {
+  const scanner = new Scanner(stream.getReader());
+  const delimiter = Buffer.from(`\r\n--${boundary}`);
+  // The first boundary has no leading CRLF; anything before it is preamble.
+  await scanner.until(delimiter.subarray(2), maxHeaderBytes);
+  for (;;) {
+    const after = await scanner.take(2);
+    if (after.equals(FINAL)) return;
+    if (!after.equals(CRLF)) throw new MultipartError("Malformed multipart boundary");
+    // Headers end at the first empty line; a part may have none at all.
+    const head = (await scanner.until(HEADER_END, maxHeaderBytes)).toString("utf8");
+    const { name, filename, contentType } = parseHeaders(head);
+
+    let started = false;
+    const body = scanner.streamUntil(delimiter);
+    yield {
+      name,
+      filename,
+      contentType,
+      chunks() {
+        if (started) throw new MultipartError(`Part "${name}" was already read`);
+        started = true;
+        return body;
+      },
+    };
+    // Skip whatever the caller didn't read.
+    for await (const chunk of body) void chunk;
+  }
+}
@@ -0,0 +1,175 @@
+// Minimal PDF text extraction without a PDF library. It inflates FlateDecode
+// streams, resolves each font's ToUnicode CMap, and collects the strings
+// shown by Tj/TJ/'/" operators. Good enough for search indexing; not a
+// faithful layout-preserving extractor. Scanned (image-only) PDFs yield "".
+import zlib from "node:zlib";
+
+const OBJECT = /(\d+)\s+\d+\s+obj\b/g;
+const TOKEN = /\/[^\s/<>[\]()]+|\((?:\\[\s\S]|[^\\)])*\)|<[0-9a-fA-F\s]*>|-?(?:\d+\.?\d*|\.\d+)|[A-Za-z'"*]+|\[|\]/g;
+const BREAK_OPERATORS = new Set(["T*", "ET"]);
+const SHOW_OPERATORS = new Set(["Tj", "TJ", "'", "\""]);
+
+function readObjects(buffer) {
+  const latin1 = buffer.toString("latin1");
+  const objects = new Map();
+  let match;
+  OBJECT.lastIndex = 0;
+  while ((match = OBJECT.exec(latin1))) {
+    const bodyStart = match.index + match[0].length;
+    const bodyEnd = latin1.indexOf("endobj", bodyStart);
+    if (bodyEnd === -1) break;
+    const body = latin1.slice(bodyStart, bodyEnd);
+    OBJECT.lastIndex = bodyEnd;
+
+    const streamAt = body.search(/stream\r?\n/);
+    const dict = streamAt === -1 ? body : body.slice(0, streamAt);
+    let stream = null;
+    if (streamAt !== -1 && !/\/Subtype\s*\/Image/.test(dict)) {
+      const dataStart = bodyStart + streamAt + body.slice(streamAt).match(/stream\r?\n/)[0].length;
+      const dataEnd = latin1.indexOf("endstream", dataStart);
+      let data = buffer.subarray(dataStart, dataEnd === -1 ? bodyEnd : dataEnd);
+      if (/\/FlateDecode/.test(dict)) {
+        try {
+          data = zlib.inflateSync(data, { finishFlush: zlib.constants.Z_SYNC_FLUSH });
+          stream = data.toString("latin1");
+        } catch {
+          stream = null;
+        }
+      } else if (!/\/Filter/.test(dict)) {
+        stream = data.toString("latin1");
+      }
+    }
+    objects.set(match[1], { dict, stream });
+  }
+  return objects;
+}
+
+function utf16(hex) {
+  let out = "";
+  for (let i = 0; i + 4 <= hex.length; i += 4) out += String.fromCharCode(parseInt(hex.slice(i, i + 4), 16));
+  return out;
+}
+
+function parseCMap(source) {
+  const cmap = new Map();
+  for (const block of source.matchAll(/beginbfchar([\s\S]*?)endbfchar/g)) {
+    for (const [, code, unicode] of block[1].matchAll(/<([0-9a-fA-F]+)>\s*<([0-9a-fA-F]+)>/g)) {
+      cmap.set(parseInt(code, 16), utf16(unicode));
+    }
+  }
+  for (const block of source.matchAll(/beginbfrange([\s\S]*?)endbfrange/g)) {
+    for (const [, lo, hi, unicode] of block[1].matchAll(
+      /<([0-9a-fA-F]+)>\s*<([0-9a-fA-F]+)>\s*<([0-9a-fA-F]+)>/g,
+    )) {
+      const start = parseInt(lo, 16);
+      const end = Math.min(parseInt(hi, 16), start + 0xffff);
+      const base = parseInt(unicode, 16);
+      for (let code = start; code <= end; code++) cmap.set(code, String.fromCharCode(base + code - start));
+    }
+  }
+  return cmap;
+}
+
+// Maps font resource names (/F1, /TT2, ...) to the CMap of the font they
+// refer to. Names are merged across pages, which is fine for the usual
+// writer output where a name means the same font throughout the document.
+function fontCMaps(objects) {
+  const byObject = new Map();
+  for (const [id, { dict }] of objects) {
+    const ref = /\/ToUnicode\s+(\d+)\s+\d+\s+R/.exec(dict);
+    const target = ref && objects.get(ref[1]);
+    if (target?.stream) byObject.set(id, parseCMap(target.stream));
+  }
+  const byName = new Map();
+  for (const { dict } of objects.values()) {
+    const fonts = /\/Font\s*<<([\s\S]*?)>>/.exec(dict);
+    if (!fonts) continue;
+    for (const [, name, id] of fonts[1].matchAll(/\/([^\s/]+)\s+(\d+)\s+\d+\s+R/g)) {
+      if (byObject.has(id)) byName.set(name, byObject.get(id));
+    }
+  }
+  return byName;
+}
+
+function unescapeLiteral(literal) {
+  return literal.slice(1, -1).replace(/\\([nrtbf()\\]|[0-7]{1,3}|\r?\n)/g, (_, c) => {
+    if (/^[0-7]+$/.test(c)) return String.fromCharCode(parseInt(c, 8));
+    return { n: "\n", r: "\r", t: "\t", b: "\b", f: "\f" }[c] ?? (c.trim() ? c : "");
+  });
+}
+
+function hexToBytes(token) {
+  let hex = token.slice(1, -1).replace(/\s+/g, "");
+  if (hex.length % 2) hex += "0";
+  let out = "";
+  for (let i = 0; i < hex.length; i += 2) out += String.fromCharCode(parseInt(hex.slice(i, i + 2), 16));
+  return out;
+}
+
+// Strings are byte sequences; fonts with a CMap use two-byte codes.
+function decodeBytes(bytes, cmap) {
+  if (!cmap || bytes.length % 2) return bytes;
+  let out = "";
+  for (let i = 0; i < bytes.length; i += 2) {
+    out += cmap.get((bytes.charCodeAt(i) << 8) | bytes.charCodeAt(i + 1)) ?? "";
+  }
+  return out;
+}
+
+function textFromContent(content, cmaps) {
+  const out = [];
+  let pending = [];
+  let inArray = false;
+  let cmap = null;
+  let lastName = null;
+  let lastNumber = 0;
+  for (const [token] of content.matchAll(TOKEN)) {
+    const first = token[0];
+    if (first === "/") {
+      lastName = token.slice(1);
+    } else if (first === "(") {
+      pending.push(decodeBytes(unescapeLiteral(token), cmap));
+    } else if (first === "<") {
+      pending.push(decodeBytes(hexToBytes(token), cmap));
+    } else if (token === "[") {
+      inArray = true;
+    } else if (token === "]") {
+      inArray = false;
+    } else if (/^[-\d.]/.test(token)) {
+      // Large negative kerning inside a TJ array is how most writers encode a space.
+      if (inArray && Number(token) < -200) pending.push(" ");
+      lastNumber = Number(token);
+    } else if (SHOW_OPERATORS.has(token)) {
+      out.push(pending.join(""));
+      pending = [];
+    } else {
+      if (token === "Tf") cmap = cmaps.get(lastName) ?? null;
+      // A text move with a vertical offset starts a new line.
+      if (BREAK_OPERATORS.has(token) || ((token === "Td" || token === "TD") && lastNumber !== 0)) {
+        out.push(" ");
+      }
+      if (!inArray) pending = [];
+    }
+  }
+  return out.join("");
+}
+
+export function extractPdfText(buffer) {
+  const objects = readObjects(buffer);
+  const cmaps = fontCMaps(objects);
+  const text = [];
+  for (const { stream } of objects.values()) {
+    if (stream && /\bBT\b/.test(stream) && !stream.includes("begincmap")) {
+      text.push(textFromContent(stream, cmaps));
+    }
+  }
+  return text
+    .join(" ")
+    .replace(/[\u0000-\u001f]/g, "")
+    .replace(/\s+/g, " ")
+    .trim();
+}
+
+export function countPdfPages(buffer) {
+  return (buffer.toString("latin1").match(/\/Type\s*\/Page(?!s)/g) ?? []).length;
+}
@@ -0,0 +1,56 @@
+// "lite" swaps blur and gradient effects for flat equivalents (see the
+// `lite` variant in globals.css). It is chosen before first paint for weak
+// devices, and later if scrolling turns out to be janky.
+export type RenderMode = "full" | "lite";
+
+export const RENDER_MODE_KEY = "portfolio:render-mode";
+
+// Frames slower than this at the 90th percentile while scrolling switch the
+// session to lite mode. 1.5x a 60 Hz frame budget.
+export const JANK_THRESHOLD_MS = 25;
+
+// Runs inline in <head> so the attribute is set before the first paint.
+// Order of precedence: ?render= (used by the frame benchmark), the choice
+// made earlier in this session, then device hints.
+export const RENDER_MODE_SCRIPT = `(function(){try{
+var d=document.documentElement,n=navigator,c=n.connection||{};
+var q=new URLSearchParams(location.search).get("render");
+var m=q==="lite"||q==="full"?q:sessionStorage.getItem("${RENDER_MODE_KEY}");
+if(m!=="lite"&&m!=="full")m=c.saveData||(n.deviceMemory||8)<=2||(n.hardwareConcurrency||8)<=2?"lite":"full";
+d.dataset.render=m;if(q)d.dataset.renderForced="";
+}catch(e){}})();`;
+
+export function currentRenderMode(): RenderMode {
+  return document.documentElement.dataset.render === "lite" ? "lite" : "full";
+}
+
+export function setRenderMode(mode: RenderMode) {
+  document.documentElement.dataset.render = mode;
+  try {
+    sessionStorage.setItem(RENDER_MODE_KEY, mode);
+  } catch {
+    // Storage can be unavailable (private mode); the switch still applies to this page.
+  }
+}
+
+// Collects requestAnimationFrame deltas until `frames` have been seen.
+export function sampleFrames(frames: number): Promise<number[]> {
+  return new Promise((resolve) => {
+    const deltas: number[] = [];
+    let last = performance.now();
+    const tick = (now: number) => {
+      deltas.push(now - last);
+      last = now;
+      if (deltas.length < frames) requestAnimationFrame(tick);
+      else resolve(deltas);
+    };
+    requestAnimationFrame(tick);
+  });
+}
+
+// Nearest-rank, matching the telemetry dashboard.
+export function percentile(values: number[], p: number) {
+  if (values.length === 0) return 0;
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(Math.max(Math.ceil((p / 100) * sorted.length) - 1, 0), sorted.length - 1)];
+}
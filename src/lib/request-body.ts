@@ -0,0 +1,22 @@
+// Reads a request body as text, giving up once it passes `maxBytes`. The
+// declared Content-Length is checked first, but chunked bodies have none,
+// so the stream is counted too. Returns null when the body is too large.
+export async function readBoundedText(request: Request, maxBytes: number) {
+  if (Number(request.headers.get("content-length") ?? 0) > maxBytes) return null;
+  if (!request.body) return "";
+  const reader = request.body.getReader();
+  const decoder = new TextDecoder();
+  let text = "";
+  let bytes = 0;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    bytes += value.byteLength;
+    if (bytes > maxBytes) {
+      await reader.cancel();
+      return null;
+    }
+    text += decoder.decode(value, { stream: true });
+  }
+  return text + decoder.decode();
+}
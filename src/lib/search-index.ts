@@ -0,0 +1,147 @@
+import crypto from "node:crypto";
+import fs from "node:fs/promises";
+import path from "node:path";
+
+import { normalizeText, tokenize } from "@/lib/search-text.mjs";
+
+// Built by scripts/search-index.mjs before every build and dev server.
+// Under .next/cache/ because `next build` clears the rest of .next/.
+const INDEX_DIR = path.join(process.cwd(), ".next", "cache", "search");
+const CACHE_SIZE = Number(process.env.MATCH_CACHE_SIZE) || 500;
+export const MAX_QUERY_LENGTH = 20_000;
+
+type IndexedDoc = {
+  kind: "resume" | "project";
+  id: number;
+  title: string;
+  category?: string;
+  url?: string;
+  length: number;
+};
+
+type SearchIndex = {
+  version: number;
+  tenant: string;
+  hash: string;
+  k1: number;
+  b: number;
+  avgLength: number;
+  docs: IndexedDoc[];
+  idf: Record<string, number>;
+  postings: Record<string, [doc: number, tf: number][]>;
+};
+
+export type MatchResult = Omit<IndexedDoc, "length"> & {
+  score: number;
+  matchedTerms: string[];
+};
+
+export type MatchResponse = {
+  resumes: MatchResult[];
+  projects: MatchResult[];
+  cached: boolean;
+  tookMs: number;
+};
+
+type Loaded = { mtimeMs: number; index: SearchIndex };
+type Ranked = Pick<MatchResponse, "resumes" | "projects">;
+
+const globalForSearch = globalThis as unknown as {
+  searchIndexes?: Map<string, Loaded>;
+  matchCache?: Map<string, Ranked>;
+};
+const indexes = (globalForSearch.searchIndexes ??= new Map());
+// Insertion order doubles as recency order, so the first key is the LRU one.
+const results = (globalForSearch.matchCache ??= new Map());
+
+async function loadIndex(tenant: string): Promise<SearchIndex | null> {
+  const file = path.join(INDEX_DIR, `${tenant}.json`);
+  let stat;
+  try {
+    stat = await fs.stat(file);
+  } catch {
+    return null;
+  }
+  const loaded = indexes.get(tenant);
+  if (loaded && loaded.mtimeMs === stat.mtimeMs) return loaded.index;
+  const index = JSON.parse(await fs.readFile(file, "utf8")) as SearchIndex;
+  indexes.set(tenant, { mtimeMs: stat.mtimeMs, index });
+  return index;
+}
+
+function cacheGet(key: string) {
+  const hit = results.get(key);
+  if (hit) {
+    results.delete(key);
+    results.set(key, hit);
+  }
+  return hit;
+}
+
+function cacheSet(key: string, value: Ranked) {
+  results.set(key, value);
+  while (results.size > CACHE_SIZE) results.delete(results.keys().next().value!);
+}
+
+function rank(index: SearchIndex, text: string, limit: number): Ranked {
+  const query = new Map<string, number>();
+  for (const term of tokenize(text)) {
+    // Own keys only: the parsed index is a plain object, and words like
+    // "constructor" would otherwise hit Object.prototype.
+    if (Object.hasOwn(index.idf, term)) query.set(term, (query.get(term) ?? 0) + 1);
+  }
+
+  const scores = new Map<number, { score: number; terms: string[] }>();
+  for (const [term, qtf] of query) {
+    const idf = index.idf[term];
+    for (const [doc, tf] of index.postings[term]) {
+      const norm = 1 - index.b + (index.b * index.docs[doc].length) / index.avgLength;
+      // A term repeated in the job description matters more, with diminishing returns.
+      const weight = idf * ((tf * (index.k1 + 1)) / (tf + index.k1 * norm)) * (1 + Math.log(qtf));
+      const entry = scores.get(doc) ?? { score: 0, terms: [] };
+      entry.score += weight;
+      entry.terms.push(term);
+      scores.set(doc, entry);
+    }
+  }
+
+  const ranked: Ranked = { resumes: [], projects: [] };
+  for (const [doc, { score, terms }] of [...scores].sort((a, b) => b[1].score - a[1].score)) {
+    const { kind, id, title, category, url } = index.docs[doc];
+    const list = kind === "resume" ? ranked.resumes : ranked.projects;
+    if (list.length >= limit) continue;
+    list.push({
+      kind,
+      id,
+      title,
+      category,
+      url,
+      score: Math.round(score * 1000) / 1000,
+      matchedTerms: terms.sort((a, b) => index.idf[b] - index.idf[a]).slice(0, 8),
+    });
+  }
+  return ranked;
+}
+
+// Returns null when the tenant has no index (unknown tenant, or the build
+// step hasn't run).
+export async function matchJobDescription(
+  tenant: string,
+  text: string,
+  limit = 5,
+): Promise<MatchResponse | null> {
+  const started = performance.now();
+  const index = await loadIndex(tenant);
+  if (!index) return null;
+
+  // Keyed by the index hash too, so a rebuilt index never serves stale rankings.
+  const digest = crypto.createHash("sha256").update(normalizeText(text)).digest("hex");
+  const key = `${index.hash}:${limit}:${digest}`;
+  let ranked = cacheGet(key);
+  const cached = ranked !== undefined;
+  if (!ranked) {
+    ranked = rank(index, text, limit);
+    cacheSet(key, ranked);
+  }
+  return { ...ranked, cached, tookMs: Math.round((performance.now() - started) * 100) / 100 };
+}
@@ -0,0 +1,51 @@
+// Tokenizer shared by the build-time index (scripts/search-index.mjs) and
+// the query side (src/lib/search-index.ts). Both must agree exactly, or
+// query terms won't line up with indexed ones.
+
+const STOPWORDS = new Set(
+  (
+    "a about above after all also an and any are as at be been being both but by can could did do does " +
+    "for from had has have having he her here his how i if in into is it its just me more most my no nor " +
+    "not of on once only or other our out over own same she should so some such than that the their them " +
+    "then there these they this those through to too under until up very was we were what when where " +
+    "which while who whom why will with would you your ability able candidate experience etc including " +
+    "strong work working role team using use used well within across"
+  ).split(" "),
+);
+
+// Terms whose punctuation is meaningful and would be destroyed by splitting.
+const KEEP = /(?<![\w.])(c\+\+|c#|\.net|node\.js|next\.js|power\s?bi|scikit-learn|a\/b)(?![\w+#])/g;
+
+// Collapses the spelling variants that matter for job descriptions: plurals
+// and -ing/-ed forms. Deliberately far weaker than Porter so short technical
+// terms (pandas, keras, aws) survive intact.
+function stem(term) {
+  if (term.length <= 4 || /\d/.test(term)) return term;
+  if (term.endsWith("ies")) return `${term.slice(0, -3)}y`;
+  if (term.endsWith("ing") && term.length > 6) return term.slice(0, -3);
+  if (term.endsWith("ed") && term.length > 5) return term.slice(0, -2);
+  if (term.endsWith("s") && !term.endsWith("ss") && !term.endsWith("us") && !term.endsWith("is")) {
+    return term.slice(0, -1);
+  }
+  return term;
+}
+
+export function normalizeText(text) {
+  return text.normalize("NFKC").toLowerCase().replace(/\s+/g, " ").trim();
+}
+
+export function tokenize(text) {
+  const normalized = normalizeText(text);
+  const tokens = [];
+  const rest = normalized.replace(KEEP, (term) => {
+    tokens.push(term.replace(/\s/g, ""));
+    return " ";
+  });
+  for (const word of rest.split(/[^\p{L}\p{N}]+/u)) {
+    if (word.length < 2 || STOPWORDS.has(word)) continue;
+    tokens.push(stem(word));
+  }
+  return tokens;
+}
+
+export const BM25 = { k1: 1.2, b: 0.75 };
@@ -0,0 +1,164 @@
+import crypto from "node:crypto";
+
+import { patchKey, type ContentPatch, type VersionedPatch } from "@/lib/content-sync";
+
+const LOG_SIZE = Number(process.env.SYNC_LOG_SIZE ?? 1000);
+const COALESCE_MS = Number(process.env.SYNC_COALESCE_MS ?? 50);
+const CLIENT_BUFFER_BYTES = Number(process.env.SYNC_CLIENT_BUFFER_BYTES ?? 256 * 1024);
+const HEARTBEAT_MS = 25_000;
+
+const encoder = new TextEncoder();
+
+type Client = {
+  controller: ReadableStreamDefaultController<Uint8Array>;
+};
+
+type Channel = {
+  tenant: string;
+  version: number;
+  // Last LOG_SIZE patches, oldest first, for clients resuming after a drop.
+  log: VersionedPatch[];
+  pending: Map<string, ContentPatch>;
+  timer: NodeJS.Timeout | null;
+  clients: Set<Client>;
+};
+
+// Folds a burst of changes to one record into the single change a client
+// needs to end up in the same state.
+function coalesce(previous: ContentPatch | undefined, next: ContentPatch): ContentPatch | null {
+  if (!previous) return next;
+  if (previous.op === "add") {
+    if (next.op === "delete") return null;
+    return { ...next, op: "add" } as ContentPatch;
+  }
+  return next;
+}
+
+function frame(patches: VersionedPatch[], epoch: string) {
+  const id = `${epoch}:${patches[patches.length - 1].version}`;
+  return encoder.encode(`id: ${id}\nevent: patch\ndata: ${JSON.stringify(patches)}\n\n`);
+}
+
+// Tells a client that patches it needs have left the log. Its id moves the
+// client's cursor to the present, so a reconnect doesn't ask again.
+function resetFrame(version: number, epoch: string) {
+  return encoder.encode(`id: ${epoch}:${version}\nevent: reset\ndata: ${version}\n\n`);
+}
+
+class Broadcaster {
+  readonly epoch = crypto.randomBytes(4).toString("hex");
+  private channels = new Map<string, Channel>();
+  private heartbeat: NodeJS.Timeout;
+
+  constructor() {
+    this.heartbeat = setInterval(() => {
+      for (const channel of this.channels.values()) {
+        for (const client of channel.clients) this.send(channel, client, encoder.encode(": ping\n\n"));
+      }
+    }, HEARTBEAT_MS);
+    this.heartbeat.unref();
+  }
+
+  private channel(tenant: string) {
+    let channel = this.channels.get(tenant);
+    if (!channel) {
+      channel = { tenant, version: 0, log: [], pending: new Map(), timer: null, clients: new Set() };
+      this.channels.set(tenant, channel);
+    }
+    return channel;
+  }
+
+  private removeClient(channel: Channel, client: Client) {
+    channel.clients.delete(client);
+    // A channel nothing was published to only holds its clients.
+    if (channel.clients.size === 0 && channel.log.length === 0 && !channel.timer) {
+      this.channels.delete(channel.tenant);
+    }
+  }
+
+  // Patches published within COALESCE_MS of each other go out as one event,
+  // with at most one patch per record.
+  publish(tenant: string, patches: ContentPatch[]) {
+    const channel = this.channel(tenant);
+    for (const patch of patches) {
+      const key = patchKey(patch);
+      const merged = coalesce(channel.pending.get(key), patch);
+      if (merged) channel.pending.set(key, merged);
+      else channel.pending.delete(key);
+    }
+    channel.timer ??= setTimeout(() => this.flush(channel), COALESCE_MS);
+  }
+
+  private flush(channel: Channel) {
+    channel.timer = null;
+    if (channel.pending.size === 0) return;
+    const batch = [...channel.pending.values()].map(
+      (patch) => ({ ...patch, version: ++channel.version }) as VersionedPatch,
+    );
+    channel.pending.clear();
+    channel.log.push(...batch);
+    if (channel.log.length > LOG_SIZE) channel.log.splice(0, channel.log.length - LOG_SIZE);
+
+    const chunk = frame(batch, this.epoch);
+    for (const client of channel.clients) this.send(channel, client, chunk);
+  }
+
+  // A client whose unread backlog passes CLIENT_BUFFER_BYTES is dropped
+  // rather than buffered without bound. EventSource reconnects on its own
+  // and resumes from its last event id. If the log has moved past that id
+  // in the meantime, the client is sent a reset instead.
+  private send(channel: Channel, client: Client, chunk: Uint8Array) {
+    try {
+      if ((client.controller.desiredSize ?? 0) < -CLIENT_BUFFER_BYTES) {
+        // error() rather than close() so the queued backlog is released now.
+        client.controller.error(new Error("SSE client fell too far behind"));
+        this.removeClient(channel, client);
+        return;
+      }
+      client.controller.enqueue(chunk);
+    } catch {
+      this.removeClient(channel, client);
+    }
+  }
+
+  // Opens an SSE stream. Patches newer than `since` are replayed first; a
+  // cursor from another epoch replays everything still in the log. When some
+  // of those patches have already been trimmed from the log, nothing is
+  // replayed and the client gets a reset event instead.
+  subscribe(tenant: string, since: { epoch: string; version: number } | null, signal: AbortSignal) {
+    const channel = this.channel(tenant);
+    const after = since?.epoch === this.epoch ? since.version : 0;
+    let client: Client;
+    return new ReadableStream<Uint8Array>(
+      {
+        start: (controller) => {
+          client = { controller };
+          controller.enqueue(encoder.encode("retry: 3000\n\n"));
+          const oldest = channel.log[0]?.version ?? channel.version + 1;
+          if (after < oldest - 1) {
+            controller.enqueue(resetFrame(channel.version, this.epoch));
+          } else {
+            const missed = channel.log.filter((patch) => patch.version > after);
+            if (missed.length) controller.enqueue(frame(missed, this.epoch));
+          }
+          channel.clients.add(client);
+          signal.addEventListener("abort", () => {
+            this.removeClient(channel, client);
+            try {
+              controller.close();
+            } catch {
+              // Already errored after falling too far behind.
+            }
+          });
+        },
+        cancel: () => {
+          this.removeClient(channel, client);
+        },
+      },
+      { highWaterMark: 0, size: (chunk) => chunk.byteLength },
+    );
+  }
+}
+
+const globalForSync = globalThis as unknown as { contentBroadcaster?: Broadcaster };
+export const contentBroadcaster = (globalForSync.contentBroadcaster ??= new Broadcaster());
@@ -0,0 +1,157 @@
+import fs from "node:fs/promises";
+import path from "node:path";
+
+import { dataPath } from "@/lib/data-dir";
+import { TELEMETRY_METRICS, type TelemetryRow } from "@/lib/telemetry";
+
+const WINDOW_MS = 15 * 60_000;
+const MAX_SAMPLES_PER_METRIC = 10_000;
+const MAX_ROWS_PER_BATCH = 100;
+const RECENT_ROWS = 50;
+const MAX_TEXT_LENGTH = 300;
+// The endpoint is public, so each client gets a row budget per minute and the
+// log a byte budget per day. Rows past either are dropped.
+const CLIENT_WINDOW_MS = 60_000;
+const MAX_ROWS_PER_CLIENT = 300;
+const MAX_CLIENTS = 10_000;
+const MAX_DAY_BYTES = Number(process.env.TELEMETRY_MAX_DAY_BYTES) || 20 * 1024 * 1024;
+const RETENTION_DAYS = Number(process.env.TELEMETRY_RETENTION_DAYS) || 14;
+
+export type MetricSummary = {
+  name: string;
+  count: number;
+  p50: number;
+  p75: number;
+  p95: number;
+  p99: number;
+};
+
+type Sample = { value: number; ts: number };
+
+function percentile(sortedValues: number[], p: number) {
+  if (sortedValues.length === 0) return 0;
+  const rank = Math.ceil((p / 100) * sortedValues.length) - 1;
+  return sortedValues[Math.min(Math.max(rank, 0), sortedValues.length - 1)];
+}
+
+function isShortText(value: unknown): value is string {
+  return typeof value === "string" && value.length <= MAX_TEXT_LENGTH;
+}
+
+function isRow(value: unknown): value is TelemetryRow {
+  const row = value as TelemetryRow;
+  return (
+    typeof row === "object" &&
+    row !== null &&
+    (TELEMETRY_METRICS as readonly string[]).includes(row.name) &&
+    Number.isFinite(row.value) &&
+    Number.isFinite(row.ts) &&
+    isShortText(row.page) &&
+    (row.detail === undefined || isShortText(row.detail))
+  );
+}
+
+class TelemetryStore {
+  private samples = new Map<string, Sample[]>();
+  private recent: TelemetryRow[] = [];
+  private clients = new Map<string, number>();
+  private clientWindowStart = 0;
+  private day = "";
+  private dayBytes = 0;
+
+  // Rows `client` may still send in the current minute, after taking `wanted`.
+  private take(client: string, wanted: number, now: number) {
+    if (now - this.clientWindowStart >= CLIENT_WINDOW_MS) {
+      this.clients.clear();
+      this.clientWindowStart = now;
+    }
+    // Past this many distinct clients in one window, they share one budget.
+    const key = this.clients.has(client) || this.clients.size < MAX_CLIENTS ? client : "";
+    const used = this.clients.get(key) ?? 0;
+    const granted = Math.max(0, Math.min(wanted, MAX_ROWS_PER_CLIENT - used));
+    this.clients.set(key, used + granted);
+    return granted;
+  }
+
+  async ingest(payload: unknown, client = "") {
+    const rows = (payload as { rows?: unknown[] })?.rows;
+    if (!Array.isArray(rows)) return 0;
+    const now = Date.now();
+    // Only the known fields are kept; anything else in a row is dropped.
+    const valid = rows
+      .slice(0, MAX_ROWS_PER_BATCH)
+      .filter(isRow)
+      .map(({ name, value, page, ts, detail }) => ({ name, value, page, ts, detail }));
+    const accepted = valid.slice(0, this.take(client, valid.length, now));
+
+    for (const row of accepted) {
+      const samples = this.samples.get(row.name) ?? [];
+      // Client clocks are not trusted for windowing.
+      samples.push({ value: row.value, ts: now });
+      if (samples.length > MAX_SAMPLES_PER_METRIC) samples.splice(0, samples.length - MAX_SAMPLES_PER_METRIC);
+      this.samples.set(row.name, samples);
+    }
+    this.recent = [...accepted].reverse().concat(this.recent).slice(0, RECENT_ROWS);
+
+    if (accepted.length > 0) await this.persist(accepted);
+    return accepted.length;
+  }
+
+  summary(now = Date.now()): MetricSummary[] {
+    const cutoff = now - WINDOW_MS;
+    const result: MetricSummary[] = [];
+    for (const name of TELEMETRY_METRICS) {
+      const samples = this.samples.get(name);
+      if (!samples) continue;
+      const firstInWindow = samples.findIndex((s) => s.ts >= cutoff);
+      samples.splice(0, firstInWindow === -1 ? samples.length : firstInWindow);
+      if (samples.length === 0) continue;
+      const values = samples.map((s) => s.value).sort((a, b) => a - b);
+      result.push({
+        name,
+        count: values.length,
+        p50: percentile(values, 50),
+        p75: percentile(values, 75),
+        p95: percentile(values, 95),
+        p99: percentile(values, 99),
+      });
+    }
+    return result;
+  }
+
+  recentRows() {
+    return this.recent;
+  }
+
+  private async persist(rows: TelemetryRow[]) {
+    const day = new Date().toISOString().slice(0, 10);
+    const file = dataPath("telemetry", `${day}.ndjson`);
+    if (day !== this.day) {
+      await fs.mkdir(dataPath("telemetry"), { recursive: true });
+      await this.dropExpired(day);
+      this.day = day;
+      this.dayBytes = (await fs.stat(file).catch(() => null))?.size ?? 0;
+    }
+    const lines = rows.map((row) => JSON.stringify(row)).join("\n") + "\n";
+    const bytes = Buffer.byteLength(lines);
+    if (this.dayBytes + bytes > MAX_DAY_BYTES) return;
+    this.dayBytes += bytes;
+    await fs.appendFile(file, lines);
+  }
+
+  // Day files older than RETENTION_DAYS. Their names sort by date.
+  private async dropExpired(today: string) {
+    const cutoff = new Date(Date.parse(today) - RETENTION_DAYS * 86_400_000).toISOString().slice(0, 10);
+    for (const name of await fs.readdir(dataPath("telemetry"))) {
+      if (/^\d{4}-\d{2}-\d{2}\.ndjson$/.test(name) && name < `${cutoff}.ndjson`) {
+        await fs.rm(path.join(dataPath("telemetry"), name), { force: true });
+      }
+    }
+  }
+}
+
+export const TELEMETRY_WINDOW_MS = WINDOW_MS;
+
+// Survives module reloads in development.
+const globalForTelemetry = globalThis as unknown as { telemetryStore?: TelemetryStore };
+export const telemetryStore = (globalForTelemetry.telemetryStore ??= new TelemetryStore());
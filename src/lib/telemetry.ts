@@ -0,0 +1,89 @@
+export type TelemetryRow = {
+  name: string;
+  value: number;
+  page: string;
+  ts: number;
+  detail?: string;
+};
+
+export const TELEMETRY_METRICS = [
+  "TTFB",
+  "FCP",
+  "LCP",
+  "CLS",
+  "INP",
+  "long-task",
+  "pdf-open",
+  "upload-throughput",
+  "frame-time",
+] as const;
+
+const ENDPOINT = "/api/telemetry";
+const SAMPLE_RATE = Number(process.env.NEXT_PUBLIC_TELEMETRY_SAMPLE_RATE ?? "0.1");
+const SAMPLE_KEY = "telemetry-sampled";
+const MAX_BATCH = 20;
+const FLUSH_DELAY_MS = 10_000;
+
+let sampled: boolean | null = null;
+let queue: TelemetryRow[] = [];
+let timer: ReturnType<typeof setTimeout> | null = null;
+
+// The decision is made once per session so a visitor's rows are either all
+// reported or not at all, which keeps percentiles unbiased.
+export function isSampled() {
+  if (sampled !== null) return sampled;
+  try {
+    const stored = window.sessionStorage.getItem(SAMPLE_KEY);
+    sampled = stored !== null ? stored === "1" : Math.random() < SAMPLE_RATE;
+    window.sessionStorage.setItem(SAMPLE_KEY, sampled ? "1" : "0");
+  } catch {
+    sampled = Math.random() < SAMPLE_RATE;
+  }
+  return sampled;
+}
+
+export function record(name: (typeof TELEMETRY_METRICS)[number], value: number, detail?: string) {
+  if (typeof window === "undefined" || !Number.isFinite(value) || !isSampled()) return;
+  queue.push({ name, value, page: window.location.pathname, ts: Date.now(), detail });
+  if (queue.length >= MAX_BATCH) {
+    flush();
+  } else if (!timer) {
+    timer = setTimeout(flush, FLUSH_DELAY_MS);
+  }
+}
+
+export function flush() {
+  if (timer) {
+    clearTimeout(timer);
+    timer = null;
+  }
+  if (queue.length === 0) return;
+  const body = JSON.stringify({ rows: queue });
+  queue = [];
+  const blob = new Blob([body], { type: "application/json" });
+  if (!navigator.sendBeacon?.(ENDPOINT, blob)) {
+    void fetch(ENDPOINT, { method: "POST", body, keepalive: true }).catch(() => {});
+  }
+}
+
+// Opens a PDF in a new tab. For sampled sessions the same URL is requested
+// with a one-byte range so the time to first byte can be measured; the new
+// tab's own timeline is not observable from here.
+export function openPdf(url: string) {
+  window.open(url, "_blank");
+  if (!isSampled() || url.startsWith("blob:")) return;
+  const start = performance.now();
+  fetch(url, { headers: { Range: "bytes=0-0" } })
+    .then((res) => {
+      record("pdf-open", performance.now() - start, url);
+      return res.body?.cancel();
+    })
+    .catch(() => {});
+}
+
+// `ms` must cover the upload request itself, from sending the body to the
+// response headers; local processing before the request doesn't count.
+export function recordUploadThroughput(bytes: number, ms: number, detail?: string) {
+  if (bytes === 0) return;
+  record("upload-throughput", (bytes / Math.max(ms, 1)) * 1000, detail ?? `${bytes} bytes`);
+}
@@ -0,0 +1,137 @@
+export type UploadKind = "project" | "certificate";
+
+export type PreparedUpload = {
+  file: File;
+  mimeType: string;
+  hash: string;
+  originalSize: number;
+};
+
+export type UploadRejection = {
+  name: string;
+  reason: string;
+};
+
+export type PreprocessResult = {
+  accepted: PreparedUpload[];
+  rejected: UploadRejection[];
+  duplicates: string[];
+};
+
+export const UPLOAD_LIMITS: Record<UploadKind, { maxBytes: number; mimeTypes: string[] }> = {
+  certificate: {
+    maxBytes: 10 * 1024 * 1024,
+    mimeTypes: ["application/pdf", "image/png", "image/jpeg", "image/webp"],
+  },
+  project: {
+    maxBytes: 25 * 1024 * 1024,
+    mimeTypes: [
+      "application/pdf",
+      "application/zip",
+      "text/plain",
+      "image/png",
+      "image/jpeg",
+      "image/gif",
+      "image/webp",
+    ],
+  },
+};
+
+export type WorkerRequest = {
+  id: number;
+  kind: UploadKind;
+  files: File[];
+  knownHashes: string[];
+};
+
+export type WorkerResponse = {
+  id: number;
+  accepted: { blob: Blob; name: string; mimeType: string; hash: string; originalSize: number }[];
+  rejected: UploadRejection[];
+  duplicates: string[];
+  // Set when the whole batch failed, e.g. crypto.subtle is unavailable
+  // because the page isn't served from a secure origin.
+  error?: string;
+};
+
+// Generous: a large drop of images is decoded and re-encoded one by one.
+const PREPROCESS_TIMEOUT_MS = 120_000;
+
+type Pending = {
+  resolve: (response: WorkerResponse) => void;
+  reject: (error: Error) => void;
+  timer: ReturnType<typeof setTimeout>;
+};
+
+let worker: Worker | null = null;
+let nextId = 0;
+const pending = new Map<number, Pending>();
+
+// Fails every outstanding request and drops the worker; the next call
+// starts a fresh one.
+function failAll(message: string) {
+  worker?.terminate();
+  worker = null;
+  for (const request of pending.values()) {
+    clearTimeout(request.timer);
+    request.reject(new Error(message));
+  }
+  pending.clear();
+}
+
+function getWorker() {
+  if (!worker) {
+    worker = new Worker(new URL("./upload-preprocess.worker.ts", import.meta.url));
+    worker.onmessage = (event: MessageEvent<WorkerResponse>) => {
+      const request = pending.get(event.data.id);
+      if (!request) return;
+      pending.delete(event.data.id);
+      clearTimeout(request.timer);
+      if (event.data.error) request.reject(new Error(event.data.error));
+      else request.resolve(event.data);
+    };
+    worker.onerror = (event) => {
+      event.preventDefault();
+      failAll(event.message || "Upload preprocessing failed");
+    };
+    worker.onmessageerror = () => failAll("Upload preprocessing returned an unreadable result");
+  }
+  return worker;
+}
+
+// Sniffs, size-checks, recompresses and hashes files off the main thread.
+// Files whose hash is already in `knownHashes` (or repeated in the same drop)
+// are reported as duplicates instead of being returned. Rejects when the
+// worker fails or doesn't answer within PREPROCESS_TIMEOUT_MS.
+export function preprocessUploads(
+  files: File[],
+  kind: UploadKind,
+  knownHashes: Iterable<string> = [],
+): Promise<PreprocessResult> {
+  const id = nextId++;
+  return new Promise((resolve, reject) => {
+    const resolveResponse = (response: WorkerResponse) =>
+      resolve({
+        accepted: response.accepted.map((item) => ({
+          file: new File([item.blob], item.name, { type: item.mimeType }),
+          mimeType: item.mimeType,
+          hash: item.hash,
+          originalSize: item.originalSize,
+        })),
+        rejected: response.rejected,
+        duplicates: response.duplicates,
+      });
+    const timer = setTimeout(() => failAll("Upload preprocessing timed out"), PREPROCESS_TIMEOUT_MS);
+    pending.set(id, { resolve: resolveResponse, reject, timer });
+    const request: WorkerRequest = { id, kind, files, knownHashes: [...knownHashes] };
+    getWorker().postMessage(request);
+  });
+}
+
+export function describeSkipped({ rejected, duplicates }: PreprocessResult) {
+  const lines = [
+    ...rejected.map((r) => `${r.name}: ${r.reason}`),
+    ...duplicates.map((name) => `${name}: already uploaded`),
+  ];
+  return lines.length > 0 ? `Some files were skipped:\n${lines.join("\n")}` : null;
+}
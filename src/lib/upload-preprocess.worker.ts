@@ -0,0 +1,121 @@
+import {
+  UPLOAD_LIMITS,
+  type UploadRejection,
+  type WorkerRequest,
+  type WorkerResponse,
+} from "./upload-preprocess";
+
+const MAX_IMAGE_DIMENSION = 2000;
+const IMAGE_QUALITY = 0.85;
+const SNIFF_BYTES = 512;
+
+function startsWith(bytes: Uint8Array, signature: number[], offset = 0) {
+  return signature.every((b, i) => bytes[offset + i] === b);
+}
+
+// Identifies a file from its leading bytes; the browser-supplied `type` is
+// derived from the extension and can't be trusted.
+function sniff(bytes: Uint8Array) {
+  if (startsWith(bytes, [0x25, 0x50, 0x44, 0x46, 0x2d])) return "application/pdf";
+  if (startsWith(bytes, [0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a])) return "image/png";
+  if (startsWith(bytes, [0xff, 0xd8, 0xff])) return "image/jpeg";
+  if (startsWith(bytes, [0x47, 0x49, 0x46, 0x38])) return "image/gif";
+  if (startsWith(bytes, [0x52, 0x49, 0x46, 0x46]) && startsWith(bytes, [0x57, 0x45, 0x42, 0x50], 8)) {
+    return "image/webp";
+  }
+  if (startsWith(bytes, [0x50, 0x4b, 0x03, 0x04])) return "application/zip";
+  if (bytes.length > 0 && !bytes.includes(0)) {
+    try {
+      new TextDecoder("utf-8", { fatal: true }).decode(bytes.subarray(0, bytes.length - 4));
+      return "text/plain";
+    } catch {
+      return null;
+    }
+  }
+  return null;
+}
+
+async function sha256(buffer: ArrayBuffer) {
+  // Only exposed to secure contexts (https or localhost).
+  if (!crypto.subtle) throw new Error("File hashing needs the page to be served over https");
+  const digest = await crypto.subtle.digest("SHA-256", buffer);
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, "0")).join("");
+}
+
+// Downscales still images to MAX_IMAGE_DIMENSION and re-encodes them as WebP,
+// keeping the original when re-encoding doesn't make it smaller.
+async function recompress(file: File, mimeType: string) {
+  if (mimeType === "image/gif" || typeof OffscreenCanvas === "undefined") return null;
+  const bitmap = await createImageBitmap(file);
+  const scale = Math.min(1, MAX_IMAGE_DIMENSION / Math.max(bitmap.width, bitmap.height));
+  const canvas = new OffscreenCanvas(Math.round(bitmap.width * scale), Math.round(bitmap.height * scale));
+  canvas.getContext("2d")?.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+  bitmap.close();
+  const blob = await canvas.convertToBlob({ type: "image/webp", quality: IMAGE_QUALITY });
+  return blob.size < file.size ? blob : null;
+}
+
+function webpName(name: string) {
+  return name.replace(/\.[^.]+$/, "") + ".webp";
+}
+
+async function preprocess({ id, kind, files, knownHashes }: WorkerRequest) {
+  const limits = UPLOAD_LIMITS[kind];
+  const seen = new Set(knownHashes);
+  const response: WorkerResponse = { id, accepted: [], rejected: [], duplicates: [] };
+  const reject = (name: string, reason: string) => response.rejected.push({ name, reason } satisfies UploadRejection);
+
+  for (const file of files) {
+    if (file.size > limits.maxBytes) {
+      reject(file.name, `larger than ${limits.maxBytes / 1024 / 1024} MB`);
+      continue;
+    }
+
+    const head = new Uint8Array(await file.slice(0, SNIFF_BYTES).arrayBuffer());
+    const mimeType = sniff(head);
+    if (!mimeType || !limits.mimeTypes.includes(mimeType)) {
+      reject(file.name, `unsupported file type${mimeType ? ` (${mimeType})` : ""}`);
+      continue;
+    }
+
+    // Hash the original bytes so re-uploading the same scan is detected even
+    // though the recompressed output isn't byte-stable across browsers.
+    const hash = await sha256(await file.arrayBuffer());
+    if (seen.has(hash)) {
+      response.duplicates.push(file.name);
+      continue;
+    }
+    seen.add(hash);
+
+    let blob: Blob = file;
+    let name = file.name;
+    let type = mimeType;
+    if (mimeType.startsWith("image/")) {
+      try {
+        const smaller = await recompress(file, mimeType);
+        if (smaller) {
+          blob = smaller;
+          name = webpName(file.name);
+          type = "image/webp";
+        }
+      } catch {
+        // Undecodable image data: upload the original untouched.
+      }
+    }
+
+    response.accepted.push({ blob, name, mimeType: type, hash, originalSize: file.size });
+  }
+  return response;
+}
+
+// Errors are answered per request; an unhandled rejection in here would
+// leave the caller waiting for its timeout.
+self.onmessage = async (event: MessageEvent<WorkerRequest>) => {
+  const { id } = event.data;
+  try {
+    self.postMessage(await preprocess(event.data));
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    self.postMessage({ id, accepted: [], rejected: [], duplicates: [], error: message } satisfies WorkerResponse);
+  }
+};
@@ -0,0 +1,74 @@
+import { adminToken } from "@/lib/content-sync";
+import { recordUploadThroughput } from "@/lib/telemetry";
+
+export type JobKind = "resume" | "project" | "certificate";
+
+export type JobStatus = "queued" | "running" | "done" | "failed";
+
+export type JobResult = {
+  hash: string;
+  mimeType: string;
+  size: number;
+  pages: number | null;
+  textLength: number;
+  thumbnail: string | null;
+};
+
+export type JobView = {
+  id: string;
+  kind: JobKind;
+  status: JobStatus;
+  fileName: string;
+  category?: string;
+  result?: JobResult;
+  error?: string;
+  updatedAt: number;
+};
+
+export const JOB_KINDS: readonly JobKind[] = ["resume", "project", "certificate"];
+
+export function isTerminal(status: JobStatus | undefined) {
+  return status === "done" || status === "failed";
+}
+
+export class UploadRejectedError extends Error {
+  constructor(
+    message: string,
+    readonly retryAfter: number | null,
+  ) {
+    super(message);
+  }
+}
+
+export async function submitUploads(kind: JobKind, files: File[], category?: string): Promise<JobView[]> {
+  const body = new FormData();
+  body.set("kind", kind);
+  if (category) body.set("category", category);
+  for (const file of files) body.append("file", file);
+
+  const start = performance.now();
+  const token = adminToken();
+  const res = await fetch("/api/uploads", {
+    method: "POST",
+    headers: token ? { authorization: `Bearer ${token}` } : {},
+    body,
+  });
+  if (!res.ok) {
+    const retryAfter = res.headers.get("Retry-After");
+    throw new UploadRejectedError(await res.text(), retryAfter ? Number(retryAfter) : null);
+  }
+  recordUploadThroughput(
+    files.reduce((sum, file) => sum + file.size, 0),
+    performance.now() - start,
+    category ? `${kind}:${category}` : kind,
+  );
+  return (await res.json()).jobs;
+}
+
+export async function fetchJobs(ids: string[]): Promise<JobView[]> {
+  const res = await fetch(`/api/uploads/jobs?ids=${encodeURIComponent(ids.join(","))}`, {
+    cache: "no-store",
+  });
+  if (!res.ok) throw new Error(`Job status request failed: ${res.status}`);
+  return (await res.json()).jobs;
+}
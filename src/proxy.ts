@@ -0,0 +1,25 @@
+import { NextResponse, type NextRequest } from "next/server";
+
+import { TENANT_PATTERN } from "@/lib/content";
+
+// Tenants are served from /t/<tenant>. When TENANT_ROOT_DOMAIN is set,
+// <tenant>.<root domain> is rewritten to the same path so each candidate can
+// also get their own subdomain.
+const ROOT_DOMAIN = process.env.TENANT_ROOT_DOMAIN;
+
+export function proxy(request: NextRequest) {
+  if (!ROOT_DOMAIN) return NextResponse.next();
+  const host = (request.headers.get("host") ?? "").split(":")[0];
+  if (!host.endsWith(`.${ROOT_DOMAIN}`)) return NextResponse.next();
+
+  const tenant = host.slice(0, -ROOT_DOMAIN.length - 1);
+  if (tenant === "www" || !TENANT_PATTERN.test(tenant)) return NextResponse.next();
+
+  const url = request.nextUrl.clone();
+  url.pathname = `/t/${tenant}${url.pathname === "/" ? "" : url.pathname}`;
+  return NextResponse.rewrite(url);
+}
+
+export const config = {
+  matcher: ["/((?!api|_next|t/|tenants/|.*\\.[^/]+$).*)"],
+};